@@ -0,0 +1,251 @@
+<?php
+
+namespace App\Http\Controllers;
+
+use App\Models\AAB_Category;
+use App\Models\AAB_Event;
+use App\Models\AAB_Registration;
+use App\Models\User;
+use Illuminate\Http\Request;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\Hash;
+use Illuminate\Support\Str;
+
+/**
+ * Test-only data seeding API used by the Selenium suite.
+ * Routes are registered only when TEST_DATA_API=true outside production,
+ * and every request must carry TEST_DATA_TOKEN. Cleanup only deletes rows
+ * created by seed(), identified by the signed receipts seed() returns.
+ */
+class AAB_TestDataController extends Controller
+{
+    /**
+     * Email domain of seeded accounts; cleanup never deletes other users.
+     */
+    private const SEED_EMAIL_DOMAIN = '@selenium.test';
+
+    /**
+     * Seed categories, events, users and registrations in one transaction.
+     * Every item carries a client-side "key" that the response maps to the created id;
+     * "owned" lists a receipt per created row, to be passed back to cleanup().
+     */
+    public function seed(Request $request)
+    {
+        $this->authorizeToken($request);
+
+        $data = $request->validate([
+            'categories' => 'array',
+            'categories.*.key' => 'required|string',
+            'categories.*.name' => 'required|string|max:255',
+            'users' => 'array',
+            'users.*.key' => 'required|string',
+            'users.*.name' => 'required|string|max:255',
+            'users.*.email' => 'required|email|ends_with:' . self::SEED_EMAIL_DOMAIN . '|unique:users,email',
+            'users.*.password' => 'required|string|min:6',
+            'events' => 'array',
+            'events.*.key' => 'required|string',
+            'events.*.title' => 'required|string|max:255',
+            'events.*.description' => 'nullable|string',
+            'events.*.category' => 'nullable|string',
+            'events.*.place' => 'nullable|string|max:255',
+            'events.*.price' => 'nullable|numeric|min:0',
+            'events.*.capacity' => 'nullable|integer|min:0',
+            'events.*.start_in_days' => 'nullable|integer',
+            'events.*.duration_days' => 'nullable|integer|min:0',
+            'events.*.status' => 'nullable|in:active,archived',
+            'events.*.registered' => 'nullable|integer|min:0',
+            'registrations' => 'array',
+            'registrations.*.event' => 'required|string',
+            'registrations.*.user' => 'required|string',
+        ]);
+
+        $created = DB::transaction(function () use ($data) {
+            $ids = ['categories' => [], 'users' => [], 'events' => [], 'registrations' => 0];
+            $owned = ['categories' => [], 'users' => [], 'events' => []];
+
+            foreach ($data['categories'] ?? [] as $category) {
+                $ids['categories'][$category['key']] = AAB_Category::create(['name' => $category['name']])->id;
+            }
+            $owned['categories'] = array_values($ids['categories']);
+
+            foreach ($data['users'] ?? [] as $user) {
+                $model = User::create([
+                    'name' => $user['name'],
+                    'email' => $user['email'],
+                    'password' => Hash::make($user['password']),
+                    'role' => 'user',
+                ]);
+                $model->assignRole('user');
+                $ids['users'][$user['key']] = $model->id;
+            }
+            $owned['users'] = array_values($ids['users']);
+
+            $creator = User::where('role', 'admin')->value('id') ?? User::value('id');
+            $defaultCategory = AAB_Category::value('id');
+            foreach ($data['events'] ?? [] as $event) {
+                $start = now()->addDays($event['start_in_days'] ?? 30)->startOfHour();
+                $price = $event['price'] ?? 0;
+                $model = AAB_Event::create([
+                    'title' => $event['title'],
+                    'description' => $event['description'] ?? 'Seeded by the Selenium test suite.',
+                    'start_date' => $start,
+                    'end_date' => $start->copy()->addDays($event['duration_days'] ?? 0)->addHours(2),
+                    'place' => $event['place'] ?? 'Test Hall',
+                    'price' => $price,
+                    'is_free' => $price == 0,
+                    'category_id' => isset($event['category'])
+                        ? ($ids['categories'][$event['category']] ?? AAB_Category::where('name', $event['category'])->value('id'))
+                        : $defaultCategory,
+                    'capacity' => $event['capacity'] ?? 100,
+                    'created_by' => $creator,
+                    'status' => $event['status'] ?? 'active',
+                ]);
+                $ids['events'][$event['key']] = $model->id;
+
+                // Fill places with placeholder users through bulk inserts
+                if (!empty($event['registered'])) {
+                    $fillers = $this->insertFillerUsers($event['registered']);
+                    $owned['users'] = array_merge($owned['users'], $fillers);
+                    $ids['registrations'] += $this->insertRegistrations($model->id, $fillers);
+                }
+            }
+            $owned['events'] = array_values($ids['events']);
+
+            foreach ($data['registrations'] ?? [] as $registration) {
+                $userId = $ids['users'][$registration['user']]
+                    ?? User::where('email', $registration['user'])->value('id');
+                $eventId = $ids['events'][$registration['event']] ?? null;
+                abort_if(!$userId || !$eventId, 422, 'Unknown user or event in registrations.');
+                $ids['registrations'] += $this->insertRegistrations($eventId, [$userId]);
+            }
+
+            foreach ($owned as $kind => $rows) {
+                $owned[$kind] = array_map(fn ($id) => $this->receipt($kind, $id), $rows);
+            }
+
+            return ['ids' => $ids, 'owned' => $owned];
+        });
+
+        return response()->json($created, 201);
+    }
+
+    /**
+     * Delete seeded rows (registrations go with their events and users).
+     * Only rows with a valid receipt from seed() are deleted, and users only
+     * within the seed email domain.
+     */
+    public function cleanup(Request $request)
+    {
+        $this->authorizeToken($request);
+
+        $data = $request->validate([
+            'events' => 'array',
+            'events.*' => 'string',
+            'users' => 'array',
+            'users.*' => 'string',
+            'categories' => 'array',
+            'categories.*' => 'string',
+        ]);
+        $events = $this->receiptIds('events', $data['events'] ?? []);
+        $users = $this->receiptIds('users', $data['users'] ?? []);
+        $categories = $this->receiptIds('categories', $data['categories'] ?? []);
+
+        $deleted = DB::transaction(function () use ($events, $users, $categories) {
+            $users = User::whereIn('id', $users)
+                ->where('role', 'user')
+                ->where('email', 'like', '%' . self::SEED_EMAIL_DOMAIN)
+                ->pluck('id')
+                ->all();
+            AAB_Registration::whereIn('event_id', $events)->orWhereIn('user_id', $users)->delete();
+            return [
+                'events' => AAB_Event::whereIn('id', $events)->delete(),
+                'users' => User::whereIn('id', $users)->delete(),
+                'categories' => AAB_Category::whereIn('id', $categories)->delete(),
+            ];
+        });
+
+        return response()->json($deleted);
+    }
+
+    /**
+     * Reject requests without the configured token; the API is unusable
+     * until TEST_DATA_TOKEN is set.
+     */
+    private function authorizeToken(Request $request): void
+    {
+        $token = (string) config('app.test_data_token');
+        abort_if(!$token || !hash_equals($token, (string) $request->header('X-Test-Data-Token')), 403);
+    }
+
+    /**
+     * Sign the id of a seeded row, so cleanup() cannot be used on other rows.
+     */
+    private function receipt(string $kind, int $id): string
+    {
+        return $id . '.' . hash_hmac('sha256', "{$kind}:{$id}", (string) config('app.test_data_token'));
+    }
+
+    /**
+     * Check receipts of seeded rows and return their ids.
+     */
+    private function receiptIds(string $kind, array $receipts): array
+    {
+        $ids = [];
+        foreach ($receipts as $receipt) {
+            $id = strstr($receipt, '.', true);
+            abort_unless(
+                $id !== false && ctype_digit($id) && hash_equals($this->receipt($kind, (int) $id), $receipt),
+                403,
+                "Not a seeded row: {$kind} {$receipt}"
+            );
+            $ids[] = (int) $id;
+        }
+
+        return $ids;
+    }
+
+    /**
+     * Insert placeholder users in one statement and return their ids.
+     */
+    private function insertFillerUsers(int $count): array
+    {
+        $batch = Str::lower(Str::random(12));
+        $password = Hash::make(Str::random(16));
+        $now = now();
+        $rows = [];
+        for ($i = 0; $i < $count; $i++) {
+            $rows[] = [
+                'name' => "Seed User {$i}",
+                'email' => "seed_{$batch}_{$i}" . self::SEED_EMAIL_DOMAIN,
+                'password' => $password,
+                'role' => 'user',
+                'created_at' => $now,
+                'updated_at' => $now,
+            ];
+        }
+        foreach (array_chunk($rows, 500) as $chunk) {
+            User::insert($chunk);
+        }
+
+        return User::where('email', 'like', "seed_{$batch}_%")->pluck('id')->all();
+    }
+
+    /**
+     * Register users to an event in one statement.
+     */
+    private function insertRegistrations(int $eventId, array $userIds): int
+    {
+        $now = now();
+        $rows = array_map(fn ($userId) => [
+            'user_id' => $userId,
+            'event_id' => $eventId,
+            'created_at' => $now,
+            'updated_at' => $now,
+        ], $userIds);
+        foreach (array_chunk($rows, 500) as $chunk) {
+            AAB_Registration::insert($chunk);
+        }
+
+        return count($rows);
+    }
+}
@@ -123,4 +123,21 @@
         'store' => env('APP_MAINTENANCE_STORE', 'database'),
     ],
 
+    /*
+    |--------------------------------------------------------------------------
+    | Test Data API
+    |--------------------------------------------------------------------------
+    |
+    | Enables the /__test/seed and /__test/cleanup endpoints the Selenium
+    | suite uses to create the events and registrations each test needs.
+    | They are never registered in production. Requests must send the token
+    | in the X-Test-Data-Token header; without a token every request is
+    | rejected.
+    |
+    */
+
+    'test_data_api' => (bool) env('TEST_DATA_API', false),
+
+    'test_data_token' => env('TEST_DATA_TOKEN'),
+
 ];
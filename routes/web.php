@@ -7,6 +7,8 @@
 use App\Http\Controllers\AAB_RegistrationController;
 use App\Http\Controllers\AAB_AuthController;
 use App\Http\Controllers\AAB_ProfileController;
+use App\Http\Controllers\AAB_TestDataController;
+use Illuminate\Foundation\Http\Middleware\ValidateCsrfToken;
 
 /*
 |--------------------------------------------------------------------------
@@ -103,3 +105,16 @@
     Route::put('/users/{user}', [App\Http\Controllers\AAB_UserController::class, 'update'])->name('admin.users.update');
     Route::delete('/users/{user}', [App\Http\Controllers\AAB_UserController::class, 'destroy'])->name('admin.users.destroy');
 });
+
+/*
+|--------------------------------------------------------------------------
+| Test Data Routes (TEST_DATA_API=true, never in production)
+|--------------------------------------------------------------------------
+*/
+
+if (config('app.test_data_api') && !app()->isProduction()) {
+    Route::prefix('__test')->withoutMiddleware([ValidateCsrfToken::class])->group(function () {
+        Route::post('/seed', [AAB_TestDataController::class, 'seed'])->name('testdata.seed');
+        Route::post('/cleanup', [AAB_TestDataController::class, 'cleanup'])->name('testdata.cleanup');
+    });
+}
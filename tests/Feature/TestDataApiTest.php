@@ -0,0 +1,161 @@
+<?php
+
+namespace Tests\Feature;
+
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Tests\TestCase;
+use App\Models\User;
+use App\Models\AAB_Event;
+use App\Models\AAB_Category;
+use App\Models\AAB_Registration;
+use Spatie\Permission\Models\Role;
+
+/**
+ * Integration Tests for the Test Data API used by the Selenium suite
+ * 
+ * Test Level: Integration
+ * Test Type: Functional
+ * Technique: Use Case Testing
+ * 
+ * Related Test Cases: TC-EVT-030, TC-REG-001, TC-REG-004 (seeded preconditions)
+ */
+class TestDataApiTest extends TestCase
+{
+    use RefreshDatabase;
+
+    /**
+     * Header authorizing test data requests
+     */
+    private const TOKEN_HEADER = ['X-Test-Data-Token' => 'secret'];
+
+    protected function setUp(): void
+    {
+        parent::setUp();
+        
+        // Create roles
+        Role::findOrCreate('admin', 'web');
+        Role::findOrCreate('user', 'web');
+        
+        // Create admin as event owner
+        $admin = User::factory()->create(['role' => 'admin']);
+        $admin->assignRole('admin');
+
+        config(['app.test_data_token' => 'secret']);
+    }
+
+    /**
+     * Seed a category, an event filled with registrations and a registered user
+     * 
+     * @test
+     */
+    public function test_seed_creates_requested_rows(): void
+    {
+        // Act
+        $response = $this->postJson('/__test/seed', [
+            'categories' => [['key' => 'c1', 'name' => 'Seeded Category']],
+            'users' => [['key' => 'u1', 'name' => 'Seeded', 'email' => 'seeded@selenium.test', 'password' => 'password123']],
+            'events' => [['key' => 'e1', 'title' => 'Seeded Event', 'category' => 'c1', 'capacity' => 5, 'registered' => 4]],
+            'registrations' => [['user' => 'u1', 'event' => 'e1']],
+        ], self::TOKEN_HEADER);
+
+        // Assert
+        $response->assertStatus(201);
+        $eventId = $response->json('ids.events.e1');
+        $event = AAB_Event::findOrFail($eventId);
+        $this->assertEquals('Seeded Event', $event->title);
+        $this->assertEquals($response->json('ids.categories.c1'), $event->category_id);
+        $this->assertEquals(5, AAB_Registration::where('event_id', $eventId)->count());
+        $this->assertTrue($event->isFull());
+        $this->assertCount(5, $response->json('owned.users'));
+    }
+
+    /**
+     * Cleanup removes seeded rows and their registrations
+     * 
+     * @test
+     */
+    public function test_cleanup_deletes_seeded_rows(): void
+    {
+        // Arrange
+        $owned = $this->postJson('/__test/seed', [
+            'categories' => [['key' => 'c1', 'name' => 'Seeded Category']],
+            'events' => [['key' => 'e1', 'title' => 'Seeded Event', 'category' => 'c1', 'registered' => 3]],
+        ], self::TOKEN_HEADER)->json('owned');
+
+        // Act
+        $response = $this->postJson('/__test/cleanup', $owned, self::TOKEN_HEADER);
+
+        // Assert
+        $response->assertOk();
+        $this->assertDatabaseMissing('aab_events', ['title' => 'Seeded Event']);
+        $this->assertDatabaseMissing('aab_categories', ['name' => 'Seeded Category']);
+        $this->assertEquals(0, AAB_Registration::count());
+        $this->assertEquals(1, User::count());
+    }
+
+    /**
+     * Requests without the configured token are rejected
+     * 
+     * @test
+     */
+    public function test_seed_requires_configured_token(): void
+    {
+        // Act & Assert
+        $this->postJson('/__test/seed', ['categories' => [['key' => 'c1', 'name' => 'X']]])
+            ->assertForbidden();
+        $this->postJson('/__test/seed', ['categories' => [['key' => 'c1', 'name' => 'X']]], self::TOKEN_HEADER)
+            ->assertStatus(201);
+        $this->assertEquals(1, AAB_Category::where('name', 'X')->count());
+    }
+
+    /**
+     * Without a configured token the API rejects every request
+     * 
+     * @test
+     */
+    public function test_api_is_closed_without_token(): void
+    {
+        // Arrange
+        config(['app.test_data_token' => null]);
+
+        // Act & Assert
+        $this->postJson('/__test/seed', ['categories' => [['key' => 'c1', 'name' => 'X']]])
+            ->assertForbidden();
+        $this->postJson('/__test/seed', ['categories' => [['key' => 'c1', 'name' => 'X']]], ['X-Test-Data-Token' => ''])
+            ->assertForbidden();
+        $this->assertEquals(0, AAB_Category::count());
+    }
+
+    /**
+     * Cleanup refuses rows that were not created by the seed endpoint
+     * 
+     * @test
+     */
+    public function test_cleanup_rejects_rows_not_seeded(): void
+    {
+        // Arrange
+        $admin = User::where('role', 'admin')->firstOrFail();
+        $forged = $admin->id . '.' . str_repeat('0', 64);
+
+        // Act & Assert
+        $this->postJson('/__test/cleanup', ['users' => [(string) $admin->id]], self::TOKEN_HEADER)
+            ->assertForbidden();
+        $this->postJson('/__test/cleanup', ['users' => [$forged]], self::TOKEN_HEADER)
+            ->assertForbidden();
+        $this->assertDatabaseHas('users', ['id' => $admin->id]);
+    }
+
+    /**
+     * Seeded accounts must use the seed email domain
+     * 
+     * @test
+     */
+    public function test_seed_rejects_users_outside_seed_domain(): void
+    {
+        // Act & Assert
+        $this->postJson('/__test/seed', [
+            'users' => [['key' => 'u1', 'name' => 'Real', 'email' => 'real@example.com', 'password' => 'password123']],
+        ], self::TOKEN_HEADER)->assertStatus(422);
+        $this->assertDatabaseMissing('users', ['email' => 'real@example.com']);
+    }
+}
@@ -0,0 +1 @@
+# Load test package - asyncio load generator reusing the page object locators
@@ -0,0 +1,9 @@
+"""
+Entry point: python -m loadtest (run from tests/Selenium).
+"""
+
+import sys
+
+from loadtest.loadRunner import main
+
+sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Latency recording for the load generator.
+Keeps one HDR histogram per endpoint so tail percentiles stay exact to three
+significant digits at any request volume.
+"""
+
+import time
+
+from hdrh.histogram import HdrHistogram
+
+
+class LatencyRecorder:
+    """
+    Per-endpoint latency histograms, status codes and error counts.
+    """
+
+    # Histogram range in microseconds (1 us to 60 s, 3 significant digits)
+    LOWEST = 1
+    HIGHEST = 60_000_000
+    SIGNIFICANT_DIGITS = 3
+
+    # Percentiles printed in the report
+    PERCENTILES = (50, 90, 95, 99, 99.9)
+
+    def __init__(self):
+        """
+        Initialize an empty recorder.
+        """
+        self.histograms = {}
+        self.statuses = {}
+        self.errors = {}
+        self.started = time.monotonic()
+        self.finished = None
+
+    def _histogram(self, endpoint):
+        if endpoint not in self.histograms:
+            self.histograms[endpoint] = HdrHistogram(self.LOWEST, self.HIGHEST, self.SIGNIFICANT_DIGITS)
+        return self.histograms[endpoint]
+
+    def record(self, endpoint, seconds, status):
+        """
+        Record one completed request.
+
+        Args:
+            endpoint: Endpoint key such as "GET /events/{id}"
+            seconds: Response time in seconds
+            status: HTTP status code
+        """
+        micros = min(max(int(seconds * 1_000_000), self.LOWEST), self.HIGHEST)
+        self._histogram(endpoint).record_value(micros)
+        counts = self.statuses.setdefault(endpoint, {})
+        counts[status] = counts.get(status, 0) + 1
+
+    def record_error(self, endpoint, error):
+        """
+        Record a request that failed without a response (timeout, reset...).
+
+        Args:
+            endpoint: Endpoint key
+            error: Exception raised by the client
+        """
+        counts = self.errors.setdefault(endpoint, {})
+        name = type(error).__name__
+        counts[name] = counts.get(name, 0) + 1
+
+    def stop(self):
+        """
+        Freeze the elapsed time used for throughput.
+        """
+        self.finished = time.monotonic()
+
+    def summary(self):
+        """
+        Build the per-endpoint report.
+
+        Returns:
+            dict: endpoint -> count, rps, percentiles (ms), max, statuses, errors
+        """
+        elapsed = max((self.finished or time.monotonic()) - self.started, 1e-9)
+        report = {}
+        for endpoint in sorted(set(self.histograms) | set(self.errors)):
+            histogram = self.histograms.get(endpoint)
+            count = histogram.get_total_count() if histogram else 0
+            row = {
+                "count": count,
+                "rps": round(count / elapsed, 2),
+                "statuses": {str(code): total for code, total in sorted(self.statuses.get(endpoint, {}).items())},
+                "errors": self.errors.get(endpoint, {}),
+            }
+            if count:
+                row["mean_ms"] = round(histogram.get_mean_value() / 1000, 2)
+                for percentile in self.PERCENTILES:
+                    row[f"p{percentile:g}_ms"] = round(histogram.get_value_at_percentile(percentile) / 1000, 2)
+                row["max_ms"] = round(histogram.get_max_value() / 1000, 2)
+            report[endpoint] = row
+        return report
+
+    def format(self):
+        """
+        Format the summary as a text table.
+
+        Returns:
+            str: One line per endpoint
+        """
+        columns = [f"p{percentile:g}" for percentile in self.PERCENTILES]
+        lines = ["{:<36} {:>8} {:>8} ".format("endpoint", "count", "rps")
+                 + " ".join(f"{column:>9}" for column in columns + ["max"]) + "  errors/non-2xx"]
+        for endpoint, row in self.summary().items():
+            values = [row.get(f"{column}_ms") for column in columns + ["max"]]
+            failures = sum(row["errors"].values()) + sum(
+                total for code, total in row["statuses"].items() if int(code) >= 400
+            )
+            lines.append(
+                f"{endpoint:<36} {row['count']:>8} {row['rps']:>8.1f} "
+                + " ".join(f"{value:>7.1f}ms" if value is not None else f"{'-':>9}" for value in values)
+                + f"  {failures}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,94 @@
+"""
+Ramp profiles for the load generator.
+A profile is a list of stages; each stage moves the number of concurrent
+virtual users linearly to a target over a duration.
+"""
+
+import re
+
+
+class RampProfile:
+    """
+    Piecewise-linear concurrency profile.
+    """
+
+    # Named profiles, scaled by the peak user count: (duration s, fraction of peak)
+    PRESETS = {
+        "smoke": [(10, 0.05), (20, 0.05), (5, 0)],
+        "ramp": [(60, 1.0), (120, 1.0), (30, 0)],
+        "step": [(30, 0.25), (30, 0.25), (30, 0.5), (30, 0.5), (30, 1.0), (60, 1.0), (15, 0)],
+        "spike": [(10, 0.1), (30, 0.1), (5, 1.0), (30, 1.0), (5, 0.1), (30, 0.1), (5, 0)],
+        "soak": [(60, 1.0), (1800, 1.0), (60, 0)],
+    }
+
+    # Stage syntax for custom profiles, e.g. "30s:50,2m:200,30s:0"
+    STAGE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)(s|m)?\s*:\s*(\d+)\s*$")
+
+    def __init__(self, stages):
+        """
+        Initialize the profile.
+
+        Args:
+            stages: List of (duration seconds, target users) tuples
+        """
+        if not stages:
+            raise ValueError("A ramp profile needs at least one stage")
+        self.stages = [(float(duration), int(target)) for duration, target in stages]
+
+    @classmethod
+    def parse(cls, spec, peak_users=100):
+        """
+        Build a profile from a preset name or a stage list.
+
+        Args:
+            spec: Preset name (smoke, ramp, step, spike, soak) or "30s:50,2m:200,30s:0"
+            peak_users: Peak user count applied to presets
+
+        Returns:
+            RampProfile: The parsed profile
+        """
+        if spec in cls.PRESETS:
+            return cls([(duration, round(fraction * peak_users))
+                        for duration, fraction in cls.PRESETS[spec]])
+
+        stages = []
+        for part in spec.split(","):
+            match = cls.STAGE_PATTERN.match(part)
+            if not match:
+                raise ValueError(f"Invalid ramp stage '{part}', expected e.g. '30s:50'")
+            duration = float(match.group(1)) * (60 if match.group(2) == "m" else 1)
+            stages.append((duration, int(match.group(3))))
+        return cls(stages)
+
+    @property
+    def duration(self):
+        """
+        Total duration of the profile in seconds.
+        """
+        return sum(duration for duration, _ in self.stages)
+
+    @property
+    def peak(self):
+        """
+        Highest user count reached by the profile.
+        """
+        return max(target for _, target in self.stages)
+
+    def users_at(self, elapsed):
+        """
+        Number of virtual users that should be active at a point in time.
+
+        Args:
+            elapsed: Seconds since the start of the run
+
+        Returns:
+            int: Target concurrency (0 after the last stage)
+        """
+        start_users = 0
+        for duration, target in self.stages:
+            if elapsed < duration:
+                fraction = elapsed / duration if duration else 1.0
+                return round(start_users + (target - start_users) * fraction)
+            elapsed -= duration
+            start_users = target
+        return 0
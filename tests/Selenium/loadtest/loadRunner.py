@@ -0,0 +1,212 @@
+"""
+Asyncio load generator for the AAB EventPlanner routes.
+Starts and stops virtual users following a ramp profile; all users share one
+pooled HTTP transport and report into a per-endpoint HDR latency recorder.
+
+Usage (from tests/Selenium):
+    python -m loadtest --profile ramp --users 200 --journeys browse=3,register=1
+    python -m loadtest --profile "30s:50,2m:300,30s:0" --think 0.5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+
+import httpx
+
+from loadtest.latencyRecorder import LatencyRecorder
+from loadtest.loadProfile import RampProfile
+from loadtest.userJourneys import JOURNEYS, JourneyError, VirtualUser
+from utilities.readProperties import ReadConfig
+from utilities.workerContext import WorkerContext
+
+
+class LoadRunner:
+    """
+    Drives virtual users according to a RampProfile.
+    """
+
+    # Seconds between two adjustments of the number of active users
+    TICK = 0.25
+
+    # Seconds granted to running journeys after the profile ends
+    GRACE_PERIOD = 10
+
+    def __init__(self, base_url, profile, journeys, think_time=1.0,
+                 max_connections=200, timeout=30, accounts=None):
+        """
+        Initialize the runner.
+
+        Args:
+            base_url: Application base URL
+            profile: RampProfile to follow
+            journeys: Dict of journey name -> weight
+            think_time: Mean pause between page views in seconds
+            max_connections: Size of the shared connection pool
+            timeout: Per-request timeout in seconds
+            accounts: Optional list of (email, password) for logged-in journeys
+        """
+        unknown = set(journeys) - set(JOURNEYS)
+        if unknown:
+            raise ValueError(f"Unknown journeys {sorted(unknown)}, expected {sorted(JOURNEYS)}")
+        self.base_url = base_url
+        self.profile = profile
+        self.journeys = journeys
+        self.think_time = think_time
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.accounts = accounts or []
+        self.recorder = LatencyRecorder()
+        self.timeline = []
+
+    async def _user_loop(self, transport, number, stop):
+        """
+        Run journeys for one virtual user until asked to stop.
+        """
+        # The client is never closed: closing it would close the shared transport
+        client = httpx.AsyncClient(transport=transport, timeout=self.timeout, follow_redirects=False)
+        account = self.accounts[number % len(self.accounts)] if self.accounts else None
+        user = VirtualUser(client, self.base_url, self.recorder, number, self.think_time, account)
+        names, weights = list(self.journeys), list(self.journeys.values())
+        while not stop.is_set():
+            name = random.choices(names, weights)[0]
+            started = time.perf_counter()
+            try:
+                await JOURNEYS[name](user)
+            except JourneyError as error:
+                self.recorder.record_error(f"journey {name}", error)
+                user.logged_in = False
+                await user.think()
+                continue
+            self.recorder.record(f"journey {name}", time.perf_counter() - started, 200)
+
+    async def run(self):
+        """
+        Execute the profile.
+
+        Returns:
+            LatencyRecorder: Recorded latencies of the run
+        """
+        limits = httpx.Limits(max_connections=self.max_connections,
+                              max_keepalive_connections=self.max_connections)
+        transport = httpx.AsyncHTTPTransport(limits=limits, retries=0)
+        users = []
+        started = time.monotonic()
+        last_sample = -1
+        try:
+            while True:
+                elapsed = time.monotonic() - started
+                if elapsed >= self.profile.duration:
+                    break
+                target = self.profile.users_at(elapsed)
+                while len(users) < target:
+                    stop = asyncio.Event()
+                    task = asyncio.create_task(self._user_loop(transport, len(users), stop))
+                    users.append((task, stop))
+                while len(users) > target:
+                    task, stop = users.pop()
+                    stop.set()
+                if int(elapsed) != last_sample:
+                    last_sample = int(elapsed)
+                    self.timeline.append((last_sample, len(users)))
+                await asyncio.sleep(self.TICK)
+
+            for _, stop in users:
+                stop.set()
+            pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            if pending:
+                _, still_running = await asyncio.wait(pending, timeout=self.GRACE_PERIOD)
+                for task in still_running:
+                    task.cancel()
+                await asyncio.gather(*still_running, return_exceptions=True)
+        finally:
+            self.recorder.stop()
+            await transport.aclose()
+        return self.recorder
+
+    def report(self):
+        """
+        Build the JSON report of the run.
+
+        Returns:
+            dict: Settings, concurrency timeline and per-endpoint latencies
+        """
+        return {
+            "run": WorkerContext.run_id(),
+            "base_url": self.base_url,
+            "profile": self.profile.stages,
+            "journeys": self.journeys,
+            "think_time": self.think_time,
+            "max_connections": self.max_connections,
+            "timeline": self.timeline,
+            "endpoints": self.recorder.summary(),
+        }
+
+
+def parse_weights(spec):
+    """
+    Parse "browse=3,register=1" into a dict of weights.
+    """
+    weights = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Returns:
+        int: 1 if the error rate exceeded --max-error-rate, else 0
+    """
+    parser = argparse.ArgumentParser(prog="python -m loadtest")
+    parser.add_argument("--base-url", default=None, help="Application base URL (default: config baseUrl)")
+    parser.add_argument("--profile", default="ramp",
+                        help=f"Preset ({', '.join(RampProfile.PRESETS)}) or stages like '30s:50,2m:200,30s:0'")
+    parser.add_argument("--users", type=int, default=100, help="Peak virtual users for presets")
+    parser.add_argument("--journeys", default="browse=3,register=1", help="Journey weights")
+    parser.add_argument("--think", type=float, default=1.0, help="Mean think time between pages (s)")
+    parser.add_argument("--max-connections", type=int, default=200, help="Shared connection pool size")
+    parser.add_argument("--timeout", type=float, default=30, help="Request timeout (s)")
+    parser.add_argument("--account", action="append", default=[], metavar="EMAIL:PASSWORD",
+                        help="Existing account for logged-in journeys (repeatable); "
+                             "accounts are signed up on the fly otherwise")
+    parser.add_argument("--report", default=None, help="JSON report path (default: Logs/loadtest_<run>.json)")
+    parser.add_argument("--max-error-rate", type=float, default=0.01,
+                        help="Fail when more than this fraction of requests errors")
+    args = parser.parse_args(argv)
+
+    runner = LoadRunner(
+        args.base_url or ReadConfig.get_base_url(),
+        RampProfile.parse(args.profile, args.users),
+        parse_weights(args.journeys),
+        think_time=args.think,
+        max_connections=args.max_connections,
+        timeout=args.timeout,
+        accounts=[tuple(account.split(":", 1)) for account in args.account],
+    )
+    print(f"Load test against {runner.base_url}: {runner.profile.peak} users peak, "
+          f"{runner.profile.duration:.0f}s")
+    asyncio.run(runner.run())
+    print(runner.recorder.format())
+
+    report_path = args.report or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), '..', 'Logs', f"loadtest_{WorkerContext.run_id()}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(report_path)), exist_ok=True)
+    with open(report_path, "w", encoding="utf-8") as handle:
+        json.dump(runner.report(), handle, indent=2)
+    print(f"Report written to {report_path}")
+
+    summary = runner.recorder.summary()
+    requests_total = sum(row["count"] + sum(row["errors"].values())
+                         for endpoint, row in summary.items() if not endpoint.startswith("journey"))
+    failures = sum(sum(row["errors"].values()) + sum(total for code, total in row["statuses"].items()
+                                                    if int(code) >= 500)
+                   for endpoint, row in summary.items() if not endpoint.startswith("journey"))
+    return 1 if requests_total and failures / requests_total > args.max_error_rate else 0
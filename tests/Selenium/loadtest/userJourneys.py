@@ -0,0 +1,274 @@
+"""
+User journeys for the load generator.
+Journeys walk the same pages as the Selenium tests and find links, forms and
+fields through the page object locators (HomePage, EventDetailsPage,
+LoginPage, RegisterPage), so markup changes only need fixing in one place.
+"""
+
+import asyncio
+import random
+import time
+import uuid
+from urllib.parse import urljoin
+
+import httpx
+import lxml.html
+
+from pages.EventDetailsPage import EventDetailsPage
+from pages.HomePage import HomePage
+from pages.LoginPage import LoginPage
+from pages.RegisterPage import RegisterPage
+from utilities.htmlDriver import HtmlDriver, ONCLICK_NAVIGATION, locator_to_xpath
+from utilities.perfMetrics import PerfMetrics
+
+
+class JourneyError(Exception):
+    """
+    Raised when a page does not contain what the journey needs next.
+    """
+
+
+class VirtualUser:
+    """
+    One simulated visitor with its own cookie jar on a shared connection pool.
+    """
+
+    # Redirect hops followed per request (each hop is recorded separately)
+    MAX_REDIRECTS = 5
+
+    # Password used for accounts created by the journeys
+    PASSWORD = "loadtest123"
+
+    def __init__(self, client, base_url, recorder, number, think_time=1.0, account=None):
+        """
+        Initialize a virtual user.
+
+        Args:
+            client: httpx.AsyncClient bound to the shared transport
+            base_url: Application base URL
+            recorder: LatencyRecorder receiving every request
+            number: Sequence number of the user in the run
+            think_time: Mean pause between page views in seconds
+            account: (email, password) to log in with; a fresh account is
+                     signed up on first use when omitted
+        """
+        self.client = client
+        self.base_url = base_url.rstrip("/")
+        self.recorder = recorder
+        self.number = number
+        self.think_time = think_time
+        self.account = account
+        self.logged_in = False
+
+    def url(self, path):
+        """
+        Build an absolute URL for an application path.
+        """
+        return self.base_url + path
+
+    async def think(self):
+        """
+        Pause like a reader between two page views.
+        """
+        if self.think_time:
+            await asyncio.sleep(random.uniform(0.5, 1.5) * self.think_time)
+
+    async def request(self, method, url, data=None):
+        """
+        Send a request, follow redirects hop by hop and parse the final page.
+        Every hop is recorded under its own endpoint key ("POST /login").
+
+        Args:
+            method: HTTP method
+            url: Absolute URL (query string included)
+            data: Form fields for POST (name -> list of values)
+
+        Returns:
+            tuple: (httpx.Response, lxml document or None)
+        """
+        for _ in range(self.MAX_REDIRECTS + 1):
+            endpoint = f"{method} {PerfMetrics.route_for(url, self.base_url)}"
+            started = time.perf_counter()
+            try:
+                response = await self.client.request(method, url, data=data)
+            except httpx.HTTPError as error:
+                self.recorder.record_error(endpoint, error)
+                raise JourneyError(f"{endpoint} failed: {error!r}") from error
+            self.recorder.record(endpoint, time.perf_counter() - started, response.status_code)
+            if not response.is_redirect:
+                break
+            method, data = "GET", None
+            url = urljoin(url, response.headers["Location"])
+
+        if response.status_code >= 400:
+            raise JourneyError(f"{endpoint} returned {response.status_code}")
+        document = None
+        if "html" in response.headers.get("Content-Type", "") and response.content.strip():
+            document = lxml.html.document_fromstring(response.content, base_url=str(response.url))
+        return response, document
+
+    @staticmethod
+    def find(document, locator):
+        """
+        Find nodes in a parsed page with a page object locator.
+
+        Args:
+            document: lxml document
+            locator: Tuple of (By, value)
+
+        Returns:
+            list: Matching nodes
+        """
+        return document.xpath(locator_to_xpath(*locator)) if document is not None else []
+
+    async def submit(self, document, locator, values=None):
+        """
+        Submit the form containing an element, the way the browser would.
+
+        Args:
+            document: lxml document holding the form
+            locator: Locator of the form itself or of an element inside it
+            values: Field values to set (name -> value)
+
+        Returns:
+            tuple: (httpx.Response, lxml document or None)
+        """
+        nodes = self.find(document, locator)
+        if not nodes:
+            raise JourneyError(f"No element for {locator} on {document.base_url if document is not None else '-'}")
+        node = nodes[0]
+        form = node if node.tag == "form" else next(node.iterancestors("form"), None)
+        if form is None:
+            raise JourneyError(f"{locator} is not inside a form")
+
+        fields = [(name, value) for name, value in HtmlDriver.form_values(form)
+                  if name not in (values or {})]
+        fields.extend((values or {}).items())
+        action = urljoin(document.base_url, form.get("action") or document.base_url)
+        if form.get("method", "get").lower() == "post":
+            data = {}
+            for name, value in fields:
+                data.setdefault(name, []).append(value)
+            return await self.request("POST", action, data=data)
+        return await self.request("GET", str(httpx.URL(action, params=fields)))
+
+    async def sign_up(self):
+        """
+        Create a fresh account through the registration form.
+        """
+        email = f"load_{self.number}_{uuid.uuid4().hex[:12]}@selenium.test"
+        _, page = await self.request("GET", self.url("/register"))
+        await self.submit(page, RegisterPage.BUTTON_REGISTER, {
+            RegisterPage.INPUT_NAME[1]: f"Load User {self.number}",
+            RegisterPage.INPUT_EMAIL[1]: email,
+            RegisterPage.INPUT_PASSWORD[1]: self.PASSWORD,
+            RegisterPage.INPUT_PASSWORD_CONFIRM[1]: self.PASSWORD,
+        })
+        self.account = (email, self.PASSWORD)
+
+    async def login(self):
+        """
+        Log in through the login form (signing up first if needed).
+        """
+        if self.logged_in:
+            return
+        if self.account is None:
+            await self.sign_up()
+        email, password = self.account
+        _, page = await self.request("GET", self.url("/login"))
+        response, _ = await self.submit(page, LoginPage.BUTTON_LOGIN, {
+            LoginPage.INPUT_EMAIL[1]: email,
+            LoginPage.INPUT_PASSWORD[1]: password,
+        })
+        if PerfMetrics.route_for(str(response.url), self.base_url) == "/login":
+            raise JourneyError(f"Login rejected for {email}")
+        self.logged_in = True
+
+    def event_links(self, page):
+        """
+        Read the event URLs behind the cards of the events listing.
+
+        Args:
+            page: Parsed /home document
+
+        Returns:
+            list: Absolute event URLs
+        """
+        links = []
+        for card in self.find(page, HomePage.EVENT_CARDS):
+            match = ONCLICK_NAVIGATION.search(card.get("onclick") or "")
+            if match:
+                links.append(urljoin(page.base_url, match.group(1)))
+        return links
+
+    def option_values(self, page, locator):
+        """
+        Read the non-empty option values of a filter select.
+        """
+        return [
+            option.get("value") for select in self.find(page, locator)
+            for option in select.iter("option") if option.get("value")
+        ]
+
+
+async def browse_events(user):
+    """
+    Anonymous visitor: listing, a search, a filter and one or two event pages.
+    """
+    _, home = await user.request("GET", user.url("/home"))
+    await user.think()
+
+    titles = [node.text_content().strip() for node in user.find(home, HomePage.EVENT_TITLE)]
+    term = random.choice(titles).split()[0] if titles else random.choice(["conference", "music", "tech"])
+    _, results = await user.submit(home, HomePage.FILTER_FORM, {HomePage.SEARCH_INPUT[1]: term})
+    await user.think()
+
+    for locator in (HomePage.CATEGORY_FILTER, HomePage.WEEKDAY_FILTER):
+        values = user.option_values(home, locator)
+        if values:
+            await user.submit(home, HomePage.FILTER_FORM, {locator[1]: random.choice(values)})
+            await user.think()
+            break
+
+    links = user.event_links(results) or user.event_links(home)
+    for link in random.sample(links, min(len(links), random.randint(1, 2))):
+        await user.request("GET", link)
+        await user.think()
+
+
+async def register_for_event(user):
+    """
+    Signed-in visitor: register for an event, check My Registrations, then
+    unregister again so the journey can repeat without filling events.
+    """
+    await user.login()
+    _, home = await user.request("GET", user.url("/home"))
+    await user.think()
+
+    links = user.event_links(home)
+    if not links:
+        raise JourneyError("No events listed on /home")
+    event_url = random.choice(links)
+    _, event = await user.request("GET", event_url)
+    await user.think()
+
+    if user.find(event, EventDetailsPage.UNREGISTER_BUTTON):
+        _, event = await user.submit(event, EventDetailsPage.UNREGISTER_BUTTON)
+        await user.think()
+
+    if user.find(event, EventDetailsPage.REGISTER_BUTTON):
+        _, event = await user.submit(event, EventDetailsPage.REGISTER_BUTTON)
+        await user.think()
+
+    await user.request("GET", user.url("/my-registrations"))
+    await user.think()
+
+    if user.find(event, EventDetailsPage.UNREGISTER_BUTTON):
+        await user.submit(event, EventDetailsPage.UNREGISTER_BUTTON)
+
+
+# Journeys selectable from the command line
+JOURNEYS = {
+    "browse": browse_events,
+    "register": register_for_event,
+}
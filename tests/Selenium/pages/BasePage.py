@@ -6,10 +6,17 @@ Test Level: System
 Pattern: Page Object Model (POM)
 """
 
+import time
+
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import WebDriverException
+
+from utilities.httpProxy import HttpProxy
+from utilities.perfMetrics import PerfMetrics
+from utilities.stepTracer import StepTracer
+from utilities.waitPolicy import WaitPolicy
 
 
 class BasePage:
@@ -18,6 +25,60 @@ class BasePage:
     Contains common methods for interacting with web pages.
     """
 
+    # Default timeout (seconds) for explicit waits
+    DEFAULT_TIMEOUT = 10
+
+    # Timeout (seconds) for state queries on an already loaded page
+    PROBE_TIMEOUT = 0.5
+
+    # Quiet period (seconds) without new network activity before the page counts as idle
+    NETWORK_IDLE_TIME = 0.5
+
+    # Record Navigation/Resource Timing and paint metrics after every page load
+    CAPTURE_METRICS = True
+
+    # Locator for the document root, used to detect page replacement
+    DOCUMENT_ROOT = (By.TAG_NAME, "html")
+
+    # Default fields returned by extract()
+    EXTRACT_FIELDS = {"text": "text", "visible": "visible"}
+
+    # Script evaluating a CSS/XPath query and reading fields of every match
+    # Field specs: "text", "visible", "element", "@attribute" or a DOM property name
+    EXTRACT_SCRIPT = """
+        var kind = arguments[0], query = arguments[1], fields = arguments[2];
+        var nodes = [];
+        if (kind === 'xpath') {
+            var snapshot = document.evaluate(query, document, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (var i = 0; i < snapshot.snapshotLength; i++) {
+                nodes.push(snapshot.snapshotItem(i));
+            }
+        } else {
+            nodes = Array.prototype.slice.call(document.querySelectorAll(query));
+        }
+        return nodes.map(function (el) {
+            var row = {};
+            Object.keys(fields).forEach(function (name) {
+                var spec = fields[name];
+                if (spec === 'text') {
+                    row[name] = (el.innerText || el.textContent || '').trim();
+                } else if (spec === 'visible') {
+                    var rect = el.getBoundingClientRect(), style = window.getComputedStyle(el);
+                    row[name] = rect.width > 0 && rect.height > 0 &&
+                        style.visibility !== 'hidden' && style.display !== 'none';
+                } else if (spec === 'element') {
+                    row[name] = el;
+                } else if (spec.charAt(0) === '@') {
+                    row[name] = el.getAttribute(spec.slice(1));
+                } else {
+                    row[name] = el[spec] === undefined ? null : el[spec];
+                }
+            });
+            return row;
+        });
+    """
+
     def __init__(self, driver):
         """
         Initialize the base page.
@@ -26,7 +87,20 @@ class BasePage:
             driver: Selenium WebDriver instance
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.policy = WaitPolicy(timeout=self.DEFAULT_TIMEOUT, probe_timeout=self.PROBE_TIMEOUT)
+        self.policy.apply(driver)
+        self.wait = WebDriverWait(driver, self.DEFAULT_TIMEOUT, poll_frequency=self.policy.poll_frequency)
+
+    @property
+    def has_javascript(self):
+        """
+        Check whether the driver runs JavaScript.
+        False for the browserless HtmlDriver, whose page loads are synchronous.
+        
+        Returns:
+            bool: True for a real browser
+        """
+        return getattr(self.driver, "javascript_enabled", True)
 
     def get_element(self, locator):
         """
@@ -98,13 +172,7 @@ class BasePage:
         Returns:
             bool: True if element is present
         """
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
-            return True
-        except TimeoutException:
-            return False
+        return self.policy.holds(self.driver, EC.presence_of_element_located(locator), timeout)
 
     def is_element_visible(self, locator, timeout=5):
         """
@@ -117,13 +185,49 @@ class BasePage:
         Returns:
             bool: True if element is visible
         """
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
-            return True
-        except TimeoutException:
-            return False
+        return self.policy.holds(self.driver, EC.visibility_of_element_located(locator), timeout)
+
+    def is_displayed(self, locator):
+        """
+        Check whether an element is shown on the already loaded page.
+        Returns at once when nothing matches the locator, so negative state
+        checks (no error message, no pagination) cost no probe wait.
+        
+        Args:
+            locator: Tuple of (By, value)
+            
+        Returns:
+            bool: True if the element is visible
+        """
+        return self.policy.probe_visible(self.driver, locator)
+
+    def is_element_absent(self, locator, within=0):
+        """
+        Check that no element matches the locator.
+        Returns immediately when nothing matches (no implicit wait involved).
+        
+        Args:
+            locator: Tuple of (By, value)
+            within: Seconds to wait for a matching element to disappear
+            
+        Returns:
+            bool: True if the element is absent
+        """
+        return self.policy.is_absent(self.driver, locator, within)
+
+    def assert_absent(self, locator, within=0.5):
+        """
+        Assert that no element matches the locator.
+        
+        Args:
+            locator: Tuple of (By, value)
+            within: Seconds to wait for a matching element to disappear
+            
+        Raises:
+            AssertionError: If the element is still present after `within` seconds
+        """
+        assert self.is_element_absent(locator, within), \
+            f"Element {locator} should be absent, still present after {within}s"
 
     def get_current_url(self):
         """
@@ -163,10 +267,263 @@ class BasePage:
         Returns:
             bool: True if URL contains text
         """
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.url_contains(text)
-            )
+        return self.policy.holds(self.driver, EC.url_contains(text), timeout)
+
+    def open(self, url):
+        """
+        Navigate to a URL and wait for the document to finish loading.
+        
+        Args:
+            url: Absolute URL to open
+        """
+        started = time.monotonic()
+        self.driver.get(url)
+        if self.wait_for_page_load():
+            self.record_step("open", started)
+            self.capture_metrics()
+
+    def refresh(self):
+        """
+        Reload the current page and wait for the new document to load.
+        
+        Returns:
+            bool: True if the page was reloaded
+        """
+        return self.wait_for_navigation(self.driver.refresh)
+
+    def wait_for_page_load(self, timeout=None):
+        """
+        Wait until document.readyState is "complete".
+        
+        Args:
+            timeout: Wait timeout in seconds (default: DEFAULT_TIMEOUT)
+            
+        Returns:
+            bool: True if the document finished loading in time
+        """
+        if not self.has_javascript:
             return True
-        except TimeoutException:
+        return self.policy.holds(
+            self.driver,
+            lambda driver: driver.execute_script("return document.readyState") == "complete",
+            timeout
+        )
+
+    def wait_for_url_change(self, old_url, timeout=None):
+        """
+        Wait until the current URL differs from a previous URL.
+        
+        Args:
+            old_url: URL before the action
+            timeout: Wait timeout in seconds (default: DEFAULT_TIMEOUT)
+            
+        Returns:
+            bool: True if the URL changed in time
+        """
+        return self.policy.holds(self.driver, EC.url_changes(old_url), timeout)
+
+    def wait_for_staleness(self, element, timeout=None):
+        """
+        Wait until an element is detached from the DOM (e.g. after navigation).
+        
+        Args:
+            element: WebElement captured before the action
+            timeout: Wait timeout in seconds (default: DEFAULT_TIMEOUT)
+            
+        Returns:
+            bool: True if the element went stale in time
+        """
+        return self.policy.holds(self.driver, EC.staleness_of(element), timeout)
+
+    def wait_for_network_idle(self, idle_time=None, timeout=None):
+        """
+        Wait until the page is loaded and no new resources have finished
+        loading for idle_time seconds. Behind the HTTP proxy (--proxy-mode)
+        this means no request to the app in flight; otherwise it is based on
+        the Resource Timing buffer.
+        
+        Args:
+            idle_time: Required quiet period in seconds (default: NETWORK_IDLE_TIME)
+            timeout: Wait timeout in seconds (default: DEFAULT_TIMEOUT)
+            
+        Returns:
+            bool: True if the network went idle in time
+        """
+        idle_time = self.NETWORK_IDLE_TIME if idle_time is None else idle_time
+        if HttpProxy.current:
+            # One deadline for both waits, so a slow page load does not extend the timeout
+            deadline = time.monotonic() + (self.DEFAULT_TIMEOUT if timeout is None else timeout)
+            if not self.wait_for_page_load(timeout):
+                return False
+            return HttpProxy.current.stats.wait_for_idle(idle_time, max(0.0, deadline - time.monotonic()))
+        if not self.has_javascript:
+            return True
+        state = {"count": -1, "since": 0.0}
+
+        def network_is_idle(driver):
+            ready, count = driver.execute_script(
+                "return [document.readyState,"
+                " performance.getEntriesByType('resource').length];"
+            )
+            now = time.monotonic()
+            if ready != "complete" or count != state["count"]:
+                state["count"] = count
+                state["since"] = now
+                return False
+            return now - state["since"] >= idle_time
+
+        return self.policy.holds(self.driver, network_is_idle, timeout)
+
+    def wait_for_navigation(self, action, timeout=None):
+        """
+        Run an action that triggers a page load and wait for the new document.
+        The current document root must go stale and the new one must finish
+        loading, both within the timeout (counted from the action).
+        
+        Args:
+            action: Callable performing the click/submit
+            timeout: Wait timeout in seconds (default: DEFAULT_TIMEOUT)
+            
+        Returns:
+            bool: True if a new page was loaded in time
+        """
+        document = self.driver.find_element(*self.DOCUMENT_ROOT)
+        started = time.monotonic()
+        deadline = started + (self.DEFAULT_TIMEOUT if timeout is None else timeout)
+        action()
+        if not self.wait_for_staleness(document, max(0.0, deadline - time.monotonic())):
+            return False
+        if not self.wait_for_page_load(max(0.0, deadline - time.monotonic())):
+            return False
+        self.record_step("navigate", started)
+        self.capture_metrics()
+        return True
+
+    def click_and_wait_for_navigation(self, locator, timeout=None):
+        """
+        Click an element that submits a form or follows a link, and wait for
+        the resulting page. Forms blocked by HTML5 validation return immediately.
+        
+        Args:
+            locator: Tuple of (By, value)
+            timeout: Wait timeout in seconds (default: DEFAULT_TIMEOUT)
+            
+        Returns:
+            bool: True if a new page was loaded
+        """
+        element = self.get_clickable_element(locator)
+        if self.is_submission_blocked(element):
+            element.click()
             return False
+        return self.wait_for_navigation(element.click, timeout)
+
+    def is_submission_blocked(self, element):
+        """
+        Check whether the browser will refuse to submit the element's form
+        because of HTML5 constraint validation.
+        
+        Args:
+            element: Submit button or form field
+            
+        Returns:
+            bool: True if the owning form is invalid
+        """
+        if not self.has_javascript:
+            return self.driver.is_submission_blocked(element)
+        return bool(self.driver.execute_script(
+            "var form = arguments[0].form;"
+            " return !!form && !form.noValidate && !form.checkValidity();",
+            element
+        ))
+
+    def extract(self, locator, fields=None):
+        """
+        Read fields of every element matching a locator in a single
+        execute_script round-trip (instead of one WebDriver call per element).
+        
+        Args:
+            locator: Tuple of (By, value)
+            fields: Dict of result key -> field spec: "text", "visible",
+                    "element" (WebElement), "@attribute" or a DOM property name
+                    (default: text and visibility)
+            
+        Returns:
+            list: One dict per matching element, in document order
+        """
+        if not self.has_javascript:
+            return self.driver.extract(locator, fields or self.EXTRACT_FIELDS)
+        kind, query = self.to_query(locator)
+        return self.driver.execute_script(
+            self.EXTRACT_SCRIPT, kind, query, fields or self.EXTRACT_FIELDS
+        )
+
+    @staticmethod
+    def to_query(locator):
+        """
+        Convert a locator into a CSS or XPath query usable from JavaScript.
+        
+        Args:
+            locator: Tuple of (By, value)
+            
+        Returns:
+            tuple: ("css" or "xpath", query string)
+        """
+        by, value = locator
+        if by == By.XPATH:
+            return "xpath", value
+        if by == By.CSS_SELECTOR:
+            return "css", value
+        if by == By.ID:
+            return "css", f'[id="{value}"]'
+        if by == By.NAME:
+            return "css", f'[name="{value}"]'
+        if by == By.CLASS_NAME:
+            return "css", f".{value}"
+        if by == By.TAG_NAME:
+            return "css", value
+        if by == By.LINK_TEXT:
+            return "xpath", f'//a[normalize-space(.)="{value}"]'
+        if by == By.PARTIAL_LINK_TEXT:
+            return "xpath", f'//a[contains(., "{value}")]'
+        raise ValueError(f"Unsupported locator strategy: {by}")
+
+    def capture_metrics(self):
+        """
+        Record browser timing metrics (TTFB, DOMContentLoaded, load, FCP, LCP,
+        resource summary) for the current page, keyed by route.
+        
+        Returns:
+            dict: The stored record, or None if nothing was captured
+        """
+        if not (self.CAPTURE_METRICS and self.has_javascript):
+            return None
+        try:
+            return PerfMetrics.capture(self.driver)
+        except WebDriverException:
+            return None
+
+    def record_step(self, kind, started):
+        """
+        Record the duration of a page load as a test step named after the
+        route it ended on (e.g. "navigate /events/{id}").
+        
+        Args:
+            kind: Step kind ("open" or "navigate")
+            started: time.monotonic() value taken before the action
+        """
+        route = PerfMetrics.route_for(self.driver.current_url)
+        PerfMetrics.record_step(f"{kind} {route}", time.monotonic() - started)
+
+    def step(self, name, **attributes):
+        """
+        Open a timing span around a page action (logged as a JSON event and
+        a text line when it ends).
+        
+        Args:
+            name: Step name such as "login"
+            attributes: Extra fields written with the span
+            
+        Returns:
+            contextmanager: Yields the running Span
+        """
+        return StepTracer.span(name, page=type(self).__name__, **attributes)
@@ -25,8 +25,9 @@ class EventDetailsPage(BasePage):
     EVENT_PRICE = (By.CSS_SELECTOR, ".event-price")
     EVENT_CAPACITY = (By.CSS_SELECTOR, ".event-capacity")
     EVENT_CATEGORY = (By.CSS_SELECTOR, ".event-category")
-    REGISTER_BUTTON = (By.CSS_SELECTOR, "button[type='submit'], form[action*='register'] button")
+    REGISTER_BUTTON = (By.CSS_SELECTOR, "form[action$='/register'] button[type='submit']")
     UNREGISTER_BUTTON = (By.CSS_SELECTOR, "form[action*='unregister'] button")
+    LOGIN_TO_REGISTER_LINK = (By.XPATH, "//a[contains(normalize-space(.), 'Login to')]")
     SUCCESS_MESSAGE = (By.CSS_SELECTOR, ".alert-success")
     ERROR_MESSAGE = (By.CSS_SELECTOR, ".alert-error")
     REGISTRATION_STATUS = (By.CSS_SELECTOR, ".registration-status")
@@ -57,7 +58,7 @@ class EventDetailsPage(BasePage):
         Returns:
             str: Event description text
         """
-        if self.is_element_visible(self.EVENT_DESCRIPTION):
+        if self.is_displayed(self.EVENT_DESCRIPTION):
             return self.get_text(self.EVENT_DESCRIPTION)
         return ""
 
@@ -68,21 +69,48 @@ class EventDetailsPage(BasePage):
         Returns:
             str: Event place/location
         """
-        if self.is_element_visible(self.EVENT_PLACE):
+        if self.is_displayed(self.EVENT_PLACE):
             return self.get_text(self.EVENT_PLACE)
         return ""
 
     def click_register_button(self):
         """
         Click the register button to register for the event.
+        Returns once the redirected page has loaded.
+        
+        Returns:
+            bool: True if a new page was loaded
+        """
+        with self.step("click_register_button") as span:
+            loaded = self.click_and_wait_for_navigation(self.REGISTER_BUTTON)
+            span.outcome = "ok" if loaded else "no_navigation"
+            return loaded
+
+    def click_login_to_register(self):
         """
-        self.click_element(self.REGISTER_BUTTON)
+        Click the "Login to register" link shown to guests instead of the register button.
+        Returns once the login page has loaded.
+        
+        Returns:
+            bool: True if a new page was loaded
+        """
+        with self.step("click_login_to_register") as span:
+            loaded = self.click_and_wait_for_navigation(self.LOGIN_TO_REGISTER_LINK)
+            span.outcome = "ok" if loaded else "no_navigation"
+            return loaded
 
     def click_unregister_button(self):
         """
         Click the unregister button to cancel registration.
+        Returns once the redirected page has loaded.
+        
+        Returns:
+            bool: True if a new page was loaded
         """
-        self.click_element(self.UNREGISTER_BUTTON)
+        with self.step("click_unregister_button") as span:
+            loaded = self.click_and_wait_for_navigation(self.UNREGISTER_BUTTON)
+            span.outcome = "ok" if loaded else "no_navigation"
+            return loaded
 
     def is_register_button_visible(self):
         """
@@ -91,7 +119,16 @@ class EventDetailsPage(BasePage):
         Returns:
             bool: True if register button is visible
         """
-        return self.is_element_visible(self.REGISTER_BUTTON)
+        return self.is_displayed(self.REGISTER_BUTTON)
+
+    def is_login_to_register_visible(self):
+        """
+        Check if the "Login to register" link for guests is visible.
+        
+        Returns:
+            bool: True if the link is visible
+        """
+        return self.is_displayed(self.LOGIN_TO_REGISTER_LINK)
 
     def is_unregister_button_visible(self):
         """
@@ -100,7 +137,7 @@ class EventDetailsPage(BasePage):
         Returns:
             bool: True if unregister button is visible
         """
-        return self.is_element_visible(self.UNREGISTER_BUTTON)
+        return self.is_displayed(self.UNREGISTER_BUTTON)
 
     def get_success_message(self):
         """
@@ -109,7 +146,7 @@ class EventDetailsPage(BasePage):
         Returns:
             str: Success message text, or None if not present
         """
-        if self.is_element_visible(self.SUCCESS_MESSAGE):
+        if self.is_displayed(self.SUCCESS_MESSAGE):
             return self.get_text(self.SUCCESS_MESSAGE)
         return None
 
@@ -120,7 +157,7 @@ class EventDetailsPage(BasePage):
         Returns:
             str: Error message text, or None if not present
         """
-        if self.is_element_visible(self.ERROR_MESSAGE):
+        if self.is_displayed(self.ERROR_MESSAGE):
             return self.get_text(self.ERROR_MESSAGE)
         return None
 
@@ -136,8 +173,11 @@ class EventDetailsPage(BasePage):
     def click_back(self):
         """
         Click back link to return to events list.
+        
+        Returns:
+            bool: True if the events list was loaded
         """
-        self.click_element(self.BACK_LINK)
+        return self.click_and_wait_for_navigation(self.BACK_LINK)
 
     def is_event_details_page(self):
         """
@@ -49,31 +49,45 @@ class HomePage(BasePage):
         
         Args:
             search_term: Search keyword
+            
+        Returns:
+            bool: True if the filtered listing was loaded
         """
-        search_input = self.get_element(self.SEARCH_INPUT)
-        search_input.clear()
-        search_input.send_keys(search_term)
-        search_input.send_keys(Keys.RETURN)
+        with self.step("search_events", search_term=search_term) as span:
+            search_input = self.get_element(self.SEARCH_INPUT)
+            search_input.clear()
+            search_input.send_keys(search_term)
+            loaded = self.wait_for_navigation(lambda: search_input.send_keys(Keys.RETURN))
+            span.outcome = "ok" if loaded else "no_navigation"
+            return loaded
 
     def filter_by_category(self, category_id):
         """
         Filter events by category.
+        The select submits the filter form on change.
         
         Args:
             category_id: Category ID to filter by
+            
+        Returns:
+            bool: True if the filtered listing was loaded
         """
         select = Select(self.get_element(self.CATEGORY_FILTER))
-        select.select_by_value(str(category_id))
+        return self.wait_for_navigation(lambda: select.select_by_value(str(category_id)))
 
     def filter_by_weekday(self, weekday):
         """
         Filter events by weekday.
+        The select submits the filter form on change.
         
         Args:
             weekday: Weekday name (e.g., "Monday")
+            
+        Returns:
+            bool: True if the filtered listing was loaded
         """
         select = Select(self.get_element(self.WEEKDAY_FILTER))
-        select.select_by_value(weekday)
+        return self.wait_for_navigation(lambda: select.select_by_value(weekday))
 
     def get_event_count(self):
         """
@@ -82,29 +96,27 @@ class HomePage(BasePage):
         Returns:
             int: Number of events visible
         """
-        if self.is_element_present(self.EVENT_CARDS):
-            events = self.driver.find_elements(*self.EVENT_CARDS)
-            return len(events)
-        return 0
+        return len(self.driver.find_elements(*self.EVENT_CARDS))
 
     def get_event_titles(self):
         """
         Get all visible event titles.
+        Reads every card title in one round-trip.
         
         Returns:
             list: List of event title strings
         """
-        if self.is_element_present(self.EVENT_TITLE):
-            titles = self.driver.find_elements(*self.EVENT_TITLE)
-            return [title.text for title in titles]
-        return []
+        return [row["text"] for row in self.extract(self.EVENT_TITLE, {"text": "text"})]
 
     def click_first_event(self):
         """
         Click on the first event card to view details.
         Event cards use onclick to navigate, so we click the card directly.
+        
+        Returns:
+            bool: True if the event details page was loaded
         """
-        self.click_element(self.EVENT_CARDS)
+        return self.click_and_wait_for_navigation(self.EVENT_CARDS)
 
     def click_event_by_title(self, title):
         """
@@ -116,11 +128,10 @@ class HomePage(BasePage):
         Returns:
             bool: True if event was found and clicked
         """
-        events = self.driver.find_elements(*self.EVENT_CARDS)
+        events = self.extract(self.EVENT_CARDS, {"text": "text", "element": "element"})
         for event in events:
-            if title in event.text:
-                event.click()
-                return True
+            if title in event["text"]:
+                return self.wait_for_navigation(event["element"].click)
         return False
 
     def is_event_displayed(self, title):
@@ -143,7 +154,7 @@ class HomePage(BasePage):
         Returns:
             bool: True if user is logged in
         """
-        return self.is_element_visible(self.USER_DROPDOWN)
+        return self.is_displayed(self.USER_DROPDOWN)
 
     def is_login_link_visible(self):
         """
@@ -152,7 +163,7 @@ class HomePage(BasePage):
         Returns:
             bool: True if login link is visible
         """
-        return self.is_element_visible(self.LOGIN_LINK)
+        return self.is_displayed(self.LOGIN_LINK)
 
     def has_pagination(self):
         """
@@ -161,7 +172,7 @@ class HomePage(BasePage):
         Returns:
             bool: True if pagination is visible
         """
-        return self.is_element_visible(self.PAGINATION)
+        return self.is_displayed(self.PAGINATION)
 
     def no_events_displayed(self):
         """
@@ -170,4 +181,5 @@ class HomePage(BasePage):
         Returns:
             bool: True if no events message is shown
         """
-        return self.is_element_visible(self.NO_EVENTS_MESSAGE) or self.get_event_count() == 0
+        return self.get_event_count() == 0 or \
+            self.is_displayed(self.NO_EVENTS_MESSAGE)
@@ -63,20 +63,30 @@ class LoginPage(BasePage):
     def click_register_link(self):
         """
         Click the register link to navigate to registration page.
+        
+        Returns:
+            bool: True if the registration page was loaded
         """
-        self.click_element(self.LINK_REGISTER)
+        return self.click_and_wait_for_navigation(self.LINK_REGISTER)
 
     def login(self, email, password):
         """
         Perform complete login action.
+        Returns as soon as the post-login page (or the login page with errors) has loaded.
         
         Args:
             email: User email
             password: User password
+            
+        Returns:
+            bool: True if the form was submitted and a new page loaded
         """
-        self.enter_email(email)
-        self.enter_password(password)
-        self.click_login_button()
+        with self.step("login", email=email) as span:
+            self.enter_email(email)
+            self.enter_password(password)
+            loaded = self.click_and_wait_for_navigation(self.BUTTON_LOGIN)
+            span.outcome = "ok" if loaded else "no_navigation"
+            return loaded
 
     def get_error_message(self):
         """
@@ -85,7 +95,7 @@ class LoginPage(BasePage):
         Returns:
             str: Error message text, or None if not present
         """
-        if self.is_element_visible(self.ERROR_MESSAGE):
+        if self.is_displayed(self.ERROR_MESSAGE):
             return self.get_text(self.ERROR_MESSAGE)
         return None
 
@@ -96,7 +106,7 @@ class LoginPage(BasePage):
         Returns:
             str: Success message text, or None if not present
         """
-        if self.is_element_visible(self.SUCCESS_MESSAGE):
+        if self.is_displayed(self.SUCCESS_MESSAGE):
             return self.get_text(self.SUCCESS_MESSAGE)
         return None
 
@@ -117,7 +127,7 @@ class LoginPage(BasePage):
         Returns:
             bool: True if error is visible
         """
-        return self.is_element_visible(self.ERROR_MESSAGE)
+        return self.is_displayed(self.ERROR_MESSAGE)
 
     def is_brand_visible(self):
         """
@@ -83,18 +83,25 @@ class RegisterPage(BasePage):
     def click_login_link(self):
         """
         Click the login link to navigate to login page.
+        
+        Returns:
+            bool: True if the login page was loaded
         """
-        self.click_element(self.LINK_LOGIN)
+        return self.click_and_wait_for_navigation(self.LINK_LOGIN)
 
     def register(self, name, email, password, password_confirm=None):
         """
         Perform complete registration action.
+        Returns as soon as the resulting page has loaded.
         
         Args:
             name: User's name
             email: User's email
             password: User's password
             password_confirm: Password confirmation (defaults to password if not provided)
+            
+        Returns:
+            bool: True if the form was submitted and a new page loaded
         """
         if password_confirm is None:
             password_confirm = password
@@ -103,7 +110,7 @@ class RegisterPage(BasePage):
         self.enter_email(email)
         self.enter_password(password)
         self.enter_password_confirmation(password_confirm)
-        self.click_register_button()
+        return self.click_and_wait_for_navigation(self.BUTTON_REGISTER)
 
     def get_error_message(self):
         """
@@ -112,7 +119,7 @@ class RegisterPage(BasePage):
         Returns:
             str: Error message text, or None if not present
         """
-        if self.is_element_visible(self.ERROR_MESSAGE):
+        if self.is_displayed(self.ERROR_MESSAGE):
             return self.get_text(self.ERROR_MESSAGE)
         return None
 
@@ -133,7 +140,7 @@ class RegisterPage(BasePage):
         Returns:
             bool: True if error is visible
         """
-        return self.is_element_visible(self.ERROR_MESSAGE)
+        return self.is_displayed(self.ERROR_MESSAGE)
 
     def has_field_errors(self):
         """
@@ -142,4 +149,4 @@ class RegisterPage(BasePage):
         Returns:
             bool: True if field errors are visible
         """
-        return self.is_element_visible(self.FIELD_ERROR)
+        return self.is_displayed(self.FIELD_ERROR)
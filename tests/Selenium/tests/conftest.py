@@ -12,17 +12,110 @@ import os
 import sys
 
 # Add the parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from utilities.customLogger import CustomLogger
+from utilities.dataFactory import DataFactory
+from utilities.driverPool import DriverPool
+from utilities.harRecorder import HarRecorder
+from utilities.durationScheduler import DurationScheduling
+from utilities.faultInjection import FaultPlan
+from utilities.htmlDriver import HtmlDriver
+from utilities.httpProxy import HttpProxy, HttpProxyPlugin, ProxyStats, ReplayStore
+from utilities.logArchive import LogArchive
+from utilities.perfBudget import PerfBudget, PerfBudgetPlugin
+from utilities.networkProfiles import NetworkProfiles
+from utilities.perfMetrics import PerfMetrics
+from utilities.readProperties import ReadConfig
+from utilities.resultsStore import ResultsRecorder
+from utilities.shardPlanner import ShardPlanner
+from utilities.stepTracer import StepTracer
+from utilities.workerContext import WorkerContext
+from utilities.waitPolicy import WaitPolicy
 
-@pytest.fixture(scope="function")
-def setup():
+
+def pytest_addoption(parser):
+    """
+    Register command line options for the Selenium suite.
     """
-    Setup fixture that initializes Edge WebDriver.
+    parser.addoption(
+        "--config-profile", action="store", default=None,
+        help="Apply the [profile:NAME] section of config.ini (default: $AAB_TEST_PROFILE)"
+    )
+    parser.addoption(
+        "--app-url", action="store", default=None,
+        help="Base URL of the application under test (overrides baseUrl)"
+    )
+    parser.addoption(
+        "--app-urls", action="store", default=None,
+        help="Comma separated application instances to shard the run across (one per worker)"
+    )
+    parser.addoption(
+        "--config-set", action="append", default=[], metavar="SETTING=VALUE",
+        help="Override a setting, e.g. --config-set log_retention_days=7 (repeatable)"
+    )
+    parser.addoption(
+        "--proxy-mode", action="store", default=None, choices=HttpProxy.MODES,
+        help="Run through an HTTP proxy measuring server time per request (observe), "
+             "also recording the app's responses (record), or replaying them without the app (replay); "
+             "needed by tests marked 'faults' (default: observe when [proxy] faults is set)"
+    )
+    parser.addoption(
+        "--proxy-store", action="store", default=None,
+        help="Recorded responses of --proxy-mode (default: Logs/replay_store.sqlite3)"
+    )
+    parser.addoption(
+        "--no-duration-schedule", action="store_true", default=False,
+        help="Use plain xdist load scheduling instead of longest-tests-first"
+    )
+    parser.addoption(
+        "--network-profile", action="store", default=None, choices=list(NetworkProfiles.PROFILES),
+        help="Network profile for tests without a 'network' marker (default: full)"
+    )
+    parser.addoption(
+        "--har", action="store_true", default=False,
+        help="Record a HAR file of every browser test (tests can opt in with the 'har' fixture)"
+    )
+    parser.addoption(
+        "--driver-pool-size", action="store", default=1, type=int,
+        help="Number of warm Edge sessions kept per worker (default: 1)"
+    )
+    parser.addoption(
+        "--no-html-mode", action="store_true", default=False,
+        help="Run tests marked 'browserless' in Edge as well"
+    )
+    parser.addoption(
+        "--perf-budget", action="store", default=None,
+        help="Performance budget file (default: Configurations/budgets.ini)"
+    )
+    parser.addoption(
+        "--perf-budget-mode", action="store", default=None, choices=PerfBudget.MODES,
+        help="Override the budget file mode: fail the run or only warn"
+    )
+    parser.addoption(
+        "--stress-users", action="store", default=0, type=int,
+        help="Simultaneous users for tests marked 'stress' (0 skips them)"
+    )
+    parser.addoption(
+        "--results-db", action="store", default=None,
+        help="Results database for run history (default: Logs/results.sqlite3)"
+    )
+    parser.addoption(
+        "--no-results-db", action="store_true", default=False,
+        help="Do not record this run in the results database"
+    )
+
+
+def build_edge_driver(suppress_automation=True, capture_network=False):
+    """
+    Start a new headless Edge WebDriver.
     Edge is pre-installed on Windows, no additional download needed.
-    Yields the driver for tests and quits after test completion.
-    
-    Yields:
+
+    Args:
+        suppress_automation: Also disable notifications and the automation banner
+        capture_network: Enable the performance log used for HAR recording
+
+    Returns:
         WebDriver: Configured Edge WebDriver instance
     """
     # Edge options
@@ -31,64 +124,250 @@ def setup():
     edge_options.add_argument("--no-sandbox")
     edge_options.add_argument("--disable-dev-shm-usage")
     edge_options.add_argument("--window-size=1920,1080")
-    edge_options.add_argument("--disable-notifications")
-    
+
     # Suppress browser logging noise
     edge_options.add_argument("--log-level=3")  # Only fatal errors
     edge_options.add_argument("--disable-logging")
     edge_options.add_argument("--disable-gpu")
-    edge_options.add_argument("--enable-features=NetworkServiceInProcess")
-    edge_options.add_experimental_option("excludeSwitches", ["enable-logging", "enable-automation"])
-    
+    if suppress_automation:
+        edge_options.add_argument("--disable-notifications")
+        edge_options.add_argument("--enable-features=NetworkServiceInProcess")
+        edge_options.add_experimental_option("excludeSwitches", ["enable-logging", "enable-automation"])
+    else:
+        edge_options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    if capture_network:
+        HarRecorder.enable(edge_options)
+
     # Suppress EdgeDriver output (including DevTools message)
     service = Service(log_output=os.devnull)
-    
+
     # Edge is pre-installed on Windows - Selenium Manager only downloads EdgeDriver
     driver = webdriver.Edge(service=service, options=edge_options)
-    
-    # Set implicit wait
-    driver.implicitly_wait(10)
-    
+
+    # Explicit waits only - page objects wait through WaitPolicy, and an
+    # implicit wait would stall every negative presence check
+    WaitPolicy.apply(driver)
+
+    return driver
+
+
+def apply_network_profile(request, driver):
+    """
+    Block the requests of the test's network profile (marker 'network' or
+    --network-profile) on a leased browser; pooled drivers switch profiles
+    only when the next test needs a different one.
+    """
+    profile = NetworkProfiles.for_item(request.node, request.config.getoption("--network-profile"))
+    if NetworkProfiles.apply(driver, profile):
+        PerfMetrics.network_profile = profile
+
+
+def wants_har(request):
+    """
+    Check whether a test records a HAR file (--har or the 'har' fixture).
+    """
+    return request.config.getoption("--har") or "har" in request.fixturenames
+
+
+def captures_network(request):
+    """
+    Check whether the drivers of this session need the performance log,
+    i.e. whether any collected test records a HAR file.
+    """
+    return request.config.getoption("--har") or any(
+        "har" in getattr(item, "fixturenames", ()) for item in request.session.items
+    )
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """
+    Session-scoped pool of warm Edge sessions.
+    Each xdist worker runs its own session, so the pool is worker-local
+    and drivers are never shared between workers.
+
+    Yields:
+        DriverPool: Pool used by the setup fixture
+    """
+    capture_network = captures_network(request)
+    pool = DriverPool(
+        lambda: build_edge_driver(capture_network=capture_network),
+        size=request.config.getoption("--driver-pool-size")
+    )
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def headless_driver_pool(request):
+    """
+    Session-scoped pool of warm headless Edge sessions (for CI/CD environments).
+
+    Yields:
+        DriverPool: Pool used by the setup_headless fixture
+    """
+    capture_network = captures_network(request)
+    pool = DriverPool(
+        lambda: build_edge_driver(suppress_automation=False, capture_network=capture_network),
+        size=request.config.getoption("--driver-pool-size")
+    )
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="function")
+def setup(request, driver_pool):
+    """
+    Setup fixture that leases an Edge WebDriver from the worker pool.
+    The driver is reset (cookies, storage, about:blank) when returned.
+    Tests marked 'browserless' get an HtmlDriver instead (HTTP + lxml, no JavaScript).
+
+    Yields:
+        WebDriver: Configured Edge WebDriver instance (or HtmlDriver)
+    """
+    if request.node.get_closest_marker("browserless") and not request.config.getoption("--no-html-mode"):
+        driver = HtmlDriver()
+        yield driver
+        driver.quit()
+        return
+
+    driver = driver_pool.lease()
+    apply_network_profile(request, driver)
+    recorder = request.getfixturevalue("har") if wants_har(request) else None
+    if recorder:
+        recorder.start(driver)
+
     yield driver
-    
-    # Teardown - quit driver
-    driver.quit()
+
+    # Teardown - hand the recorded events to the HAR writer, then the driver back to the pool
+    if recorder:
+        recorder.stop()
+    driver_pool.release(driver)
 
 
 @pytest.fixture(scope="function")
-def setup_headless():
+def setup_headless(request, headless_driver_pool):
     """
     Setup fixture for headless Edge (for CI/CD environments).
-    
+
     Yields:
         WebDriver: Configured headless Edge WebDriver instance
     """
-    edge_options = Options()
-    edge_options.add_argument("--headless")
-    edge_options.add_argument("--no-sandbox")
-    edge_options.add_argument("--disable-dev-shm-usage")
-    edge_options.add_argument("--window-size=1920,1080")
-    
-    # Suppress browser logging noise
-    edge_options.add_argument("--log-level=3")
-    edge_options.add_argument("--disable-logging")
-    edge_options.add_argument("--disable-gpu")
-    edge_options.add_experimental_option("excludeSwitches", ["enable-logging"])
-    
-    service = Service(log_output=os.devnull)
-    driver = webdriver.Edge(service=service, options=edge_options)
-    
-    driver.implicitly_wait(10)
-    
+    driver = headless_driver_pool.lease()
+    apply_network_profile(request, driver)
+    recorder = request.getfixturevalue("har") if wants_har(request) else None
+    if recorder:
+        recorder.start(driver)
+
     yield driver
-    
-    driver.quit()
+
+    if recorder:
+        recorder.stop()
+    headless_driver_pool.release(driver)
+
+
+@pytest.fixture(scope="function")
+def har(request):
+    """
+    Opt-in HAR recording of the test's browser traffic.
+    setup / setup_headless start the recorder after leasing the driver and
+    stop it before releasing it; the file is written by a background thread
+    to Logs/har_<run>_<test>.har and summarized in the test log.
+
+    Returns:
+        HarRecorder: Recorder of the test (har.summary() waits for the file)
+    """
+    return HarRecorder(request.node.nodeid)
+
+
+@pytest.fixture(scope="function")
+def data_factory():
+    """
+    Seed the data a test needs through the application's test data API
+    (one request per create() call) and delete it after the test.
+    """
+    factory = DataFactory()
+    yield factory
+    factory.cleanup()
 
 
 def pytest_configure(config):
     """
     Configure pytest with custom markers.
+    Also fixes the run id before xdist workers start, so every worker
+    inherits it and names its resources after the same run.
+    Command line config overrides are applied before any test module
+    reads ReadConfig (xdist workers receive the same options).
     """
+    WorkerContext.run_id()
+
+    overrides = {}
+    for assignment in config.getoption("--config-set"):
+        name, separator, value = assignment.partition("=")
+        if not separator:
+            raise pytest.UsageError(f"--config-set expects SETTING=VALUE, got '{assignment}'")
+        overrides[name.strip()] = value.strip()
+    if config.getoption("--app-url"):
+        overrides["base_url"] = config.getoption("--app-url")
+    if config.getoption("--app-urls"):
+        overrides["base_urls"] = config.getoption("--app-urls")
+    if overrides or config.getoption("--config-profile"):
+        try:
+            ReadConfig.configure(config.getoption("--config-profile"), overrides)
+        except ValueError as error:
+            raise pytest.UsageError(str(error))
+
+    # HTTP proxy in front of the application: one per process running tests
+    # (each xdist worker), so every request is attributed to the running test.
+    # A recording is cleared once, by the controller, before workers start.
+    # Fault rules for the whole run ([proxy] faults) imply an observe proxy.
+    proxy_mode = config.getoption("--proxy-mode") or ("observe" if ReadConfig.get_proxy_faults() else None)
+    if proxy_mode:
+        try:
+            FaultPlan.run_rules()
+        except ValueError as error:
+            raise pytest.UsageError(str(error))
+        if not hasattr(config, "workerinput"):
+            config.pluginmanager.register(HttpProxyPlugin(proxy_mode, config.getoption("--proxy-store")),
+                                          "http_proxy")
+            if proxy_mode == "record":
+                store = ReplayStore(config.getoption("--proxy-store"))
+                store.clear(ReadConfig.get_base_url())
+                store.close()
+        if runs_tests(config):
+            proxy = HttpProxy(proxy_mode, store=config.getoption("--proxy-store"), port=0)
+            overrides["base_url"] = proxy.start_background()
+            ReadConfig.configure(config.getoption("--config-profile"), overrides)
+
+    # Budgets are checked and results stored once, in the controller
+    # (xdist workers only report)
+    if not hasattr(config, "workerinput"):
+        try:
+            budget = PerfBudget.load(config.getoption("--perf-budget"))
+        except ValueError as error:
+            raise pytest.UsageError(str(error))
+        if config.getoption("--perf-budget-mode"):
+            budget.mode = config.getoption("--perf-budget-mode")
+        config.pluginmanager.register(PerfBudgetPlugin(budget), "perf_budget")
+        if not config.getoption("--no-results-db"):
+            config.pluginmanager.register(
+                ResultsRecorder(config.getoption("--results-db"),
+                                ",".join(ReadConfig.get_base_urls()) or ReadConfig.get_base_url()),
+                "results_recorder"
+            )
+
+        # Sharded runs: one application instance per worker (workers past the
+        # last instance would share one and its registrations), and each
+        # duration-balanced shard kept on one worker
+        if is_sharded(config) and config.option.numprocesses > len(ReadConfig.get_base_urls()):
+            raise pytest.UsageError(
+                f"{config.option.numprocesses} workers but only {len(ReadConfig.get_base_urls())} "
+                f"application instances in --app-urls/baseUrls; use -n {len(ReadConfig.get_base_urls())} "
+                f"or start more instances"
+            )
+        if is_sharded(config) and getattr(config.option, "dist", "no") == "load":
+            config.option.dist = "loadgroup"
+
     config.addinivalue_line(
         "markers", "smoke: mark test as smoke test"
     )
@@ -104,3 +383,172 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "registration: mark test as registration test"
     )
+    config.addinivalue_line(
+        "markers", "browserless: test only needs server-rendered HTML (runs on HtmlDriver)"
+    )
+    config.addinivalue_line(
+        "markers", "stress: concurrency stress test, enabled with --stress-users N"
+    )
+    config.addinivalue_line(
+        "markers", "network(profile): block requests during the test (full, no-third-party, lean, bare)"
+    )
+    config.addinivalue_line(
+        "markers", "faults(*rules, **rule): degrade the app's responses through the HTTP proxy "
+                   "([fault:NAME] rules of config.ini and/or one inline rule)"
+    )
+
+
+def runs_tests(config):
+    """
+    Check whether this process runs tests (an xdist worker, or a run without workers).
+    """
+    return hasattr(config, "workerinput") or not getattr(config.option, "numprocesses", None)
+
+
+def pytest_unconfigure(config):
+    """
+    Stop the HTTP proxy of this process.
+    """
+    if HttpProxy.current:
+        HttpProxy.current.stop()
+
+
+def is_sharded(config):
+    """
+    Check whether the run is spread across several application instances.
+    """
+    workers = (config.workerinput["workercount"] if hasattr(config, "workerinput")
+               else getattr(config.option, "numprocesses", None))
+    return bool(workers) and len(ReadConfig.get_base_urls()) > 1
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Sharded runs: split the tests into one shard per worker, balanced by
+    their historical durations, and pin each shard to a single worker
+    (xdist_group, dispatched with --dist loadgroup).
+    """
+    if not hasattr(config, "workerinput") or not is_sharded(config):
+        return
+    workers = config.workerinput["workercount"]
+    planner = ShardPlanner.from_history(config.getoption("--results-db"))
+    plan = planner.partition([item.nodeid for item in items], workers)
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(f"shard{plan[item.nodeid]}"))
+    if WorkerContext.worker_index() == 0:
+        loads = ", ".join(f"{load / 1000:.0f}s" for load in planner.loads(plan, workers))
+        CustomLogger.get_logger().info(
+            f"Sharded {len(items)} tests across {workers} workers and "
+            f"{len(ReadConfig.get_base_urls())} instances (expected {loads})"
+        )
+
+
+@pytest.hookimpl(tryfirst=True, optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """
+    Schedule --dist load runs longest test first, using the durations of
+    previous runs (tests without history get their module's median).
+    """
+    if getattr(config.option, "dist", "no") != "load" or config.getoption("--no-duration-schedule"):
+        return None
+    return DurationScheduling(config, log, ShardPlanner.from_history(config.getoption("--results-db")))
+
+
+def pytest_runtest_setup(item):
+    """
+    Attach browser metrics captured by the page objects (and the requests
+    seen by the HTTP proxy) to the running test, and put the test's fault
+    rules (marker 'faults', then [proxy] faults) in effect on the proxy.
+    Tests marked 'faults' are skipped when the run has no proxy.
+    """
+    PerfMetrics.start_test(item.nodeid)
+    if HttpProxy.current:
+        HttpProxy.current.stats.start_test(item.nodeid)
+        HttpProxy.current.faults.use(FaultPlan.for_item(item))
+    elif item.get_closest_marker("faults"):
+        pytest.skip("Fault injection runs behind the HTTP proxy (use --proxy-mode observe)")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """
+    Trace the test body as the outermost span of its page object steps.
+    Skips and expected failures (pytest.xfail() or an xfail marker whose
+    raises= matches) are not recorded as failed.
+    """
+    with StepTracer.span("test", nodeid=item.nodeid) as span:
+        outcome = yield
+        if outcome.excinfo:
+            error = outcome.excinfo[1]
+            span.outcome = StepTracer.outcome_of(error)
+            span.error = f"{outcome.excinfo[0].__name__}: {error}"
+            if span.outcome == "failed" and expects_failure(item, error):
+                span.outcome = "xfailed"
+
+
+def expects_failure(item, error):
+    """
+    Check whether an xfail marker of the test expects this error: a marker
+    without conditions or with a true one, whose raises= (if any) matches.
+    String conditions are not evaluated here and count as true.
+    """
+    for marker in item.iter_markers(name="xfail"):
+        conditions = marker.args or ((marker.kwargs["condition"],) if "condition" in marker.kwargs else ())
+        if conditions and not any(isinstance(condition, str) or condition for condition in conditions):
+            continue
+        raises = marker.kwargs.get("raises")
+        if raises is None or isinstance(error, raises):
+            return True
+    return False
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Add the step timings, browser metrics and server timings of a test to
+    its report (user properties, 'browser metrics' and 'server timings' sections).
+    """
+    outcome = yield
+    report = outcome.get_result()
+    if report.when != "call":
+        return
+    steps = PerfMetrics.steps()
+    if steps:
+        report.user_properties.append(("step_timings", steps))
+    records = PerfMetrics.records()
+    if records:
+        report.user_properties.append(("browser_metrics", records))
+        report.sections.append(("browser metrics", PerfMetrics.summary(records)))
+    if HttpProxy.current:
+        requests, peak_in_flight = HttpProxy.current.stats.take()
+        if requests:
+            report.user_properties.append(("server_timings", requests))
+            report.sections.append(("server timings", ProxyStats.summary(requests, peak_in_flight)))
+
+
+def pytest_runtest_teardown(item):
+    """
+    Detach the metrics recorder once the test is finished.
+    Requests between tests get the fault rules of the run only.
+    """
+    PerfMetrics.finish_test()
+    if HttpProxy.current:
+        HttpProxy.current.faults.use(FaultPlan.run_rules())
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    """
+    Flush the background log writers; the controller then merges the
+    per-worker text and event logs into test_log_<run>.log / events_<run>.jsonl
+    and applies the [logging] retention policy to earlier runs.
+    Pending HAR files are written first, as they log their summaries.
+    """
+    HarRecorder.shutdown()
+    CustomLogger.shutdown()
+    if not hasattr(session.config, "workerinput"):
+        CustomLogger.merge_worker_logs()
+        CustomLogger.merge_worker_events()
+        if not session.config.option.collectonly:
+            LogArchive().apply_retention()
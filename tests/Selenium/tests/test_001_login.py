@@ -13,7 +13,6 @@ Related Test Cases: TC-AUTH-001 to TC-AUTH-008
 import pytest
 import sys
 import os
-from time import sleep
 
 # Add parent directories to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -42,6 +41,7 @@ class Test_001_Login:
     
     @pytest.mark.smoke
     @pytest.mark.authentication
+    @pytest.mark.browserless
     def test_TC_AUTH_VIEW_001_login_page_accessible(self, setup):
         """
         TC-AUTH-VIEW-001: Verify login page is accessible.
@@ -52,13 +52,12 @@ class Test_001_Login:
         self.logger.info("*** Test TC-AUTH-VIEW-001: Login Page Accessible ***")
         self.driver = setup
         
-        # Navigate to login page
-        self.driver.get(self.base_url + "/login")
-        sleep(2)
-        
         # Initialize page object
         login_page = LoginPage(self.driver)
         
+        # Navigate to login page
+        login_page.open(self.base_url + "/login")
+        
         # Verify login page is displayed
         assert login_page.is_login_page(), "Login page should be displayed"
         assert login_page.is_brand_visible(), "Brand should be visible"
@@ -67,6 +66,7 @@ class Test_001_Login:
     
     @pytest.mark.smoke
     @pytest.mark.authentication
+    @pytest.mark.network("lean")
     def test_TC_AUTH_001_valid_admin_login(self, setup):
         """
         TC-AUTH-001: Valid Login - Admin User
@@ -78,16 +78,14 @@ class Test_001_Login:
         self.logger.info("*** Test TC-AUTH-001: Valid Admin Login ***")
         self.driver = setup
         
-        # Navigate to login page
-        self.driver.get(self.base_url + "/login")
-        sleep(2)
-        
         # Initialize page object
         login_page = LoginPage(self.driver)
         
+        # Navigate to login page
+        login_page.open(self.base_url + "/login")
+        
         # Perform login
         login_page.login(self.admin_email, self.admin_password)
-        sleep(3)
         
         # Verify redirect to admin events page
         current_url = self.driver.current_url
@@ -98,6 +96,7 @@ class Test_001_Login:
     
     @pytest.mark.smoke
     @pytest.mark.authentication
+    @pytest.mark.network("lean")
     def test_TC_AUTH_002_valid_user_login(self, setup):
         """
         TC-AUTH-002: Valid Login - Regular User
@@ -109,16 +108,14 @@ class Test_001_Login:
         self.logger.info("*** Test TC-AUTH-002: Valid User Login ***")
         self.driver = setup
         
-        # Navigate to login page
-        self.driver.get(self.base_url + "/login")
-        sleep(2)
-        
         # Initialize page object
         login_page = LoginPage(self.driver)
         
+        # Navigate to login page
+        login_page.open(self.base_url + "/login")
+        
         # Perform login
         login_page.login(self.user_email, self.user_password)
-        sleep(3)
         
         # Verify redirect to home page
         current_url = self.driver.current_url
@@ -128,6 +125,7 @@ class Test_001_Login:
         self.logger.info("*** Test TC-AUTH-002: PASSED ***")
     
     @pytest.mark.authentication
+    @pytest.mark.browserless
     def test_TC_AUTH_003_invalid_login_wrong_password(self, setup):
         """
         TC-AUTH-003: Invalid Login - Wrong Password
@@ -138,16 +136,14 @@ class Test_001_Login:
         self.logger.info("*** Test TC-AUTH-003: Invalid Login - Wrong Password ***")
         self.driver = setup
         
-        # Navigate to login page
-        self.driver.get(self.base_url + "/login")
-        sleep(2)
-        
         # Initialize page object
         login_page = LoginPage(self.driver)
         
+        # Navigate to login page
+        login_page.open(self.base_url + "/login")
+        
         # Attempt login with wrong password
         login_page.login(self.admin_email, "wrongpassword123")
-        sleep(2)
         
         # Verify error is displayed
         assert login_page.is_error_displayed(), "Error message should be displayed"
@@ -160,6 +156,7 @@ class Test_001_Login:
         self.logger.info("*** Test TC-AUTH-003: PASSED ***")
     
     @pytest.mark.authentication
+    @pytest.mark.browserless
     def test_TC_AUTH_004_invalid_login_nonexistent_email(self, setup):
         """
         TC-AUTH-004: Invalid Login - Non-existent Email
@@ -170,16 +167,14 @@ class Test_001_Login:
         self.logger.info("*** Test TC-AUTH-004: Invalid Login - Non-existent Email ***")
         self.driver = setup
         
-        # Navigate to login page
-        self.driver.get(self.base_url + "/login")
-        sleep(2)
-        
         # Initialize page object
         login_page = LoginPage(self.driver)
         
+        # Navigate to login page
+        login_page.open(self.base_url + "/login")
+        
         # Attempt login with non-existent email
         login_page.login("nonexistent@notreal.com", "anypassword")
-        sleep(2)
         
         # Verify error is displayed or still on login page
         assert login_page.is_login_page() or login_page.is_error_displayed(), \
@@ -188,6 +183,7 @@ class Test_001_Login:
         self.logger.info("*** Test TC-AUTH-004: PASSED ***")
     
     @pytest.mark.authentication
+    @pytest.mark.network("lean")
     def test_TC_AUTH_006_invalid_email_format(self, setup):
         """
         TC-AUTH-006: Invalid Login - Invalid Email Format
@@ -198,16 +194,14 @@ class Test_001_Login:
         self.logger.info("*** Test TC-AUTH-006: Invalid Email Format ***")
         self.driver = setup
         
-        # Navigate to login page
-        self.driver.get(self.base_url + "/login")
-        sleep(2)
-        
         # Initialize page object
         login_page = LoginPage(self.driver)
         
+        # Navigate to login page
+        login_page.open(self.base_url + "/login")
+        
         # Attempt login with invalid email format
         login_page.login("notanemail", "password123")
-        sleep(2)
         
         # Browser should block submission or show error
         # Either still on login page or error displayed
@@ -13,9 +13,7 @@ Related Test Cases: TC-AUTH-010 to TC-AUTH-016
 import pytest
 import sys
 import os
-from time import sleep
-import random
-import string
+import uuid
 
 # Add parent directories to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -24,12 +22,13 @@ from pages.RegisterPage import RegisterPage
 from pages.LoginPage import LoginPage
 from utilities.readProperties import ReadConfig
 from utilities.customLogger import CustomLogger
+from utilities.workerContext import WorkerContext
 
 
 def generate_random_email():
-    """Generate a random email for testing."""
-    random_string = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
-    return f"test_{random_string}@selenium.test"
+    """Generate a random email for testing, unique across runs and xdist workers."""
+    random_string = uuid.uuid4().hex[:12]
+    return f"test_{WorkerContext.worker_id()}_{random_string}@selenium.test"
 
 
 class Test_002_Registration:
@@ -48,6 +47,7 @@ class Test_002_Registration:
     
     @pytest.mark.smoke
     @pytest.mark.authentication
+    @pytest.mark.browserless
     def test_TC_AUTH_VIEW_002_register_page_accessible(self, setup):
         """
         TC-AUTH-VIEW-002: Verify register page is accessible.
@@ -58,13 +58,12 @@ class Test_002_Registration:
         self.logger.info("*** Test TC-AUTH-VIEW-002: Register Page Accessible ***")
         self.driver = setup
         
-        # Navigate to register page
-        self.driver.get(self.base_url + "/register")
-        sleep(2)
-        
         # Initialize page object
         register_page = RegisterPage(self.driver)
         
+        # Navigate to register page
+        register_page.open(self.base_url + "/register")
+        
         # Verify register page is displayed
         assert register_page.is_register_page(), "Registration page should be displayed"
         
@@ -72,6 +71,7 @@ class Test_002_Registration:
     
     @pytest.mark.smoke
     @pytest.mark.authentication
+    @pytest.mark.network("lean")
     def test_TC_AUTH_010_valid_registration(self, setup):
         """
         TC-AUTH-010: Valid Registration
@@ -83,13 +83,12 @@ class Test_002_Registration:
         self.logger.info("*** Test TC-AUTH-010: Valid Registration ***")
         self.driver = setup
         
-        # Navigate to register page
-        self.driver.get(self.base_url + "/register")
-        sleep(2)
-        
         # Initialize page object
         register_page = RegisterPage(self.driver)
         
+        # Navigate to register page
+        register_page.open(self.base_url + "/register")
+        
         # Generate unique email
         test_email = generate_random_email()
         
@@ -99,7 +98,6 @@ class Test_002_Registration:
             email=test_email,
             password=self.test_password
         )
-        sleep(3)
         
         # Verify redirect to login page
         current_url = self.driver.current_url
@@ -114,6 +112,7 @@ class Test_002_Registration:
         self.logger.info("*** Test TC-AUTH-010: PASSED ***")
     
     @pytest.mark.authentication
+    @pytest.mark.network("lean")
     def test_TC_AUTH_012_password_mismatch(self, setup):
         """
         TC-AUTH-012: Registration - Password Mismatch
@@ -124,13 +123,12 @@ class Test_002_Registration:
         self.logger.info("*** Test TC-AUTH-012: Password Mismatch ***")
         self.driver = setup
         
-        # Navigate to register page
-        self.driver.get(self.base_url + "/register")
-        sleep(2)
-        
         # Initialize page object
         register_page = RegisterPage(self.driver)
         
+        # Navigate to register page
+        register_page.open(self.base_url + "/register")
+        
         # Generate unique email
         test_email = generate_random_email()
         
@@ -141,7 +139,6 @@ class Test_002_Registration:
             password="password123",
             password_confirm="differentpassword"
         )
-        sleep(2)
         
         # Verify error is displayed or still on register page
         assert register_page.is_register_page() or register_page.is_error_displayed(), \
@@ -150,6 +147,7 @@ class Test_002_Registration:
         self.logger.info("*** Test TC-AUTH-012: PASSED ***")
     
     @pytest.mark.authentication
+    @pytest.mark.network("lean")
     def test_TC_AUTH_013_password_too_short(self, setup):
         """
         TC-AUTH-013: Registration - Password Too Short
@@ -160,13 +158,12 @@ class Test_002_Registration:
         self.logger.info("*** Test TC-AUTH-013: Password Too Short ***")
         self.driver = setup
         
-        # Navigate to register page
-        self.driver.get(self.base_url + "/register")
-        sleep(2)
-        
         # Initialize page object
         register_page = RegisterPage(self.driver)
         
+        # Navigate to register page
+        register_page.open(self.base_url + "/register")
+        
         # Generate unique email
         test_email = generate_random_email()
         
@@ -176,7 +173,6 @@ class Test_002_Registration:
             email=test_email,
             password="pass123"  # 7 characters
         )
-        sleep(2)
         
         # Verify error is displayed or still on register page
         assert register_page.is_register_page() or register_page.has_field_errors(), \
@@ -185,6 +181,7 @@ class Test_002_Registration:
         self.logger.info("*** Test TC-AUTH-013: PASSED ***")
     
     @pytest.mark.authentication
+    @pytest.mark.network("lean")
     def test_TC_AUTH_014_password_at_minimum(self, setup):
         """
         TC-AUTH-014: Registration - Password At Minimum Length
@@ -195,13 +192,12 @@ class Test_002_Registration:
         self.logger.info("*** Test TC-AUTH-014: Password At Minimum Length ***")
         self.driver = setup
         
-        # Navigate to register page
-        self.driver.get(self.base_url + "/register")
-        sleep(2)
-        
         # Initialize page object
         register_page = RegisterPage(self.driver)
         
+        # Navigate to register page
+        register_page.open(self.base_url + "/register")
+        
         # Generate unique email
         test_email = generate_random_email()
         
@@ -211,7 +207,6 @@ class Test_002_Registration:
             email=test_email,
             password="pass1234"  # Exactly 8 characters
         )
-        sleep(3)
         
         # Verify redirect to login page (success)
         current_url = self.driver.current_url
@@ -221,6 +216,7 @@ class Test_002_Registration:
         self.logger.info("*** Test TC-AUTH-014: PASSED ***")
     
     @pytest.mark.authentication
+    @pytest.mark.network("lean")
     def test_TC_AUTH_015_empty_name(self, setup):
         """
         TC-AUTH-015: Registration - Empty Name
@@ -231,13 +227,12 @@ class Test_002_Registration:
         self.logger.info("*** Test TC-AUTH-015: Empty Name ***")
         self.driver = setup
         
-        # Navigate to register page
-        self.driver.get(self.base_url + "/register")
-        sleep(2)
-        
         # Initialize page object
         register_page = RegisterPage(self.driver)
         
+        # Navigate to register page
+        register_page.open(self.base_url + "/register")
+        
         # Generate unique email
         test_email = generate_random_email()
         
@@ -247,7 +242,6 @@ class Test_002_Registration:
             email=test_email,
             password=self.test_password
         )
-        sleep(2)
         
         # Verify still on register page (browser validation or server validation)
         current_url = self.driver.current_url
@@ -257,6 +251,7 @@ class Test_002_Registration:
         self.logger.info("*** Test TC-AUTH-015: PASSED ***")
     
     @pytest.mark.authentication
+    @pytest.mark.network("lean")
     def test_TC_AUTH_NAVIGATE_login_link(self, setup):
         """
         TC-AUTH-NAVIGATE: Navigation from Register to Login
@@ -267,16 +262,14 @@ class Test_002_Registration:
         self.logger.info("*** Test TC-AUTH-NAVIGATE: Register to Login Navigation ***")
         self.driver = setup
         
-        # Navigate to register page
-        self.driver.get(self.base_url + "/register")
-        sleep(2)
-        
         # Initialize page object
         register_page = RegisterPage(self.driver)
         
+        # Navigate to register page
+        register_page.open(self.base_url + "/register")
+        
         # Click login link
         register_page.click_login_link()
-        sleep(2)
         
         # Verify on login page
         login_page = LoginPage(self.driver)
@@ -13,16 +13,15 @@ Related Test Cases: TC-EVT-001 to TC-EVT-030
 import pytest
 import sys
 import os
-from time import sleep
 
 # Add parent directories to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from pages.LoginPage import LoginPage
 from pages.HomePage import HomePage
 from pages.EventDetailsPage import EventDetailsPage
 from utilities.readProperties import ReadConfig
 from utilities.customLogger import CustomLogger
+from utilities.sessionCache import SessionCache
 
 
 class Test_003_Events:
@@ -33,14 +32,13 @@ class Test_003_Events:
     
     # Configuration
     base_url = ReadConfig.get_base_url()
-    user_email = ReadConfig.get_user_email()
-    user_password = ReadConfig.get_user_password()
     
     # Logger
     logger = CustomLogger.get_logger()
     
     @pytest.mark.smoke
     @pytest.mark.events
+    @pytest.mark.browserless
     def test_TC_EVT_001_public_events_listing(self, setup):
         """
         TC-EVT-001: View Public Events - Only Active Events Displayed
@@ -51,13 +49,12 @@ class Test_003_Events:
         self.logger.info("*** Test TC-EVT-001: Public Events Listing ***")
         self.driver = setup
         
-        # Navigate to home page
-        self.driver.get(self.base_url + "/home")
-        sleep(3)
-        
         # Initialize page object
         home_page = HomePage(self.driver)
         
+        # Navigate to home page
+        home_page.open(self.base_url + "/home")
+        
         # Verify events are displayed (or no events message)
         event_count = home_page.get_event_count()
         self.logger.info(f"Found {event_count} events on home page")
@@ -69,6 +66,7 @@ class Test_003_Events:
         self.logger.info("*** Test TC-EVT-001: PASSED ***")
     
     @pytest.mark.events
+    @pytest.mark.browserless
     def test_TC_EVT_010_search_by_title(self, setup):
         """
         TC-EVT-010: Search Events by Title
@@ -80,13 +78,12 @@ class Test_003_Events:
         self.logger.info("*** Test TC-EVT-010: Search Events by Title ***")
         self.driver = setup
         
-        # Navigate to home page
-        self.driver.get(self.base_url + "/home")
-        sleep(3)
-        
         # Initialize page object
         home_page = HomePage(self.driver)
         
+        # Navigate to home page
+        home_page.open(self.base_url + "/home")
+        
         # Get initial event count
         initial_count = home_page.get_event_count()
         self.logger.info(f"Initial event count: {initial_count}")
@@ -100,7 +97,6 @@ class Test_003_Events:
                 
                 # Perform search
                 home_page.search_events(search_term)
-                sleep(2)
                 
                 # Verify search was performed (URL contains search param)
                 current_url = self.driver.current_url
@@ -111,6 +107,7 @@ class Test_003_Events:
         self.logger.info("*** Test TC-EVT-010: PASSED ***")
     
     @pytest.mark.events
+    @pytest.mark.browserless
     def test_TC_EVT_012_search_no_results(self, setup):
         """
         TC-EVT-012: Search Returns No Results
@@ -121,16 +118,14 @@ class Test_003_Events:
         self.logger.info("*** Test TC-EVT-012: Search No Results ***")
         self.driver = setup
         
-        # Navigate to home page
-        self.driver.get(self.base_url + "/home")
-        sleep(2)
-        
         # Initialize page object
         home_page = HomePage(self.driver)
         
+        # Navigate to home page
+        home_page.open(self.base_url + "/home")
+        
         # Search for non-existent term
         home_page.search_events("xyznonexistent123abc")
-        sleep(2)
         
         # Verify no events displayed
         event_count = home_page.get_event_count()
@@ -140,52 +135,52 @@ class Test_003_Events:
         self.logger.info("*** Test TC-EVT-012: PASSED ***")
     
     @pytest.mark.events
-    def test_TC_EVT_030_view_event_details(self, setup):
+    @pytest.mark.network("lean")
+    def test_TC_EVT_030_view_event_details(self, setup, data_factory):
         """
         TC-EVT-030: View Event Details
         
         Technique: Use Case Testing
-        Preconditions: At least one event exists
+        Preconditions: A seeded active event
         Expected: Event details page shows title, description, place, etc.
         """
         self.logger.info("*** Test TC-EVT-030: View Event Details ***")
         self.driver = setup
         
-        # Navigate to home page
-        self.driver.get(self.base_url + "/home")
-        sleep(3)
+        # Seed the event to view
+        event = data_factory.event(description="Seeded event for TC-EVT-030", place="Room 30")
+        data_factory.create()
         
         # Initialize page object
         home_page = HomePage(self.driver)
         
-        # Check if there are events
-        event_count = home_page.get_event_count()
+        # Navigate to home page and find the seeded event
+        home_page.open(self.base_url + "/home")
+        home_page.search_events(event.title)
+        assert home_page.get_event_count() > 0, \
+            f"Seeded event '{event.title}' should be listed"
         
-        if event_count > 0:
-            # Click first event
-            home_page.click_first_event()
-            sleep(3)
-            
-            # Initialize event details page
-            event_details = EventDetailsPage(self.driver)
-            
-            # Verify event details page is displayed
-            assert event_details.is_event_details_page(), \
-                "Event details page should be displayed"
-            
-            # Verify title is present
-            title = event_details.get_event_title()
-            assert title is not None and len(title) > 0, \
-                "Event title should be displayed"
-            
-            self.logger.info(f"Viewing event: {title}")
-        else:
-            self.logger.info("No events available to test")
-            pytest.skip("No events available in database")
+        # Click first event
+        home_page.click_first_event()
+        
+        # Initialize event details page
+        event_details = EventDetailsPage(self.driver)
+        
+        # Verify event details page is displayed
+        assert event_details.is_event_details_page(), \
+            "Event details page should be displayed"
+        
+        # Verify title is present
+        title = event_details.get_event_title()
+        assert title == event.title, \
+            f"Event title should be '{event.title}', got: {title}"
+        
+        self.logger.info(f"Viewing event: {title}")
         
         self.logger.info("*** Test TC-EVT-030: PASSED ***")
     
     @pytest.mark.events
+    @pytest.mark.browserless
     def test_TC_EVT_HOME_not_logged_in(self, setup):
         """
         TC-EVT-HOME: Home page accessible without login
@@ -196,13 +191,12 @@ class Test_003_Events:
         self.logger.info("*** Test TC-EVT-HOME: Public Access ***")
         self.driver = setup
         
-        # Navigate directly to home (without login)
-        self.driver.get(self.base_url + "/home")
-        sleep(3)
-        
         # Initialize page object
         home_page = HomePage(self.driver)
         
+        # Navigate directly to home (without login)
+        home_page.open(self.base_url + "/home")
+        
         # Verify login link is visible (user not logged in)
         assert home_page.is_login_link_visible() or not home_page.is_user_logged_in(), \
             "Should be able to access home page without login"
@@ -210,6 +204,7 @@ class Test_003_Events:
         self.logger.info("*** Test TC-EVT-HOME: PASSED ***")
     
     @pytest.mark.events
+    @pytest.mark.network("lean")
     def test_TC_EVT_USER_logged_in_view(self, setup):
         """
         TC-EVT-USER: Logged in user can view events
@@ -220,21 +215,15 @@ class Test_003_Events:
         self.logger.info("*** Test TC-EVT-USER: Logged In Event View ***")
         self.driver = setup
         
-        # Login first
-        self.driver.get(self.base_url + "/login")
-        sleep(2)
-        
-        login_page = LoginPage(self.driver)
-        login_page.login(self.user_email, self.user_password)
-        sleep(3)
-        
-        # Navigate to home
-        self.driver.get(self.base_url + "/home")
-        sleep(2)
+        # Login first (cached session cookies)
+        SessionCache.restore(self.driver, "user")
         
         # Initialize page object
         home_page = HomePage(self.driver)
         
+        # Navigate to home
+        home_page.open(self.base_url + "/home")
+        
         # Verify user is logged in
         assert home_page.is_user_logged_in() or not home_page.is_login_link_visible(), \
             "User should be logged in"
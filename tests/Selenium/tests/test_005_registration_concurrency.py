@@ -0,0 +1,177 @@
+"""
+Concurrent Registration Stress Tests for AAB_EventPlanner.
+Fires simultaneous authenticated registrations at one seeded, nearly full
+event and checks that the event capacity is never exceeded.
+
+Test Level: System
+Test Type: Non-Functional (Concurrency / Performance)
+Technique: Stress Testing, Boundary Value Analysis (capacity limit)
+
+Related Test Cases: TC-REG-020
+Run with: pytest -m stress --stress-users 50
+"""
+
+import pytest
+import re
+import sys
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import lxml.html
+import requests
+
+# Add parent directories to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pages.EventDetailsPage import EventDetailsPage
+from utilities.customLogger import CustomLogger
+from utilities.htmlDriver import locator_to_xpath
+from utilities.httpLogin import HttpLogin
+from utilities.perfBudget import PerfBudget
+
+
+# "12 / 50 registered" line rendered on the event page when a capacity is set
+CAPACITY_PATTERN = re.compile(r"(\d+)\s*/\s*(\d+)\s*registered")
+
+# Places of the seeded event already taken by placeholder users
+SEEDED_REGISTERED = 10
+
+
+class Test_005_RegistrationConcurrency:
+    """
+    Test class for concurrent registrations on a single event.
+    Each simulated user is a seeded account with its own pooled HTTP session (HttpLogin).
+    """
+
+    # Logger
+    logger = CustomLogger.get_logger()
+
+    def read_event(self, session, event_url):
+        """
+        Load an event page and read its registration state.
+
+        Args:
+            session: requests.Session
+            event_url: Absolute event URL
+
+        Returns:
+            dict: registered, capacity, registered_by_me, token (CSRF of the page)
+        """
+        response = session.get(event_url, timeout=HttpLogin.TIMEOUT)
+        response.raise_for_status()
+        document = lxml.html.document_fromstring(response.content)
+        match = CAPACITY_PATTERN.search(document.text_content())
+        token = HttpLogin.CSRF_PATTERN.search(response.text)
+        return {
+            "registered": int(match.group(1)) if match else None,
+            "capacity": int(match.group(2)) if match else None,
+            "registered_by_me": bool(document.xpath(locator_to_xpath(*EventDetailsPage.UNREGISTER_BUTTON))),
+            "token": token.group(1) if token else None,
+        }
+
+    def mint_session(self, account):
+        """
+        Log a seeded account in over HTTP.
+
+        Args:
+            account: Seeded user
+
+        Returns:
+            requests.Session: Authenticated session
+        """
+        return HttpLogin.open_session(account.email, account.password)
+
+    @pytest.mark.stress
+    @pytest.mark.registration
+    def test_TC_REG_020_concurrent_registrations_respect_capacity(self, request, record_property, data_factory):
+        """
+        TC-REG-020: Concurrent Registrations Never Exceed Capacity
+
+        Technique: Stress Testing, Boundary Value Analysis
+        Preconditions: Seeded nearly full event and one seeded account per user
+        Expected: N simultaneous registrations accept at most the free places,
+                  the registered count never exceeds the capacity and every
+                  accepted registration is counted exactly once
+        """
+        self.logger.info("*** Test TC-REG-020: Concurrent Registrations ***")
+        users = request.config.getoption("--stress-users")
+        if users <= 0:
+            pytest.skip("Stress mode disabled (use --stress-users N)")
+
+        # Fewer free places than users, so registrations compete for the last places
+        open_places = max(1, users // 2)
+        event = data_factory.event(capacity=SEEDED_REGISTERED + open_places, registered=SEEDED_REGISTERED)
+        accounts = [data_factory.user() for _ in range(users)]
+        data_factory.create()
+        event_url = event.url
+
+        observer = HttpLogin.new_session()
+        before = self.read_event(observer, event_url)
+        self.logger.info(
+            f"Target {event_url}: {before['registered']} / {before['capacity']} registered, "
+            f"{users} concurrent users"
+        )
+
+        # Mint sessions and fetch each user's CSRF token before the burst
+        with ThreadPoolExecutor(max_workers=min(users, 32)) as executor:
+            sessions = list(executor.map(self.mint_session, accounts))
+            tokens = list(executor.map(lambda session: self.read_event(session, event_url)["token"], sessions))
+
+        barrier = threading.Barrier(users)
+        results = [None] * users
+
+        def register(index):
+            barrier.wait()
+            started = time.perf_counter()
+            try:
+                status = sessions[index].post(
+                    event_url + "/register",
+                    data={"_token": tokens[index]},
+                    allow_redirects=False,
+                    timeout=HttpLogin.TIMEOUT
+                ).status_code
+            except requests.RequestException:
+                status = 0
+            results[index] = (status, time.perf_counter() - started)
+
+        burst_started = time.perf_counter()
+        threads = [threading.Thread(target=register, args=(index,)) for index in range(users)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        burst_time = time.perf_counter() - burst_started
+
+        accepted = [session for session in sessions if self.read_event(session, event_url)["registered_by_me"]]
+        after = self.read_event(observer, event_url)
+
+        latencies = [seconds * 1000 for _, seconds in results]
+        summary = {
+            "users": users,
+            "capacity": before["capacity"],
+            "registered_before": before["registered"],
+            "registered_after": after["registered"],
+            "accepted": len(accepted),
+            "server_errors": sum(1 for status, _ in results if status == 0 or status >= 500),
+            "throughput_rps": round(users / burst_time, 1),
+            "p50_ms": round(PerfBudget.percentile(latencies, 50), 1),
+            "p95_ms": round(PerfBudget.percentile(latencies, 95), 1),
+            "p99_ms": round(PerfBudget.percentile(latencies, 99), 1),
+            "max_ms": round(max(latencies), 1),
+        }
+        record_property("stress_registration", summary)
+        self.logger.info(f"Concurrent registration results: {summary}")
+
+        free_places = before["capacity"] - before["registered"]
+        assert summary["server_errors"] == 0, \
+            f"{summary['server_errors']} registrations failed with a server error"
+        assert after["registered"] <= after["capacity"], \
+            f"Capacity exceeded: {after['registered']} / {after['capacity']} registered"
+        assert len(accepted) <= free_places, \
+            f"{len(accepted)} registrations accepted for {free_places} free places"
+        assert after["registered"] - before["registered"] == len(accepted), \
+            "Registered count does not match the accepted registrations"
+
+        self.logger.info("*** Test TC-REG-020: PASSED ***")
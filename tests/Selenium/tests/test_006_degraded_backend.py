@@ -0,0 +1,225 @@
+"""
+Degraded Backend Tests for AAB_EventPlanner.
+Runs page object flows behind the HTTP proxy with injected latency, bandwidth
+caps, 5xx bursts and dropped connections, and checks that the waits in
+BasePage still succeed, return as soon as the page is ready and respect
+their timeouts.
+
+Test Level: System
+Test Type: Non-Functional (Robustness / Performance)
+Pattern: Page Object Model (POM)
+Technique: Fault Injection, Boundary Value Analysis (wait timeouts)
+
+Related Test Cases: TC-FLT-001 to TC-FLT-006
+Run with: pytest tests/test_006_degraded_backend.py --proxy-mode observe
+(skipped without the proxy; the fault rules are in Configurations/config.ini)
+"""
+
+import pytest
+import sys
+import os
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+# Add parent directories to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pages.HomePage import HomePage
+from pages.LoginPage import LoginPage
+from utilities.faultInjection import FaultPlan
+from utilities.httpProxy import HttpProxy
+from utilities.readProperties import ReadConfig
+from utilities.customLogger import CustomLogger
+
+
+# Seconds a flow may take on top of the injected latency (app time, rendering)
+OVERHEAD = 3.0
+
+# Latency of the in-flight request in the network idle test (milliseconds)
+PENDING_REQUEST_MS = 3000
+
+# Network error Edge reports for a connection closed without a response
+# (raised by the driver as "net::ERR_EMPTY_RESPONSE" or shown as its error page)
+DROPPED_CONNECTION_ERROR = "ERR_EMPTY_RESPONSE"
+
+
+class Test_006_DegradedBackend:
+    """
+    Test class for page object waits under a slow or failing application.
+    """
+
+    # Configuration
+    base_url = ReadConfig.get_base_url()
+    user_email = ReadConfig.get_user_email()
+    user_password = ReadConfig.get_user_password()
+
+    # Logger
+    logger = CustomLogger.get_logger()
+
+    @pytest.mark.events
+    @pytest.mark.faults("slow-home")
+    def test_TC_FLT_001_slow_page_load(self, setup):
+        """
+        TC-FLT-001: Page load waits for a slow response
+
+        Technique: Fault Injection (latency on /home)
+        Expected: open() returns once the page is loaded, not before and
+                  not much later than the injected latency
+        """
+        self.logger.info("*** Test TC-FLT-001: Slow Page Load ***")
+        self.driver = setup
+        latency = FaultPlan.rules_for(["slow-home"])[0].latency_ms / 1000
+
+        home_page = HomePage(self.driver)
+        started = time.monotonic()
+        home_page.open(self.base_url + "/home")
+        elapsed = time.monotonic() - started
+
+        assert home_page.get_event_count() > 0 or home_page.no_events_displayed(), \
+            "Home page should be rendered after the slow response"
+        assert latency <= elapsed < latency + OVERHEAD, \
+            f"open() took {elapsed:.1f}s for an injected latency of {latency:.1f}s"
+
+        self.logger.info(f"*** Test TC-FLT-001: PASSED ({elapsed:.1f}s) ***")
+
+    @pytest.mark.authentication
+    @pytest.mark.faults("slow-backend")
+    def test_TC_FLT_002_login_with_slow_backend(self, setup):
+        """
+        TC-FLT-002: Login flow with every request delayed
+
+        Technique: Fault Injection (latency and jitter on all routes)
+        Expected: The navigation wait covers the delayed POST and redirect,
+                  and the user lands on the home page
+        """
+        self.logger.info("*** Test TC-FLT-002: Login With Slow Backend ***")
+        self.driver = setup
+
+        login_page = LoginPage(self.driver)
+        login_page.open(self.base_url + "/login")
+        assert login_page.is_login_page(), "Login page should be displayed"
+
+        assert login_page.login(self.user_email, self.user_password), \
+            "Login should load the next page within the navigation timeout"
+        current_url = self.driver.current_url
+        assert "home" in current_url or "events" in current_url, \
+            f"User should be redirected to home page, got: {current_url}"
+
+        self.logger.info("*** Test TC-FLT-002: PASSED ***")
+
+    @pytest.mark.authentication
+    @pytest.mark.faults("flaky-login")
+    def test_TC_FLT_003_login_after_server_error(self, setup):
+        """
+        TC-FLT-003: Login retried after a 5xx response
+
+        Technique: Fault Injection (503 burst on POST /login)
+        Expected: The failed submission ends on the error page without a
+                  timeout, and a second attempt logs the user in
+        """
+        self.logger.info("*** Test TC-FLT-003: Login After Server Error ***")
+        self.driver = setup
+
+        login_page = LoginPage(self.driver)
+        login_page.open(self.base_url + "/login")
+        started = time.monotonic()
+        assert login_page.login(self.user_email, self.user_password), \
+            "The error response should be loaded as a new page"
+        assert time.monotonic() - started < OVERHEAD, "The error page should not wait for a timeout"
+        assert "Injected fault" in self.driver.page_source, "First login should get the injected error"
+
+        login_page.open(self.base_url + "/login")
+        login_page.login(self.user_email, self.user_password)
+        current_url = self.driver.current_url
+        assert "home" in current_url or "events" in current_url, \
+            f"Second login should redirect to home page, got: {current_url}"
+
+        self.logger.info("*** Test TC-FLT-003: PASSED ***")
+
+    @pytest.mark.events
+    @pytest.mark.faults("dropped-events")
+    def test_TC_FLT_004_dropped_connection(self, setup):
+        """
+        TC-FLT-004: Connection dropped without a response
+
+        Technique: Fault Injection (connection closed on /events/*)
+        Expected: The page load fails fast with Edge's empty response error
+                  instead of hanging until a timeout
+        """
+        self.logger.info("*** Test TC-FLT-004: Dropped Connection ***")
+        self.driver = setup
+
+        home_page = HomePage(self.driver)
+        started = time.monotonic()
+        try:
+            home_page.open(self.base_url + "/events/1")
+            error = self.driver.page_source
+        except WebDriverException as exception:
+            error = str(exception)
+        elapsed = time.monotonic() - started
+
+        assert DROPPED_CONNECTION_ERROR in error, \
+            f"The dropped connection should end in {DROPPED_CONNECTION_ERROR}, got: {error[:200]}"
+        assert elapsed < OVERHEAD, f"A dropped connection took {elapsed:.1f}s to fail"
+
+        self.logger.info("*** Test TC-FLT-004: PASSED ***")
+
+    @pytest.mark.authentication
+    @pytest.mark.faults("narrow-link")
+    def test_TC_FLT_005_bandwidth_cap(self, setup):
+        """
+        TC-FLT-005: Page load over a slow link
+
+        Technique: Fault Injection (bandwidth cap on all routes)
+        Expected: The page is complete when open() returns, which takes at
+                  least its size divided by the bandwidth
+        """
+        self.logger.info("*** Test TC-FLT-005: Bandwidth Cap ***")
+        self.driver = setup
+        bandwidth = FaultPlan.rules_for(["narrow-link"])[0].bandwidth_kbps * 1024
+
+        login_page = LoginPage(self.driver)
+        started = time.monotonic()
+        login_page.open(self.base_url + "/login")
+        elapsed = time.monotonic() - started
+
+        assert login_page.is_login_page(), "Login page should be complete after a throttled load"
+        assert login_page.is_brand_visible(), "Brand should be visible"
+        minimum = 0.9 * len(self.driver.page_source.encode("utf-8")) / bandwidth
+        assert elapsed >= minimum, f"Load took {elapsed:.2f}s, below the {minimum:.2f}s the cap allows"
+
+        self.logger.info(f"*** Test TC-FLT-005: PASSED ({elapsed:.1f}s) ***")
+
+    @pytest.mark.events
+    @pytest.mark.network("lean")
+    @pytest.mark.faults(route="/login", methods="GET", latency_ms=PENDING_REQUEST_MS)
+    def test_TC_FLT_006_network_idle_timeout(self, setup):
+        """
+        TC-FLT-006: Network idle wait with a slow request in flight
+
+        Technique: Fault Injection, Boundary Value Analysis (wait timeout)
+        Expected: wait_for_network_idle() gives up at its timeout while the
+                  request is pending, and returns once it has finished
+        """
+        self.logger.info("*** Test TC-FLT-006: Network Idle Timeout ***")
+        self.driver = setup
+
+        home_page = HomePage(self.driver)
+        home_page.open(self.base_url + "/home")
+        self.driver.execute_script("fetch(arguments[0]);", self.base_url + "/login")
+        assert home_page.policy.holds(self.driver, lambda _: HttpProxy.current.stats.in_flight > 0, 2), \
+            "The delayed request should reach the proxy"
+
+        started = time.monotonic()
+        assert not home_page.wait_for_network_idle(timeout=1), \
+            "Network should not be idle while the delayed request is pending"
+        assert time.monotonic() - started < 1 + home_page.NETWORK_IDLE_TIME, \
+            "wait_for_network_idle() should return at its timeout"
+
+        assert home_page.wait_for_network_idle(), "Network should go idle once the request has finished"
+        elapsed = time.monotonic() - started
+        assert elapsed < PENDING_REQUEST_MS / 1000 + OVERHEAD, \
+            f"Idle detected {elapsed:.1f}s after the wait started"
+
+        self.logger.info("*** Test TC-FLT-006: PASSED ***")
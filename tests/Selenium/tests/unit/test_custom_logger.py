@@ -0,0 +1,98 @@
+"""
+Unit tests for merging per-worker logs (utilities/customLogger.py).
+No browser or application needed.
+"""
+
+import gzip
+import json
+import pytest
+import sys
+import os
+
+# Add parent directories to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utilities.customLogger import CustomLogger
+
+
+class Test_CustomLogger:
+    """
+    Test class for CustomLogger.merge_worker_logs and merge_worker_events.
+    """
+
+    RUN_ID = "20260101_000000"
+
+    @pytest.fixture
+    def logs_dir(self, tmp_path, monkeypatch):
+        """
+        Logs directory in a temporary folder.
+        """
+        monkeypatch.setattr(CustomLogger, "logs_dir", staticmethod(lambda: str(tmp_path)))
+        return tmp_path
+
+    @staticmethod
+    def write(path, lines):
+        """
+        Write lines to a plain or gzipped file.
+        """
+        opener = gzip.open if str(path).endswith(".gz") else open
+        with opener(path, "wt", encoding="utf-8") as handle:
+            handle.writelines(line + "\n" for line in lines)
+
+    def test_TC_LOG_001_rotated_worker_logs_merged(self, logs_dir):
+        """
+        TC-LOG-001: Rotated worker logs merged in order
+
+        Technique: Error Guessing (size rotation during a run)
+        Expected: Entries of the rotated .N.gz backups and the live files of all
+                  workers end up in the merged log, ordered by timestamp
+        """
+        worker = logs_dir / f"test_log_{self.RUN_ID}_gw0.log"
+        self.write(f"{worker}.2.gz", ["2026-01-01 10:00:01,000 - INFO - first"])
+        self.write(f"{worker}.1.gz", ["2026-01-01 10:00:02,000 - INFO - second"])
+        self.write(worker, ["2026-01-01 10:00:04,000 - INFO - fourth"])
+        self.write(logs_dir / f"test_log_{self.RUN_ID}_gw1.log", ["2026-01-01 10:00:03,000 - INFO - third"])
+
+        merged = CustomLogger.merge_worker_logs(self.RUN_ID)
+
+        with open(merged, encoding="utf-8") as handle:
+            lines = handle.read().splitlines()
+        assert [line.rsplit(" - ", 1)[-1] for line in lines] == ["first", "second", "third", "fourth"]
+        assert "[gw0]" in lines[0] and "[gw1]" in lines[2]
+
+    def test_TC_LOG_002_rotated_worker_events_merged(self, logs_dir):
+        """
+        TC-LOG-002: Rotated worker events merged in order
+
+        Technique: Error Guessing (size rotation during a run)
+        Expected: Events of the rotated backups and the live files are merged by timestamp
+        """
+        worker = logs_dir / f"events_{self.RUN_ID}_gw0.jsonl"
+        self.write(f"{worker}.1.gz", [json.dumps({"ts": 1.0, "msg": "first"})])
+        self.write(worker, [json.dumps({"ts": 3.0, "msg": "third"})])
+        self.write(logs_dir / f"events_{self.RUN_ID}_gw1.jsonl", [json.dumps({"ts": 2.0, "msg": "second"})])
+
+        merged = CustomLogger.merge_worker_events(self.RUN_ID)
+
+        with open(merged, encoding="utf-8") as handle:
+            events = [json.loads(line) for line in handle]
+        assert [event["msg"] for event in events] == ["first", "second", "third"]
+
+    def test_TC_LOG_003_master_event_backups_merged_once(self, logs_dir):
+        """
+        TC-LOG-003: Rotated master events merged once
+
+        Technique: Error Guessing (re-reading merged backups)
+        Expected: The master's rotated events are in the merged file and
+                  their backups are removed, so no event is listed twice
+        """
+        master = logs_dir / f"events_{self.RUN_ID}.jsonl"
+        self.write(f"{master}.1.gz", [json.dumps({"ts": 1.0, "msg": "first"})])
+        self.write(master, [json.dumps({"ts": 2.0, "msg": "second"})])
+        self.write(logs_dir / f"events_{self.RUN_ID}_gw0.jsonl", [json.dumps({"ts": 3.0, "msg": "third"})])
+
+        merged = CustomLogger.merge_worker_events(self.RUN_ID)
+
+        with open(merged, encoding="utf-8") as handle:
+            assert [json.loads(line)["msg"] for line in handle] == ["first", "second", "third"]
+        assert not os.path.exists(f"{master}.1.gz"), "Merged backups should be removed"
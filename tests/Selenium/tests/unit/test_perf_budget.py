@@ -0,0 +1,92 @@
+"""
+Unit tests for the performance budgets (utilities/perfBudget.py).
+No browser or application needed.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directories to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utilities.perfBudget import PerfBudget
+
+
+class Test_PerfBudget:
+    """
+    Test class for PerfBudget.evaluate.
+    """
+
+    def test_TC_BUD_001_profiles_checked_separately(self):
+        """
+        TC-BUD-001: Network profiles checked separately
+
+        Technique: Equivalence Partitioning (network profiles)
+        Expected: Fast lean loads do not hide a slow full load of the same route
+        """
+        budget = PerfBudget([("/home", "lcp", "p95", 1500)])
+        records = [{"route": "/home", "network_profile": "lean", "lcp": 300}] * 19 + \
+                  [{"route": "/home", "network_profile": "full", "lcp": 2500}]
+
+        violations = budget.evaluate(records)
+
+        assert [(v["route"], v["network_profile"], v["actual"], v["samples"]) for v in violations] == \
+            [("/home", "full", 2500, 1)]
+
+    def test_TC_BUD_002_records_without_profile_are_full(self):
+        """
+        TC-BUD-002: Records without a profile count as full loads
+
+        Technique: Equivalence Partitioning (missing profile)
+        Expected: The violation is reported for the full profile
+        """
+        budget = PerfBudget([("/login", "load", "max", 2000)])
+
+        violations = budget.evaluate([{"route": "/login", "load": 2500}])
+
+        assert violations[0]["network_profile"] == "full"
+
+    @pytest.mark.parametrize("content", [
+        "[/home]\nttbf.p95 = 500\n",
+        "[/home]\nlcp.p97 = 500\n",
+        "[/home]\nlcp.p95 = abc\n",
+        "[settings]\nmode = bogus\n",
+        "[settings]\nmin_samples = many\n",
+    ])
+    def test_TC_BUD_003_invalid_budget_file(self, tmp_path, content):
+        """
+        TC-BUD-003: Invalid budget file rejected
+
+        Technique: Equivalence Partitioning (invalid keys, thresholds, settings)
+        Expected: load() raises ValueError naming the problem instead of
+                  loading a budget that is never enforced
+        """
+        path = tmp_path / "budgets.ini"
+        path.write_text(content, encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            PerfBudget.load(str(path))
+
+    def test_TC_BUD_004_missing_budget_file(self, tmp_path):
+        """
+        TC-BUD-004: Missing budget file rejected
+
+        Technique: Error Guessing
+        Expected: load() raises ValueError for an explicit path that does not exist
+        """
+        with pytest.raises(ValueError, match="not found"):
+            PerfBudget.load(str(tmp_path / "missing.ini"))
+
+    def test_TC_BUD_005_budgets_without_samples_reported(self):
+        """
+        TC-BUD-005: Budgets without samples reported as not enforced
+
+        Technique: Boundary Value Analysis (min_samples)
+        Expected: Only the budgets whose route and metric got fewer than
+                  min_samples samples are listed
+        """
+        budget = PerfBudget([("/home", "lcp", "p95", 1500), ("/login", "fcp", "p95", 1000)], min_samples=2)
+        records = [{"route": "/home", "lcp": 300}] * 2 + [{"route": "/login", "fcp": 200}]
+
+        assert budget.unchecked(records) == [("/login", "fcp", "p95")]
@@ -0,0 +1,151 @@
+"""
+Unit tests for the run history regression check (utilities/resultsStore.py).
+No browser or application needed.
+"""
+
+import pytest
+import sqlite3
+import sys
+import os
+
+# Add parent directories to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utilities.logArchive import LogArchive
+from utilities.resultsStore import ResultsStore
+from utilities.workerContext import WorkerContext
+
+
+class Test_ResultsStore:
+    """
+    Test class for ResultsStore.compare.
+    """
+
+    TEST_ID = "tests/test_001_login.py::Test_001_Login::test_TC_AUTH_002_valid_user_login"
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """
+        Results store in a temporary database.
+        """
+        store = ResultsStore(str(tmp_path / "results.sqlite3"))
+        yield store
+        store.close()
+
+    def save(self, store, index, duration_ms, steps=(), metrics=()):
+        """
+        Save a run with one passed test.
+        """
+        store.save_run(f"run{index:03d}", [{
+            "test": self.TEST_ID, "outcome": "passed", "duration_ms": duration_ms,
+            "steps": list(steps), "metrics": list(metrics),
+        }], started=1000.0 + index)
+
+    def test_TC_HIST_001_single_sample_slowdown_flagged(self, store):
+        """
+        TC-HIST-001: Slowdown of a single test duration flagged
+
+        Technique: Boundary Value Analysis (one sample against the baseline)
+        Expected: A single duration far above the baseline distribution is a regression
+                  scored by its robust z-score
+        """
+        for index in range(ResultsStore.BASELINE_RUNS):
+            self.save(store, index, 1000 + (index % 5) * 20)
+        self.save(store, 99, 50000)
+
+        regressions = store.compare()
+
+        assert [(r["series"], r["key"]) for r in regressions] == [("test", self.TEST_ID)]
+        assert regressions[0]["samples"] == (1, ResultsStore.BASELINE_RUNS)
+        assert regressions[0]["z_score"] > ResultsStore.MAX_Z_SCORE
+
+    def test_TC_HIST_002_single_sample_jitter_ignored(self, store):
+        """
+        TC-HIST-002: Jitter of a single test duration ignored
+
+        Technique: Boundary Value Analysis (ratio above MIN_RATIO, low z-score)
+        Expected: A duration within the baseline spread is not a regression
+        """
+        for index in range(ResultsStore.BASELINE_RUNS):
+            self.save(store, index, 1000 + (index % 5) * 20)
+        self.save(store, 99, 1080)
+
+        assert store.compare() == []
+
+    def test_TC_HIST_003_step_series_rank_test(self, store):
+        """
+        TC-HIST-003: Step series compared with the rank test
+
+        Technique: Equivalence Partitioning (series with MIN_SAMPLES values)
+        Expected: A slower step series is flagged by the Mann-Whitney test
+        """
+        for index in range(ResultsStore.BASELINE_RUNS):
+            self.save(store, index, 1000, steps=[("navigate", 200 + index % 3)] * 3)
+        self.save(store, 99, 1000, steps=[("navigate", 900)] * 3)
+
+        regressions = store.compare()
+
+        assert [(r["series"], r["key"]) for r in regressions] == [("step", "navigate")]
+        assert regressions[0]["z_score"] is None
+        assert regressions[0]["p_value"] < ResultsStore.ALPHA
+
+    def test_TC_HIST_004_route_metrics_keyed_by_profile(self, store):
+        """
+        TC-HIST-004: Route metrics keyed by network profile
+
+        Technique: Equivalence Partitioning (network profiles)
+        Expected: Full loads are not compared against a lean baseline, while a
+                  slower lean series is flagged
+        """
+        lean = {"route": "/home", "network_profile": "lean", "lcp": 400}
+        for index in range(ResultsStore.BASELINE_RUNS):
+            self.save(store, index, 1000, metrics=[lean] * 3)
+        full = {"route": "/home", "network_profile": "full", "lcp": 1200}
+        self.save(store, 98, 1000, metrics=[full] * 3)
+
+        assert store.compare() == []
+
+        self.save(store, 99, 1000, metrics=[dict(lean, lcp=1200)] * 3)
+
+        assert [r["key"] for r in store.compare()] == ["/home [lean] lcp"]
+
+    def test_TC_HIST_005_old_database_migrated(self, tmp_path):
+        """
+        TC-HIST-005: Database without network profiles migrated
+
+        Technique: Error Guessing (database of an older version)
+        Expected: The network_profile column is added and old rows stay readable
+        """
+        path = str(tmp_path / "old.sqlite3")
+        connection = sqlite3.connect(path)
+        connection.execute("CREATE TABLE route_metrics (run_id TEXT, test TEXT, route TEXT, metric TEXT, value REAL)")
+        connection.execute("INSERT INTO route_metrics VALUES ('run000', 't', '/home', 'lcp', 400)")
+        connection.commit()
+        connection.close()
+
+        store = ResultsStore(path)
+        try:
+            assert store.samples(["run000"]) == {("route", "/home lcp"): [400]}
+        finally:
+            store.close()
+
+    def test_TC_HIST_006_runs_in_same_second_kept_apart(self, store, monkeypatch):
+        """
+        TC-HIST-006: Runs started in the same second keep their own history
+
+        Technique: Error Guessing (parallel CI jobs sharing the database)
+        Expected: Each run gets its own id, both runs are stored, and the
+                  log archive still reads the run id and start time
+        """
+        run_ids = []
+        for _ in range(2):
+            monkeypatch.delenv(WorkerContext.RUN_ID_ENV, raising=False)
+            run_ids.append(WorkerContext.run_id())
+        for run_id in run_ids:
+            store.save_run(run_id, [{"test": self.TEST_ID, "outcome": "passed", "duration_ms": 1000}])
+
+        assert run_ids[0] != run_ids[1]
+        assert sorted(row[0] for row in store.runs()) == sorted(run_ids)
+        path = f"test_log_{run_ids[0]}_gw0.log.1.gz"
+        assert LogArchive.run_of(path) == run_ids[0]
+        assert LogArchive.run_time(path) > 0
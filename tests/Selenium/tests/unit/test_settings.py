@@ -0,0 +1,85 @@
+"""
+Unit tests for the settings loader (utilities/readProperties.py).
+No browser or application needed.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directories to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utilities.readProperties import Settings, config_path
+
+
+class Test_Settings:
+    """
+    Test class for the profile and worker layers of Settings.load.
+    """
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        """
+        Write config.ini plus extra sections to a temporary file.
+        """
+        def write(extra):
+            path = tmp_path / "config.ini"
+            with open(config_path, encoding="utf-8") as handle:
+                path.write_text(handle.read() + "\n" + extra, encoding="utf-8")
+            return str(path)
+        return write
+
+    def load(self, path, **options):
+        """
+        Load settings without environment overrides.
+        """
+        options.setdefault("worker_id", "master")
+        return Settings.load(path, environ={}, **options)
+
+    def test_TC_CFG_001_profile_password_one_setting(self, config):
+        """
+        TC-CFG-001: Profile password changes one setting
+
+        Technique: Equivalence Partitioning (layer keys)
+        Expected: admin_password in a profile only overrides the admin password
+        """
+        defaults = self.load(config_path)
+        path = config("[profile:ci]\nadmin_password = ci-secret\n")
+
+        settings = self.load(path, profile="ci")
+
+        assert settings.admin_password == "ci-secret"
+        assert settings.sources["admin_password"] == "[profile:ci]"
+        for name in ("manager_password", "user_password", "test_user_password"):
+            assert getattr(settings, name) == getattr(defaults, name)
+
+    def test_TC_CFG_002_worker_base_url_wins(self, config):
+        """
+        TC-CFG-002: Worker base URL wins over application shards
+
+        Technique: Decision Table (worker section, baseUrls)
+        Expected: A [worker:gwN] base_url takes precedence over the shard of the
+                  worker, other workers still use their shard
+        """
+        path = config("[worker:gw1]\nbase_url = http://127.0.0.1:9001\n")
+
+        overrides = {"base_urls": "http://a:1, http://b:2"}
+
+        settings = self.load(path, worker_id="gw1", overrides=overrides)
+
+        assert settings.base_url == "http://127.0.0.1:9001"
+        assert self.load(path, worker_id="gw0", overrides=overrides).base_url == "http://a:1"
+
+    def test_TC_CFG_003_section_key_rejected(self, config):
+        """
+        TC-CFG-003: Section key in a profile rejected
+
+        Technique: Error Guessing (raw INI key in a layer)
+        Expected: A raw key such as password raises ValueError instead of overriding
+                  every password
+        """
+        path = config("[profile:ci]\npassword = x\n")
+
+        with pytest.raises(ValueError, match="Unknown setting password"):
+            self.load(path, profile="ci")
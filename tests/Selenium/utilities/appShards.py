@@ -0,0 +1,223 @@
+"""
+Local application shards for parallel Selenium runs.
+Starts several `php artisan serve` instances of the Laravel app, each on its
+own port with its own freshly migrated and seeded database, so that tests
+running on different workers never share registrations or capacity.
+
+Usage (from tests/Selenium):
+    python -m utilities.appShards start --count 4 --port 8001
+    pytest -n 4 --app-urls "$(python -m utilities.appShards urls)"
+    python -m utilities.appShards reseed
+    python -m utilities.appShards stop
+"""
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import requests
+
+from utilities.readProperties import ReadConfig
+
+
+class AppShards:
+    """
+    Start, reseed and stop the local application instances of a sharded run.
+    """
+
+    # Laravel project root (contains artisan)
+    PROJECT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+
+    # Running shards (pid, port, database) of the last start
+    STATE_FILE = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Logs', 'app_shards.json'))
+
+    # Seconds to wait for an instance to answer after start
+    START_TIMEOUT = 30
+
+    # Start instances in their own process group, so stop() also ends the PHP server child
+    DETACHED = ({"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP} if os.name == "nt"
+                else {"start_new_session": True})
+
+    def __init__(self, php="php", host="127.0.0.1", connection="sqlite", database_prefix="selenium"):
+        """
+        Initialize the shard manager.
+
+        Args:
+            php: PHP executable
+            host: Interface the instances listen on
+            connection: Laravel database connection (sqlite, or mysql with
+                        databases <prefix>_shard<N> created beforehand)
+            database_prefix: Prefix of the per-shard database names
+        """
+        self.php = php
+        self.host = host
+        self.connection = connection
+        self.database_prefix = database_prefix
+
+    def database(self, index):
+        """
+        Get the database of a shard.
+
+        Returns:
+            str: SQLite file path, or database name for other connections
+        """
+        if self.connection == "sqlite":
+            return os.path.join(self.PROJECT_DIR, "database", f"{self.database_prefix}_shard{index}.sqlite")
+        return f"{self.database_prefix}_shard{index}"
+
+    def environment(self, index):
+        """
+        Build the environment of a shard: its own database and the test data
+        API enabled with the configured token (real environment variables
+        take precedence over .env in Laravel).
+        """
+        environment = dict(os.environ, DB_CONNECTION=self.connection, DB_DATABASE=self.database(index),
+                           TEST_DATA_API="true")
+        if ReadConfig.get_test_data_token():
+            environment["TEST_DATA_TOKEN"] = ReadConfig.get_test_data_token()
+        environment.pop("PYTEST_XDIST_WORKER", None)
+        return environment
+
+    def artisan(self, index, *args, **kwargs):
+        """
+        Run an artisan command against a shard's database.
+        """
+        return subprocess.run(
+            [self.php, "artisan", *args], cwd=self.PROJECT_DIR, env=self.environment(index),
+            check=True, **kwargs
+        )
+
+    def seed(self, index):
+        """
+        Recreate and seed a shard's database.
+        """
+        if self.connection == "sqlite":
+            open(self.database(index), "a").close()
+        self.artisan(index, "migrate:fresh", "--seed", "--force", stdout=subprocess.DEVNULL)
+
+    def url(self, port):
+        """
+        Get the base URL of the instance on a port.
+        """
+        return f"http://{self.host}:{port}"
+
+    def wait_until_up(self, port):
+        """
+        Poll an instance until it answers.
+
+        Raises:
+            RuntimeError: If it does not answer within START_TIMEOUT
+        """
+        deadline = time.monotonic() + self.START_TIMEOUT
+        while time.monotonic() < deadline:
+            try:
+                requests.get(self.url(port) + "/login", timeout=2)
+                return
+            except requests.RequestException:
+                time.sleep(0.25)
+        raise RuntimeError(f"Instance on port {port} did not start within {self.START_TIMEOUT}s")
+
+    def start(self, count, first_port=8001):
+        """
+        Seed and start the shards (stopping the ones of a previous start).
+
+        Args:
+            count: Number of instances
+            first_port: Port of the first instance (the others follow)
+
+        Returns:
+            list: Base URLs of the instances
+        """
+        self.stop()
+        shards = []
+        for index in range(count):
+            port = first_port + index
+            self.seed(index)
+            process = subprocess.Popen(
+                [self.php, "artisan", "serve", f"--host={self.host}", f"--port={port}"],
+                cwd=self.PROJECT_DIR, env=self.environment(index),
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **self.DETACHED
+            )
+            shards.append({"index": index, "pid": process.pid, "port": port,
+                           "database": self.database(index), "url": self.url(port)})
+        os.makedirs(os.path.dirname(self.STATE_FILE), exist_ok=True)
+        with open(self.STATE_FILE, "w", encoding="utf-8") as handle:
+            json.dump({"connection": self.connection, "shards": shards}, handle, indent=2)
+        for shard in shards:
+            self.wait_until_up(shard["port"])
+        return [shard["url"] for shard in shards]
+
+    @classmethod
+    def running(cls):
+        """
+        Read the shards of the last start.
+
+        Returns:
+            list: Shard dicts (index, pid, port, database, url)
+        """
+        if not os.path.exists(cls.STATE_FILE):
+            return []
+        with open(cls.STATE_FILE, encoding="utf-8") as handle:
+            return json.load(handle)["shards"]
+
+    def reseed(self):
+        """
+        Reset every running shard's database to the seeded state.
+        """
+        for shard in self.running():
+            self.seed(shard["index"])
+
+    def stop(self):
+        """
+        Stop the shards of the last start.
+        """
+        for shard in self.running():
+            if os.name == "nt":
+                subprocess.run(["taskkill", "/F", "/T", "/PID", str(shard["pid"])], capture_output=True)
+                continue
+            try:
+                os.killpg(shard["pid"], signal.SIGTERM)
+            except (ProcessLookupError, PermissionError):
+                pass
+        if os.path.exists(self.STATE_FILE):
+            os.remove(self.STATE_FILE)
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Returns:
+        int: Exit status
+    """
+    parser = argparse.ArgumentParser(prog="python -m utilities.appShards")
+    parser.add_argument("--php", default="php")
+    parser.add_argument("--connection", default="sqlite")
+    parser.add_argument("--database-prefix", default="selenium")
+    commands = parser.add_subparsers(dest="command", required=True)
+    start_parser = commands.add_parser("start", help="Seed and start N instances")
+    start_parser.add_argument("--count", type=int, default=2)
+    start_parser.add_argument("--port", type=int, default=8001, help="Port of the first instance")
+    commands.add_parser("urls", help="Print the base URLs for --app-urls")
+    commands.add_parser("reseed", help="Reset the shard databases")
+    commands.add_parser("stop", help="Stop the instances")
+    args = parser.parse_args(argv)
+
+    shards = AppShards(args.php, connection=args.connection, database_prefix=args.database_prefix)
+    if args.command == "start":
+        print(",".join(shards.start(args.count, args.port)))
+    elif args.command == "urls":
+        print(",".join(shard["url"] for shard in shards.running()))
+    elif args.command == "reseed":
+        shards.reseed()
+    else:
+        shards.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,184 @@
 """
 Custom Logger utility for test reporting.
 Creates log files for test execution results.
+Records are handed to a background thread through a queue, so logging
+never blocks a test on disk or console I/O. The same records are written
+as text (test_log_*.log) and as JSON lines (events_*.jsonl).
 """
 
+import atexit
+import glob
+import gzip
+import heapq
+import json
 import logging
 import os
-from datetime import datetime
+import queue
+import re
+import shutil
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from utilities.logArchive import LogArchive
+from utilities.perfMetrics import PerfMetrics
+from utilities.readProperties import ReadConfig
+from utilities.stepTracer import StepTracer
+from utilities.workerContext import WorkerContext
+
+
+def gzip_namer(name):
+    """
+    Name rotated log files with a .gz suffix.
+    """
+    return name + ".gz"
+
+
+def gzip_rotator(source, destination):
+    """
+    Compress a rotated log file and remove the original.
+    """
+    with open(source, "rb") as raw, gzip.open(destination, "wb") as compressed:
+        shutil.copyfileobj(raw, compressed)
+    os.remove(source)
+
+
+def rotating_handler(filename, handler_class=None):
+    """
+    Create a size-rotating handler that gzips rotated files, sized from
+    the [logging] section of config.ini.
+
+    Args:
+        filename: Log file
+        handler_class: RotatingFileHandler subclass (default: RotatingFileHandler)
+
+    Returns:
+        logging.Handler: Configured handler
+    """
+    handler = (handler_class or RotatingFileHandler)(
+        filename, maxBytes=ReadConfig.get_log_max_bytes(),
+        backupCount=ReadConfig.get_log_backup_count(), encoding="utf-8"
+    )
+    handler.namer = gzip_namer
+    handler.rotator = gzip_rotator
+    return handler
+
+
+class BatchingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that writes formatted records in batches.
+    Used behind the queue listener; errors are written immediately.
+    """
+
+    # Records buffered before a write
+    BATCH_SIZE = 200
+
+    # Seconds a record may wait in the buffer
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(self, filename, **kwargs):
+        super().__init__(filename, **kwargs)
+        self.buffer = []
+        self.last_flush = time.monotonic()
+
+    def emit(self, record):
+        try:
+            self.buffer.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+        if (len(self.buffer) >= self.BATCH_SIZE or record.levelno >= logging.ERROR
+                or time.monotonic() - self.last_flush >= self.FLUSH_INTERVAL):
+            self.flush()
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.buffer:
+                data = "".join(self.buffer)
+                self.buffer = []
+                if self.stream is None:
+                    self.stream = self._open()
+                if self.maxBytes and self.stream.tell() and \
+                        self.stream.tell() + len(data) >= self.maxBytes:
+                    self.doRollover()
+                self.stream.write(data)
+            super().flush()
+            self.last_flush = time.monotonic()
+        finally:
+            self.release()
+
+    def close(self):
+        self.flush()
+        super().close()
+
+
+class ContextFilter(logging.Filter):
+    """
+    Stamps records with the running test and span on the calling thread.
+    """
+
+    def filter(self, record):
+        span = StepTracer.current()
+        record.test = PerfMetrics.current_test
+        record.span_id = span.span_id if span else None
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line.
+    Span records (extra={"span": ...}) keep their structured fields.
+    """
+
+    def format(self, record):
+        entry = {
+            "ts": record.created,
+            "run": WorkerContext.run_id(),
+            "worker": WorkerContext.worker_id(),
+            "test": getattr(record, "test", None),
+            "level": record.levelname,
+        }
+        span = getattr(record, "span", None)
+        if span:
+            entry.update(span)
+        else:
+            entry.update({
+                "type": "log",
+                "span_id": getattr(record, "span_id", None),
+                "message": record.getMessage(),
+            })
+            if record.exc_info:
+                entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class InlineQueueHandler(QueueHandler):
+    """
+    Queue handler for an in-process listener: only resolves the message
+    arguments on the calling thread and leaves formatting to the listener.
+    """
+
+    def prepare(self, record):
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    Queue listener that flushes its handlers whenever the queue runs empty,
+    so batches are written during idle moments instead of per record.
+    """
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            if not block:
+                raise
+        for handler in self.handlers:
+            handler.flush()
+        return self.queue.get()
 
 
 class CustomLogger:
@@ -13,50 +186,239 @@ class CustomLogger:
     Custom logger class for creating and managing test logs.
     """
 
+    # Hand records to a background listener (False: write from the test thread)
+    QUEUE_MODE = True
+
+    # Log line layout; the timestamp prefix is also used to merge worker files
+    LOG_FORMAT = '%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s'
+    DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+    # Start of a log entry (continuation lines such as tracebacks do not match)
+    ENTRY_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:\.\d{3})?")
+
+    _handlers = {}
+
     @staticmethod
-    def get_logger(name="AAB_EventPlanner_Tests"):
+    def logs_dir():
         """
-        Create and return a logger instance.
-        
-        Args:
-            name: Logger name (default: AAB_EventPlanner_Tests)
-            
+        Get the Logs directory, creating it if needed.
+
         Returns:
-            logging.Logger: Configured logger instance
+            str: Path to tests/Selenium/Logs
         """
-        # Create logs directory if it doesn't exist
         logs_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Logs')
         if not os.path.exists(logs_dir):
             os.makedirs(logs_dir)
+        return logs_dir
+
+    @staticmethod
+    def log_file(worker_id=None):
+        """
+        Get the log file of the current run (one file per xdist worker).
 
-        # Create log filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = os.path.join(logs_dir, f"test_log_{timestamp}.log")
+        Args:
+            worker_id: Worker id (default: the current process)
+
+        Returns:
+            str: Path to the log file
+        """
+        run_id = WorkerContext.run_id()
+        worker_id = worker_id or WorkerContext.worker_id()
+        if worker_id != WorkerContext.MASTER:
+            return os.path.join(CustomLogger.logs_dir(), f"test_log_{run_id}_{worker_id}.log")
+        return os.path.join(CustomLogger.logs_dir(), f"test_log_{run_id}.log")
 
+    @staticmethod
+    def events_file():
+        """
+        Get the JSON-lines event log of the current run and worker.
+
+        Returns:
+            str: Path to the events file
+        """
+        suffix = f"_{WorkerContext.worker_id()}" if WorkerContext.is_worker() else ""
+        return os.path.join(CustomLogger.logs_dir(), f"events_{WorkerContext.run_id()}{suffix}.jsonl")
+
+    @classmethod
+    def get_logger(cls, name="AAB_EventPlanner_Tests"):
+        """
+        Create and return a logger instance.
+
+        Args:
+            name: Logger name (default: AAB_EventPlanner_Tests)
+
+        Returns:
+            logging.Logger: Configured logger instance
+        """
         # Configure logger
         logger = logging.getLogger(name)
         logger.setLevel(logging.DEBUG)
 
         # Prevent duplicate handlers
         if not logger.handlers:
-            # File handler
-            file_handler = logging.FileHandler(log_file)
+            formatter = logging.Formatter(cls.LOG_FORMAT, datefmt=cls.DATE_FORMAT)
+
+            # File handler (run timestamp in the name, one file per xdist worker,
+            # rotated by size into gzipped backups)
+            file_handler = rotating_handler(
+                cls.log_file(), BatchingFileHandler if cls.QUEUE_MODE else None
+            )
             file_handler.setLevel(logging.DEBUG)
 
+            # Structured event handler (same records as JSON lines)
+            events_handler = rotating_handler(
+                cls.events_file(), BatchingFileHandler if cls.QUEUE_MODE else None
+            )
+            events_handler.setLevel(logging.DEBUG)
+
             # Console handler
             console_handler = logging.StreamHandler()
             console_handler.setLevel(logging.INFO)
 
-            # Formatter
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
             file_handler.setFormatter(formatter)
+            events_handler.setFormatter(JsonLinesFormatter())
             console_handler.setFormatter(formatter)
 
-            # Add handlers
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
+            logger.addFilter(ContextFilter())
+            handlers = [file_handler, events_handler, console_handler]
+            if cls.QUEUE_MODE:
+                cls._start_listener(logger, handlers)
+            else:
+                for handler in handlers:
+                    logger.addHandler(handler)
 
         return logger
+
+    @classmethod
+    def _start_listener(cls, logger, handlers):
+        """
+        Route a logger through a queue to a background listener thread.
+        """
+        records = queue.SimpleQueue()
+        logger.addHandler(InlineQueueHandler(records))
+        listener = BatchingQueueListener(records, *handlers, respect_handler_level=True)
+        listener.start()
+        cls._handlers[logger.name] = (listener, handlers)
+        if len(cls._handlers) == 1:
+            atexit.register(cls.shutdown)
+
+    @classmethod
+    def shutdown(cls):
+        """
+        Drain the queues, flush the log files and stop the listener threads.
+        Loggers keep working afterwards, writing synchronously.
+        """
+        for name, (listener, handlers) in list(cls._handlers.items()):
+            listener.stop()
+            logger = logging.getLogger(name)
+            for handler in list(logger.handlers):
+                if isinstance(handler, QueueHandler):
+                    logger.removeHandler(handler)
+            for handler in handlers:
+                handler.flush()
+                logger.addHandler(handler)
+            del cls._handlers[name]
+
+    @staticmethod
+    def _with_backups(path):
+        """
+        List a log file after its rotated backups (<file>.N.gz), oldest first.
+        """
+        pattern = re.compile(re.escape(path) + r"\.(\d+)\.gz$")
+        backups = [(int(match.group(1)), name) for name in glob.glob(glob.escape(path) + ".*.gz")
+                   for match in [pattern.match(name)] if match]
+        return [name for _, name in sorted(backups, reverse=True)] + [path]
+
+    @classmethod
+    def _lines(cls, path):
+        """
+        Stream the lines of a log file and its rotated backups, oldest first.
+        """
+        for name in cls._with_backups(path):
+            with LogArchive.open_text(name) as handle:
+                yield from handle
+
+    @classmethod
+    def _entries(cls, path, worker_id):
+        """
+        Read a log file and its rotated backups as (timestamp, entry) pairs,
+        tagging lines with the worker.
+        """
+        entry = None
+        for line in cls._lines(path):
+            match = cls.ENTRY_PATTERN.match(line)
+            if match:
+                if entry:
+                    yield entry
+                stamp = match.group(0)
+                entry = (stamp, f"{stamp} - [{worker_id}]{line[len(stamp):]}")
+            elif entry:
+                entry = (entry[0], entry[1] + line)
+        if entry:
+            yield entry
+
+    @classmethod
+    def merge_worker_logs(cls, run_id=None):
+        """
+        Merge the per-worker log files of a run, including their rotated
+        backups, into test_log_<run>.log, ordered by timestamp. The worker
+        files are kept.
+
+        Args:
+            run_id: Run to merge (default: the current run)
+
+        Returns:
+            str: Path to the merged log, or None if there were no worker files
+        """
+        run_id = run_id or WorkerContext.run_id()
+        pattern = os.path.join(cls.logs_dir(), f"test_log_{run_id}_gw*.log")
+        sources = {path[:-len(".log")].rsplit("_", 1)[-1]: path for path in sorted(glob.glob(pattern))}
+        if not sources:
+            return None
+
+        merged = os.path.join(cls.logs_dir(), f"test_log_{run_id}.log")
+        if os.path.exists(merged):
+            sources[WorkerContext.MASTER] = merged
+        streams = [cls._entries(path, worker_id) for worker_id, path in sources.items()]
+
+        temporary = merged + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            for _, text in heapq.merge(*streams, key=lambda entry: entry[0]):
+                handle.write(text)
+        # The master's rotated backups are now part of the merged log
+        for backup in cls._with_backups(merged)[:-1]:
+            os.remove(backup)
+        os.replace(temporary, merged)
+        return merged
+
+    @classmethod
+    def merge_worker_events(cls, run_id=None):
+        """
+        Merge the per-worker JSON-lines event logs of a run, including their
+        rotated backups, into events_<run>.jsonl, ordered by timestamp.
+
+        Args:
+            run_id: Run to merge (default: the current run)
+
+        Returns:
+            str: Path to the merged file, or None if there were no worker files
+        """
+        run_id = run_id or WorkerContext.run_id()
+        sources = sorted(glob.glob(os.path.join(cls.logs_dir(), f"events_{run_id}_gw*.jsonl")))
+        if not sources:
+            return None
+
+        merged = os.path.join(cls.logs_dir(), f"events_{run_id}.jsonl")
+        if os.path.exists(merged):
+            sources.append(merged)
+        streams = [((json.loads(line)["ts"], line) for line in cls._lines(path) if line.strip())
+                   for path in sources]
+        temporary = merged + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as output:
+            for _, line in heapq.merge(*streams, key=lambda entry: entry[0]):
+                output.write(line)
+        # The master's rotated backups are now part of the merged events
+        for backup in cls._with_backups(merged)[:-1]:
+            os.remove(backup)
+        os.replace(temporary, merged)
+        return merged
@@ -0,0 +1,212 @@
+"""
+Test data factory for the Selenium suite.
+Declares the categories, events, users and registrations a test needs and
+creates them with a single call to the application's test-only seeding API
+(POST /__test/seed, enabled with TEST_DATA_API=true), then deletes them
+again after the test. Names carry the worker id, so parallel workers never
+collide on seeded data.
+"""
+
+import itertools
+import uuid
+
+import requests
+
+from utilities.httpLogin import HttpLogin
+from utilities.readProperties import ReadConfig
+from utilities.workerContext import WorkerContext
+
+
+class DataFactoryError(Exception):
+    """
+    Raised when the seeding API is unavailable or rejects the data.
+    """
+
+
+class Seeded:
+    """
+    Placeholder for a row to seed; id (and url for events) are set by create().
+    """
+
+    def __init__(self, kind, key, **fields):
+        self.kind = kind
+        self.key = key
+        self.fields = fields
+        self.id = None
+        self.url = None
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__["fields"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __repr__(self):
+        return f"Seeded({self.kind}, {self.key}, id={self.id})"
+
+
+class DataFactory:
+    """
+    Collects seed data and creates it in one bulk request.
+    """
+
+    SEED_PATH = "/__test/seed"
+    CLEANUP_PATH = "/__test/cleanup"
+
+    # Password of seeded user accounts
+    PASSWORD = "password123"
+
+    def __init__(self, base_url=None, session=None):
+        """
+        Initialize the factory.
+
+        Args:
+            base_url: Application base URL (default: config baseUrl)
+            session: requests.Session (default: a session on the shared pool)
+        """
+        self.base_url = (base_url or ReadConfig.get_base_url()).rstrip("/")
+        self.session = session or HttpLogin.new_session()
+        self.prefix = f"{WorkerContext.worker_id()}-{uuid.uuid4().hex[:6]}"
+        self.counter = itertools.count(1)
+        self.pending = {"categories": [], "users": [], "events": [], "registrations": []}
+        self.owned = {"categories": [], "users": [], "events": []}
+
+    def _add(self, kind, label, **fields):
+        key = f"{label}{next(self.counter)}"
+        item = Seeded(kind, key, **fields)
+        self.pending[kind].append(item)
+        return item
+
+    def category(self, name=None):
+        """
+        Declare a category.
+
+        Args:
+            name: Category name (default: unique per test)
+
+        Returns:
+            Seeded: The category placeholder
+        """
+        return self._add("categories", "category", name=name or f"Selenium {self.prefix} {next(self.counter)}")
+
+    def user(self, name=None, email=None, password=None):
+        """
+        Declare a user account (role "user").
+
+        Args:
+            name: Display name (default: numbered)
+            email: Email, which the API requires in the @selenium.test domain
+                   (default: unique per test)
+            password: Password (default: PASSWORD)
+
+        Returns:
+            Seeded: The user placeholder (email and password as attributes)
+        """
+        number = next(self.counter)
+        return self._add(
+            "users", "user",
+            name=name or f"Seeded User {number}",
+            email=email or f"seeded_{self.prefix}_{number}@selenium.test",
+            password=password or self.PASSWORD,
+        )
+
+    def event(self, title=None, category=None, capacity=100, price=0, registered=0,
+              status="active", start_in_days=30, **fields):
+        """
+        Declare an event.
+
+        Args:
+            title: Event title (default: unique per test, searchable)
+            category: Seeded category or existing category name (default: first category)
+            capacity: Number of places
+            price: Price (0 makes the event free)
+            registered: Places already taken by placeholder users
+            status: "active" or "archived"
+            start_in_days: Start date relative to today
+            fields: description, place or duration_days
+
+        Returns:
+            Seeded: The event placeholder (url is set after create())
+        """
+        if isinstance(category, Seeded):
+            category = category.key
+        return self._add(
+            "events", "event",
+            title=title or f"Selenium Event {self.prefix} {next(self.counter)}",
+            category=category, capacity=capacity, price=price, registered=registered,
+            status=status, start_in_days=start_in_days, **fields
+        )
+
+    def registration(self, user, event):
+        """
+        Declare a registration of a user to an event.
+
+        Args:
+            user: Seeded user or email of an existing account
+            event: Seeded event
+
+        Returns:
+            Seeded: The registration placeholder
+        """
+        return self._add(
+            "registrations", "registration",
+            user=user.key if isinstance(user, Seeded) else user, event=event.key
+        )
+
+    def _post(self, path, payload):
+        token = ReadConfig.get_test_data_token()
+        if not token:
+            raise DataFactoryError(
+                "No test data token: set [test_data] token in config.ini to the application's TEST_DATA_TOKEN"
+            )
+        headers = {"Accept": "application/json", "X-Test-Data-Token": token}
+        try:
+            response = self.session.post(self.base_url + path, json=payload, headers=headers,
+                                         timeout=HttpLogin.TIMEOUT)
+        except requests.RequestException as error:
+            raise DataFactoryError(f"Seeding API unreachable: {error!r}") from error
+        if response.status_code == 403:
+            raise DataFactoryError(f"{path} rejected the test data token (403): check TEST_DATA_TOKEN")
+        if response.status_code == 404:
+            raise DataFactoryError(
+                f"{path} not found: start the application with TEST_DATA_API=true (and not in production)"
+            )
+        if response.status_code >= 400:
+            raise DataFactoryError(f"{path} returned {response.status_code}: {response.text[:500]}")
+        return response.json()
+
+    def create(self):
+        """
+        Create everything declared since the last call in one request.
+
+        Returns:
+            DataFactory: self, for chaining
+
+        Raises:
+            DataFactoryError: If the API is disabled or rejects the data
+        """
+        items = [item for kind in self.pending.values() for item in kind]
+        if not items:
+            return self
+        payload = {
+            kind: [dict(item.fields, key=item.key) for item in entries]
+            for kind, entries in self.pending.items() if entries
+        }
+        result = self._post(self.SEED_PATH, payload)
+        for kind in ("categories", "users", "events"):
+            for item in self.pending[kind]:
+                item.id = result["ids"][kind][item.key]
+            self.owned[kind].extend(result["owned"][kind])
+        for event in self.pending["events"]:
+            event.url = f"{self.base_url}/events/{event.id}"
+        self.pending = {kind: [] for kind in self.pending}
+        return self
+
+    def cleanup(self):
+        """
+        Delete all rows created by this factory (registrations included).
+        """
+        if not any(self.owned.values()):
+            return
+        owned, self.owned = self.owned, {kind: [] for kind in self.owned}
+        self._post(self.CLEANUP_PATH, owned)
@@ -0,0 +1,152 @@
+"""
+WebDriver pool utility for test execution.
+Keeps a small set of warm browser sessions per worker and leases them to tests,
+so the browser startup cost is paid once per worker instead of once per test.
+"""
+
+import queue
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+
+class DriverPool:
+    """
+    Pool of reusable WebDriver sessions.
+    Drivers are reset between leases and replaced when their session has crashed.
+    """
+
+    BLANK_PAGE = "about:blank"
+
+    def __init__(self, factory, size=1):
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Callable returning a new WebDriver instance
+            size: Maximum number of idle drivers kept warm
+        """
+        self.factory = factory
+        self.size = max(1, int(size))
+        self._idle = queue.LifoQueue()
+        self._leased = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def lease(self):
+        """
+        Lease a healthy driver from the pool, starting one if none is idle.
+
+        Returns:
+            WebDriver: A driver on a blank page with no cookies or storage
+        """
+        if self._closed:
+            raise RuntimeError("DriverPool is closed")
+
+        driver = None
+        while driver is None:
+            try:
+                candidate = self._idle.get_nowait()
+            except queue.Empty:
+                driver = self.factory()
+                break
+            if self.is_alive(candidate):
+                driver = candidate
+            else:
+                self._discard(candidate)
+
+        with self._lock:
+            self._leased.add(driver)
+        return driver
+
+    def release(self, driver):
+        """
+        Return a driver to the pool after resetting its state.
+        Crashed drivers and drivers beyond the pool size are quit instead.
+
+        Args:
+            driver: Driver previously obtained from lease()
+        """
+        with self._lock:
+            self._leased.discard(driver)
+
+        if self._closed or self._idle.qsize() >= self.size or not self.reset(driver):
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    def reset(self, driver):
+        """
+        Clear cookies, web storage and extra windows, then load a blank page.
+
+        Args:
+            driver: Driver to reset
+
+        Returns:
+            bool: True if the driver was reset and can be reused
+        """
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            driver.delete_all_cookies()
+            try:
+                driver.execute_script(
+                    "window.localStorage.clear(); window.sessionStorage.clear();"
+                )
+            except WebDriverException:
+                # Storage is not accessible on about:blank or data: URLs
+                pass
+            driver.get(self.BLANK_PAGE)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def is_alive(driver):
+        """
+        Check whether the browser session behind a driver still responds.
+
+        Args:
+            driver: Driver to probe
+
+        Returns:
+            bool: True if the session is usable
+        """
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def close(self):
+        """
+        Quit every driver owned by the pool.
+        """
+        self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        with self._lock:
+            leased = list(self._leased)
+            self._leased.clear()
+        for driver in leased:
+            self._discard(driver)
+
+    @staticmethod
+    def _discard(driver):
+        """
+        Quit a driver, ignoring errors from already dead sessions.
+
+        Args:
+            driver: Driver to quit
+        """
+        try:
+            driver.quit()
+        except Exception:
+            pass
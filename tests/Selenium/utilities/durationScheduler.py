@@ -0,0 +1,73 @@
+"""
+Duration-aware xdist scheduling.
+Hands out tests longest first (greedy LPT): whenever a worker needs work it
+gets the longest test still pending, estimated from the median durations in
+the results database, so long tests do not end up last on a single worker.
+"""
+
+from xdist.scheduler import LoadScheduling
+
+from utilities.shardPlanner import ShardPlanner
+
+
+class DurationScheduling(LoadScheduling):
+    """
+    LoadScheduling with the pending tests ordered by expected duration and
+    sent one at a time, so each idle worker takes the longest remaining test.
+    """
+
+    # Tests queued per worker; xdist needs the next test before it finishes the current one
+    PREFETCH = 2
+
+    def __init__(self, config, log=None, planner=None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            config: pytest config
+            log: xdist log producer
+            planner: ShardPlanner providing the duration estimates
+        """
+        super().__init__(config, log)
+        self.planner = planner or ShardPlanner()
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        # Initial distribution already happened, reschedule on all nodes
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        estimates = [self.planner.estimate(nodeid) for nodeid in self.collection]
+        self.pending[:] = sorted(range(len(self.collection)), key=lambda index: (-estimates[index], index))
+        if not self.collection:
+            return
+
+        # Deal round-robin, so the N longest tests start on N different workers
+        for _ in range(self.PREFETCH):
+            for node in self.nodes:
+                self._send_tests(node, 1)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration=0):
+        if node.shutting_down:
+            return
+
+        if self.pending:
+            missing = self.PREFETCH - len(self.node2pending[node])
+            if missing > 0:
+                self._send_tests(node, missing)
+        else:
+            node.shutdown()
+
+        self.log("num items waiting for node:", len(self.pending))
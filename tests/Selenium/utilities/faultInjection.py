@@ -0,0 +1,222 @@
+"""
+Fault injection for the HTTP proxy (utilities/httpProxy.py).
+Degrades the requests of matching routes with added latency, a bandwidth
+cap, dropped connections and bursts of 5xx responses, so tests can check
+that the page object waits stay correct (and still return as soon as the
+page is ready) when the application is slow or failing.
+
+Rules are [fault:NAME] sections of config.ini:
+
+    [fault:slow-home]
+    route = /home*
+    latency_ms = 2500
+
+applied to every request of a run with [proxy] faults = NAME, ... (or
+--config-set proxy_faults=NAME), or to one test with
+@pytest.mark.faults("slow-home"). A marker can also define a rule inline:
+@pytest.mark.faults(route="/login", error_burst=2).
+"""
+
+import fnmatch
+import random
+import threading
+from urllib.parse import urlsplit
+
+from utilities.readProperties import ReadConfig, parse_list
+
+
+class FaultRule:
+    """
+    One fault injection rule: the requests it matches and what happens to them.
+    """
+
+    # option -> (type, default), as written in [fault:NAME] sections and marker keywords
+    #   route: glob pattern on the request path ("*" also matches "/")
+    #   methods: HTTP methods the rule applies to (empty: all)
+    #   latency_ms, jitter_ms: delay before the request is answered (plus a random 0..jitter)
+    #   bandwidth_kbps: response body write rate in KiB/s (0: unlimited)
+    #   drop_rate: share of requests whose connection is closed without a response
+    #   error_status: status of injected errors
+    #   error_burst, error_every: the first error_burst matching requests of
+    #       every error_every get error_status instead of the app's response
+    #       (error_every 0: only the first burst)
+    FIELDS = {
+        "route": (str, "*"),
+        "methods": (list, []),
+        "latency_ms": (float, 0.0),
+        "jitter_ms": (float, 0.0),
+        "bandwidth_kbps": (float, 0.0),
+        "drop_rate": (float, 0.0),
+        "error_status": (int, 503),
+        "error_burst": (int, 0),
+        "error_every": (int, 0),
+    }
+
+    def __init__(self, name, **options):
+        """
+        Initialize a rule from raw (config) or typed (marker) options.
+
+        Args:
+            name: Rule name, reported with every degraded request
+            **options: Options of FIELDS
+
+        Raises:
+            ValueError: For unknown options, bad types or out of range values
+        """
+        unknown = sorted(set(options) - set(self.FIELDS))
+        if unknown:
+            raise ValueError(f"Unknown option {', '.join(unknown)} in fault rule '{name}' "
+                             f"(known: {', '.join(self.FIELDS)})")
+        self.name = name
+        for option, (kind, default) in self.FIELDS.items():
+            raw = options.get(option, default)
+            try:
+                value = parse_list(raw) if kind is list else kind(raw)
+            except ValueError as error:
+                raise ValueError(f"Invalid {kind.__name__} for {option} in fault rule '{name}': {raw!r}") from error
+            setattr(self, option, value)
+        self.methods = [method.upper() for method in self.methods]
+        if not 0 <= self.drop_rate <= 1:
+            raise ValueError(f"drop_rate of fault rule '{name}' must be between 0 and 1")
+        if not 400 <= self.error_status <= 599:
+            raise ValueError(f"error_status of fault rule '{name}' must be an error status (4xx/5xx)")
+        self.matched = 0
+
+    def matches(self, method, path):
+        """
+        Check whether the rule applies to a request.
+
+        Args:
+            method: HTTP method
+            path: Request path without the query string
+
+        Returns:
+            bool: True if method and path match
+        """
+        return (not self.methods or method.upper() in self.methods) and fnmatch.fnmatchcase(path, self.route)
+
+    def decide(self, rng):
+        """
+        Decide what happens to the next matching request.
+
+        Args:
+            rng: random.Random used for jitter and drops
+
+        Returns:
+            dict: rule, delay (seconds), drop (bool), status (injected error
+                  status or None) and bandwidth (bytes per second or None),
+                  or None when the request passes unchanged
+        """
+        index, self.matched = self.matched, self.matched + 1
+        cycle = index % self.error_every if self.error_every else index
+        decision = {
+            "rule": self.name,
+            "delay": (self.latency_ms + rng.uniform(0, self.jitter_ms)) / 1000,
+            "drop": rng.random() < self.drop_rate,
+            "status": self.error_status if cycle < self.error_burst else None,
+            "bandwidth": self.bandwidth_kbps * 1024 or None,
+        }
+        return decision if any(value for name, value in decision.items() if name != "rule") else None
+
+
+class FaultPlan:
+    """
+    Rules in effect on a proxy. The first rule matching a request applies;
+    the test session swaps the rules per test (marker rules first, then the
+    rules of the whole run).
+    """
+
+    def __init__(self, rules=(), seed=None):
+        """
+        Initialize the plan.
+
+        Args:
+            rules: FaultRule list
+            seed: Seed of the jitter and drop decisions (None: random)
+        """
+        self.rules = list(rules)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def rules_for(names, definitions=None):
+        """
+        Build the rules of [fault:NAME] sections.
+
+        Args:
+            names: Rule names
+            definitions: Rule name -> options (default: config.ini)
+
+        Returns:
+            list: FaultRule per name
+
+        Raises:
+            ValueError: If a rule is not defined or invalid
+        """
+        definitions = ReadConfig.get_fault_rules() if definitions is None else definitions
+        for name in names:
+            if name not in definitions:
+                raise ValueError(f"Unknown fault rule '{name}' (no [fault:{name}] section in config.ini)")
+        return [FaultRule(name, **definitions[name]) for name in names]
+
+    @classmethod
+    def run_rules(cls):
+        """
+        Build the rules applied to every request of the run ([proxy] faults).
+
+        Returns:
+            list: FaultRule list
+        """
+        return cls.rules_for(ReadConfig.get_proxy_faults())
+
+    @classmethod
+    def for_item(cls, item, default=None):
+        """
+        Build the rules of a test item: the 'faults' marker's named and inline
+        rules, then the rules of the run.
+
+        Args:
+            item: pytest item
+            default: Rules of tests without a marker (default: run_rules())
+
+        Returns:
+            list: FaultRule list
+        """
+        rules = []
+        marker = item.get_closest_marker("faults")
+        if marker:
+            rules.extend(cls.rules_for(marker.args))
+            if marker.kwargs:
+                rules.append(FaultRule(item.name, **marker.kwargs))
+        return rules + (cls.run_rules() if default is None else list(default))
+
+    def use(self, rules):
+        """
+        Replace the rules in effect, restarting their error burst counters.
+
+        Args:
+            rules: FaultRule list
+        """
+        with self._lock:
+            for rule in rules:
+                rule.matched = 0
+            self.rules = list(rules)
+
+    def decide(self, method, target):
+        """
+        Decide what happens to a request.
+
+        Args:
+            method: HTTP method
+            target: Request target (path and query)
+
+        Returns:
+            dict: Decision of the first matching rule (see FaultRule.decide), or
+                  None when no rule matches or the request passes unchanged
+        """
+        path = urlsplit(target).path
+        with self._lock:
+            for rule in self.rules:
+                if rule.matches(method, path):
+                    return rule.decide(self._random)
+        return None
@@ -0,0 +1,473 @@
+"""
+HAR recorder utility for Edge (Chromium) sessions.
+EdgeDriver buffers the DevTools network and page events of a test in its
+performance log while the test runs; the recorder fetches them once the test
+is finished and a background thread converts them into a HAR 1.2 file
+(Logs/har_<run>_<test>.har) and logs a summary, so recording never adds work
+to the timed part of a test.
+
+Usage (from tests/Selenium):
+    pytest --har                                   # record every browser test
+    python -m utilities.harRecorder summary Logs/har_20260101_120000-3fa2_test_TC_EVT_030.har
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+from utilities.customLogger import CustomLogger
+from utilities.workerContext import WorkerContext
+
+
+class HarRecorder:
+    """
+    Records the network traffic of one test as a HAR file.
+    """
+
+    # Performance log capabilities of EdgeDriver (network and page lifecycle events)
+    LOG_TYPE = "performance"
+    LOGGING_PREFS = {"performance": "ALL"}
+    PERF_LOGGING_PREFS = {"enableNetwork": True, "enablePage": True}
+
+    # Requests listed in the summary
+    SLOWEST = 5
+
+    # Converts and writes HAR files off the test thread (one per process, in order)
+    _executor = None
+
+    def __init__(self, name, logs_dir=None):
+        """
+        Initialize a recorder.
+
+        Args:
+            name: Test node id (used for the file name and the log)
+            logs_dir: Output directory (default: tests/Selenium/Logs)
+        """
+        self.name = name
+        self.path = os.path.join(logs_dir or CustomLogger.logs_dir(), self.file_name(name))
+        self.driver = None
+        self.future = None
+
+    @staticmethod
+    def file_name(name):
+        """
+        Build the HAR file name of a test for the current run.
+
+        Returns:
+            str: File name such as har_<run>_test_003_events_test_TC_EVT_030.har
+        """
+        slug = re.sub(r"[^\w.-]+", "_", os.path.basename(name).replace(".py::", "_"))
+        return f"har_{WorkerContext.run_id()}_{slug.strip('_')[:150]}.har"
+
+    @classmethod
+    def enable(cls, options):
+        """
+        Turn on the performance log in Edge options (needed before the
+        browser starts; recording itself is opt-in per test).
+
+        Args:
+            options: Edge Options
+        """
+        options.set_capability("ms:loggingPrefs", cls.LOGGING_PREFS)
+        options.add_experimental_option("perfLoggingPrefs", cls.PERF_LOGGING_PREFS)
+
+    @classmethod
+    def drain(cls, driver):
+        """
+        Fetch and clear the buffered performance log of a driver.
+
+        Returns:
+            list: Log entries (empty if the driver has no performance log)
+        """
+        entries = []
+        try:
+            while True:
+                batch = driver.get_log(cls.LOG_TYPE)
+                if not batch:
+                    return entries
+                entries.extend(batch)
+        except (WebDriverException, AttributeError):
+            return entries
+
+    def start(self, driver):
+        """
+        Start recording: discard the events buffered before the test
+        (pooled drivers keep the log of earlier tests and resets).
+
+        Args:
+            driver: WebDriver of the test
+
+        Returns:
+            bool: True if the driver supports recording
+        """
+        if not hasattr(driver, "get_log"):
+            return False
+        try:
+            if self.LOG_TYPE not in driver.log_types:
+                return False
+        except WebDriverException:
+            return False
+        self.drain(driver)
+        self.driver = driver
+        return True
+
+    def stop(self):
+        """
+        Stop recording and hand the events to the background writer.
+        Call before the driver is reset or released.
+
+        Returns:
+            Future: Resolves to the summary dict once the HAR file is written
+                    (None if nothing was recorded)
+        """
+        if self.driver is None:
+            return None
+        entries, self.driver = self.drain(self.driver), None
+        if HarRecorder._executor is None:
+            HarRecorder._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="har")
+        self.future = HarRecorder._executor.submit(self._process, entries)
+        return self.future
+
+    def summary(self, timeout=None):
+        """
+        Wait for the HAR file and get its summary.
+
+        Returns:
+            dict: Summary (see summarize), or None if nothing was recorded
+        """
+        return self.future.result(timeout) if self.future else None
+
+    def _process(self, entries):
+        """
+        Convert, write and summarize a recording (background thread).
+        """
+        har = self.build(entries, comment=self.name)
+        temporary = self.path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            json.dump(har, handle, indent=1)
+        os.replace(temporary, self.path)
+        summary = self.summarize(har)
+        CustomLogger.get_logger().info(
+            f"HAR {self.name} -> {os.path.basename(self.path)}\n{self.format_summary(summary)}"
+        )
+        return summary
+
+    @classmethod
+    def shutdown(cls):
+        """
+        Wait for the pending HAR files to be written.
+        """
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=True)
+            cls._executor = None
+
+    @staticmethod
+    def messages(entries):
+        """
+        Decode performance log entries into (method, params) pairs.
+        """
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            yield message.get("method"), message.get("params", {})
+
+    @staticmethod
+    def iso_time(wall_time):
+        """
+        Format an epoch timestamp as an ISO 8601 UTC date.
+        """
+        stamp = datetime.fromtimestamp(wall_time, timezone.utc).isoformat(timespec="milliseconds")
+        return stamp.replace("+00:00", "Z")
+
+    @staticmethod
+    def http_version(protocol):
+        """
+        Map a DevTools protocol name (h2, http/1.1) to an HTTP version.
+        """
+        versions = {"h2": "HTTP/2", "h3": "HTTP/3", "http/1.0": "HTTP/1.0", "http/1.1": "HTTP/1.1"}
+        return versions.get((protocol or "").lower(), (protocol or "").upper())
+
+    @staticmethod
+    def name_values(pairs):
+        """
+        Convert a header dict or (name, value) pairs to HAR name/value objects.
+        """
+        items = pairs.items() if isinstance(pairs, dict) else pairs
+        return [{"name": name, "value": str(value)} for name, value in items]
+
+    @classmethod
+    def build(cls, entries, comment=""):
+        """
+        Convert performance log entries to a HAR document.
+        A page is started by each main frame document request; other
+        requests belong to the page of the document that loaded them.
+
+        Args:
+            entries: Performance log entries (driver.get_log("performance"))
+            comment: Log comment (test id)
+
+        Returns:
+            dict: HAR 1.2 document
+        """
+        pages, page_by_loader, open_requests, requests = [], {}, {}, []
+        main_frame = None
+        for method, params in cls.messages(entries):
+            request_id = params.get("requestId")
+            if method == "Network.requestWillBeSent":
+                previous = open_requests.pop(request_id, None)
+                if previous and params.get("redirectResponse"):
+                    previous["response"] = params["redirectResponse"]
+                    previous["end"] = params["timestamp"]
+                    requests.append(previous)
+                if params.get("type") == "Document" and request_id == params.get("loaderId"):
+                    main_frame = main_frame or params.get("frameId")
+                    if params.get("frameId") == main_frame and request_id not in page_by_loader:
+                        pages.append({
+                            "id": f"page_{len(pages) + 1}", "url": params["request"]["url"],
+                            "wall_time": params["wallTime"], "timestamp": params["timestamp"],
+                            "timings": {},
+                        })
+                        page_by_loader[request_id] = pages[-1]
+                page = page_by_loader.get(params.get("loaderId")) or (pages[-1] if pages else None)
+                open_requests[request_id] = {
+                    "params": params, "page": page, "response": None, "type": params.get("type"),
+                    "data": 0, "encoded": None, "end": None, "error": None,
+                }
+                continue
+
+            request = open_requests.get(request_id)
+            if method == "Network.responseReceived" and request:
+                request["response"] = params["response"]
+                request["type"] = params.get("type", request["type"])
+            elif method == "Network.dataReceived" and request:
+                request["data"] += params.get("dataLength", 0)
+            elif method in ("Network.loadingFinished", "Network.loadingFailed") and request:
+                request["end"] = params["timestamp"]
+                request["encoded"] = params.get("encodedDataLength")
+                if method == "Network.loadingFailed":
+                    request["error"] = params.get("blockedReason") or params.get("errorText")
+                requests.append(open_requests.pop(request_id))
+            elif method in ("Page.domContentEventFired", "Page.loadEventFired"):
+                key = "onContentLoad" if method == "Page.domContentEventFired" else "onLoad"
+                for page in reversed(pages):
+                    if page["timestamp"] <= params["timestamp"]:
+                        page["timings"].setdefault(key, round((params["timestamp"] - page["timestamp"]) * 1000, 3))
+                        break
+
+        # Requests still open when the test ended are kept, without an end time
+        requests.extend(open_requests.values())
+        har_entries = [cls._entry(request) for request in requests]
+        har_entries.sort(key=lambda entry: entry["startedDateTime"])
+        return {
+            "log": {
+                "version": "1.2",
+                "creator": {"name": "AAB_EventPlanner Selenium HarRecorder", "version": "1.0"},
+                "browser": {"name": "Microsoft Edge", "version": ""},
+                "pages": [{
+                    "startedDateTime": cls.iso_time(page["wall_time"]),
+                    "id": page["id"],
+                    "title": page["url"],
+                    "pageTimings": {"onContentLoad": page["timings"].get("onContentLoad", -1),
+                                    "onLoad": page["timings"].get("onLoad", -1)},
+                } for page in pages],
+                "entries": har_entries,
+                "comment": comment,
+            }
+        }
+
+    @staticmethod
+    def _timings(request):
+        """
+        Compute HAR timings (ms) from the DevTools resource timing of a request.
+
+        Returns:
+            tuple: (timings dict, total time)
+        """
+        params, response = request["params"], request["response"] or {}
+        timing, end = response.get("timing"), request["end"]
+        if not timing:
+            total = round((end - params["timestamp"]) * 1000, 3) if end else 0
+            return {"blocked": -1, "dns": -1, "connect": -1, "ssl": -1,
+                    "send": 0, "wait": total, "receive": 0}, total
+
+        def phase(start, stop):
+            return round(timing[stop] - timing[start], 3) if timing.get(start, -1) >= 0 else -1
+
+        # Queued in the browser, then stalled until DNS, connect or send started
+        first = next((timing[key] for key in ("dnsStart", "connectStart", "sendStart") if timing.get(key, -1) >= 0), 0)
+        timings = {
+            "blocked": round(max((timing["requestTime"] - params["timestamp"]) * 1000 + first, 0), 3),
+            "dns": phase("dnsStart", "dnsEnd"),
+            "connect": phase("connectStart", "connectEnd"),
+            "ssl": phase("sslStart", "sslEnd"),
+            "send": round(max(timing["sendEnd"] - timing["sendStart"], 0), 3),
+            "wait": round(max(timing["receiveHeadersEnd"] - timing["sendEnd"], 0), 3),
+            "receive": round(max((end - timing["requestTime"]) * 1000 - timing["receiveHeadersEnd"], 0), 3)
+            if end else 0,
+        }
+        # ssl is part of connect in HAR
+        total = round(sum(value for key, value in timings.items() if key != "ssl" and value > 0), 3)
+        return timings, total
+
+    @classmethod
+    def _entry(cls, request):
+        """
+        Build the HAR entry of a request.
+        """
+        params, response = request["params"], request["response"] or {}
+        sent = params["request"]
+        timings, total = cls._timings(request)
+        transfer = request["encoded"] if request["encoded"] is not None else response.get("encodedDataLength", -1)
+        post_data = sent.get("postData")
+        headers = response.get("headers", {})
+        entry = {
+            "startedDateTime": cls.iso_time(params["wallTime"]),
+            "time": total,
+            "request": {
+                "method": sent.get("method", "GET"),
+                "url": sent["url"],
+                "httpVersion": cls.http_version(response.get("protocol")),
+                "cookies": [],
+                "headers": cls.name_values(sent.get("headers", {})),
+                "queryString": cls.name_values(parse_qsl(urlsplit(sent["url"]).query, keep_blank_values=True)),
+                "headersSize": -1,
+                "bodySize": len(post_data.encode("utf-8")) if post_data else 0,
+            },
+            "response": {
+                "status": response.get("status", 0),
+                "statusText": response.get("statusText", ""),
+                "httpVersion": cls.http_version(response.get("protocol")),
+                "cookies": [],
+                "headers": cls.name_values(headers),
+                "content": {"size": request["data"], "mimeType": response.get("mimeType", "x-unknown")},
+                "redirectURL": next((value for name, value in headers.items() if name.lower() == "location"), ""),
+                "headersSize": -1,
+                "bodySize": -1,
+                "_transferSize": transfer,
+            },
+            "cache": {},
+            "timings": timings,
+            "_resourceType": (request["type"] or "Other").lower(),
+        }
+        if post_data:
+            entry["request"]["postData"] = {
+                "mimeType": next((value for name, value in sent.get("headers", {}).items()
+                                  if name.lower() == "content-type"), ""),
+                "text": post_data,
+            }
+        if request["page"]:
+            entry["pageref"] = request["page"]["id"]
+        if response.get("remoteIPAddress"):
+            entry["serverIPAddress"] = response["remoteIPAddress"]
+        if request["error"]:
+            entry["_error"] = request["error"]
+        if request["end"] is None:
+            entry["_pending"] = True
+        return entry
+
+    @staticmethod
+    def entry_bytes(entry):
+        """
+        Get the bytes transferred for an entry (decoded size if unknown).
+        """
+        transfer = entry["response"].get("_transferSize", -1)
+        return transfer if transfer is not None and transfer >= 0 else entry["response"]["content"].get("size", 0)
+
+    @classmethod
+    def summarize(cls, har, slowest=None):
+        """
+        Summarize a HAR document: requests and bytes per navigation and the
+        slowest requests.
+
+        Args:
+            har: HAR document
+            slowest: Number of slowest requests to list (default: SLOWEST)
+
+        Returns:
+            dict: requests, bytes, pages (url, requests, bytes, failed, on_load_ms)
+                  and slowest (url, status, time_ms, bytes, page)
+        """
+        entries = har["log"]["entries"]
+        navigations = [(page["id"], page["title"], page["pageTimings"].get("onLoad", -1))
+                       for page in har["log"]["pages"]]
+        if any("pageref" not in entry for entry in entries):
+            navigations.insert(0, (None, "(before first navigation)", -1))
+
+        pages = []
+        for page_id, url, on_load in navigations:
+            own = [entry for entry in entries if entry.get("pageref") == page_id]
+            pages.append({
+                "url": url,
+                "requests": len(own),
+                "bytes": sum(cls.entry_bytes(entry) for entry in own),
+                "failed": sum(1 for entry in own if "_error" in entry or entry["response"]["status"] >= 400),
+                "on_load_ms": on_load,
+            })
+        ranked = sorted(entries, key=lambda entry: entry["time"], reverse=True)
+        return {
+            "requests": len(entries),
+            "bytes": sum(cls.entry_bytes(entry) for entry in entries),
+            "pages": pages,
+            "slowest": [{
+                "url": entry["request"]["url"],
+                "status": entry["response"]["status"],
+                "time_ms": entry["time"],
+                "bytes": cls.entry_bytes(entry),
+                "page": entry.get("pageref"),
+            } for entry in ranked[:slowest or cls.SLOWEST]],
+        }
+
+    @staticmethod
+    def format_summary(summary):
+        """
+        Format a summary as text lines for the log.
+
+        Returns:
+            str: One line per navigation, then the slowest requests
+        """
+        lines = [f"  {summary['requests']} requests, {summary['bytes'] / 1024:.1f} KiB"]
+        for page in summary["pages"]:
+            on_load = f", load {page['on_load_ms']:.0f} ms" if page["on_load_ms"] >= 0 else ""
+            failed = f", {page['failed']} failed" if page["failed"] else ""
+            lines.append(f"  {page['url']}: {page['requests']} requests, "
+                         f"{page['bytes'] / 1024:.1f} KiB{failed}{on_load}")
+        if summary["slowest"]:
+            lines.append("  slowest:")
+            lines.extend(f"    {request['time_ms']:8.1f} ms  {request['status']}  {request['url']}"
+                         for request in summary["slowest"])
+        return "\n".join(lines)
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Returns:
+        int: Exit status
+    """
+    parser = argparse.ArgumentParser(prog="python -m utilities.harRecorder")
+    commands = parser.add_subparsers(dest="command", required=True)
+    summary_parser = commands.add_parser("summary", help="Summarize HAR files")
+    summary_parser.add_argument("paths", nargs="+")
+    summary_parser.add_argument("--slowest", type=int, default=HarRecorder.SLOWEST)
+    args = parser.parse_args(argv)
+
+    for path in args.paths:
+        with open(path, encoding="utf-8") as handle:
+            har = json.load(handle)
+        print(path)
+        print(HarRecorder.format_summary(HarRecorder.summarize(har, args.slowest)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
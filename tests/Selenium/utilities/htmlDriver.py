@@ -0,0 +1,728 @@
+"""
+Browserless driver utility for HTML-only tests.
+Implements the subset of the WebDriver API used by the page objects on top of
+an HTTP client and lxml, for assertions that only need server-rendered HTML.
+"""
+
+import re
+from urllib.parse import urlencode, urljoin, urlsplit, urlunsplit
+
+import lxml.html
+import requests
+from lxml.cssselect import CSSSelector
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+from utilities.httpLogin import HttpLogin
+
+
+# onclick handlers that navigate, e.g. the event cards on /home
+ONCLICK_NAVIGATION = re.compile(r"""location(?:\.href)?\s*=\s*['"]([^'"]+)['"]""")
+
+# onchange/onkeypress handlers that submit the owning form
+SUBMITS_FORM = re.compile(r"\.submit\(\)")
+
+# Keys that trigger implicit form submission
+SUBMIT_KEYS = (Keys.RETURN, Keys.ENTER)
+
+# Elements that are never rendered
+HIDDEN_TAGS = {"head", "script", "style", "template", "noscript", "title", "meta", "link"}
+
+# Input types that are not submitted as regular values
+NON_VALUE_INPUTS = {"submit", "button", "image", "reset", "file"}
+
+# Minimal email check matching the browser's type=email constraint
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+$")
+
+
+def locator_to_xpath(by, value):
+    """
+    Translate a Selenium locator into an XPath expression.
+
+    Args:
+        by: Locator strategy (selenium By constant)
+        value: Locator value
+
+    Returns:
+        str: Equivalent XPath expression
+    """
+    if by == By.XPATH:
+        return value
+    if by == By.CSS_SELECTOR:
+        return CSSSelector(value, translator="html").path
+    if by == By.ID:
+        return f'//*[@id="{value}"]'
+    if by == By.NAME:
+        return f'//*[@name="{value}"]'
+    if by == By.CLASS_NAME:
+        return f'//*[contains(concat(" ", normalize-space(@class), " "), " {value} ")]'
+    if by == By.TAG_NAME:
+        return f"//{value}"
+    if by == By.LINK_TEXT:
+        return f'//a[normalize-space(.)="{value}"]'
+    if by == By.PARTIAL_LINK_TEXT:
+        return f'//a[contains(., "{value}")]'
+    raise WebDriverException(f"Unsupported locator strategy in HTML mode: {by}")
+
+
+class HtmlElement:
+    """
+    WebElement counterpart backed by an lxml node.
+    Goes stale as soon as the driver loads another document.
+    """
+
+    def __init__(self, driver, node):
+        """
+        Initialize the element.
+
+        Args:
+            driver: Owning HtmlDriver
+            node: lxml.html element
+        """
+        self._driver = driver
+        self._node = node
+        self._generation = driver._generation
+
+    @property
+    def node(self):
+        """
+        Get the underlying lxml node, checking that it is still attached.
+
+        Returns:
+            lxml.html.HtmlElement: The node
+        """
+        if self._generation != self._driver._generation:
+            raise StaleElementReferenceException("Element belongs to a previous page")
+        return self._node
+
+    @property
+    def tag_name(self):
+        """
+        Get the lower-case tag name.
+
+        Returns:
+            str: Tag name such as "input"
+        """
+        return self.node.tag.lower()
+
+    @property
+    def text(self):
+        """
+        Get the rendered text (whitespace collapsed, hidden content skipped).
+        """
+        if not self.is_displayed():
+            return ""
+        parts = []
+        for text in self.node.xpath(".//text()[not(ancestor::script or ancestor::style)]"):
+            parts.append(text)
+        return " ".join("".join(parts).split())
+
+    def find_element(self, by=By.ID, value=None):
+        """
+        Find the first matching element below this one.
+
+        Args:
+            by: Locator strategy
+            value: Locator value
+
+        Returns:
+            HtmlElement: The element
+
+        Raises:
+            NoSuchElementException: If nothing matches
+        """
+        return self._driver._find_element(self.node, by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        """
+        Find all matching elements below this one.
+
+        Args:
+            by: Locator strategy
+            value: Locator value
+
+        Returns:
+            list: HtmlElement list (empty if nothing matches)
+        """
+        return self._driver._find_elements(self.node, by, value)
+
+    def get_dom_attribute(self, name):
+        """
+        Read an attribute as written in the markup.
+
+        Args:
+            name: Attribute name
+
+        Returns:
+            str: Attribute value, or None if absent
+        """
+        return self.node.get(name)
+
+    def get_attribute(self, name):
+        """
+        Read a property, falling back to the attribute, like WebDriver.
+
+        Args:
+            name: Property or attribute name
+
+        Returns:
+            str: "true" for set boolean properties, the value as a string, or None
+        """
+        value = self.get_property(name)
+        if isinstance(value, bool):
+            return "true" if value else None
+        return None if value is None else str(value)
+
+    def get_property(self, name):
+        """
+        Read a DOM property (value, checked, selected, href, innerText, ...).
+        """
+        node = self.node
+        if name == "value":
+            if node.tag == "select":
+                return self._selected_value(node)
+            if node.tag == "textarea":
+                return node.text or ""
+            if node.tag == "option":
+                return self._option_value(node)
+            return node.get("value", "")
+        if name in ("checked", "selected", "disabled", "required", "multiple"):
+            return node.get(name) is not None
+        if name in ("href", "src", "action"):
+            return urljoin(self._driver.current_url, node.get(name, "")) if node.get(name) is not None else None
+        if name in ("innerText", "textContent"):
+            return self.text if name == "innerText" else node.text_content()
+        if name == "tagName":
+            return node.tag.upper()
+        return node.get(name)
+
+    def is_displayed(self):
+        """
+        Approximate visibility from markup: hidden attribute, inline
+        display/visibility styles, hidden inputs and non-rendered tags.
+        """
+        node = self.node
+        if node.tag == "input" and node.get("type", "").lower() == "hidden":
+            return False
+        for element in [node, *node.iterancestors()]:
+            if not isinstance(element.tag, str) or element.tag in HIDDEN_TAGS:
+                return False
+            if element.get("hidden") is not None:
+                return False
+            style = element.get("style", "").replace(" ", "").lower()
+            if "display:none" in style or "visibility:hidden" in style:
+                return False
+        return True
+
+    def is_enabled(self):
+        """
+        Check that the element has no disabled attribute.
+
+        Returns:
+            bool: True if enabled
+        """
+        return self.node.get("disabled") is None
+
+    def is_selected(self):
+        """
+        Check whether an option is selected or a checkbox/radio is checked.
+
+        Returns:
+            bool: True if selected or checked
+        """
+        node = self.node
+        return node.get("selected") is not None or node.get("checked") is not None
+
+    def clear(self):
+        """
+        Empty the value of an input or textarea.
+        """
+        node = self.node
+        if node.tag == "textarea":
+            node.text = ""
+        else:
+            node.set("value", "")
+
+    def send_keys(self, *values):
+        """
+        Type into an input; RETURN/ENTER submits the owning form.
+        """
+        node = self.node
+        text = "".join(str(value) for value in values)
+        submit = any(key in text for key in SUBMIT_KEYS)
+        # Drop WebDriver special keys (Unicode private use area)
+        text = "".join(char for char in text if not "\ue000" <= char <= "\uf8ff")
+        if text:
+            if node.tag == "textarea":
+                node.text = (node.text or "") + text
+            else:
+                node.set("value", node.get("value", "") + text)
+        if submit:
+            form = self._form()
+            if form is not None:
+                self._driver._submit(form)
+
+    def submit(self):
+        """
+        Submit the form of the element (or the element itself if it is a form).
+
+        Raises:
+            WebDriverException: If the element is not inside a form
+        """
+        form = self.node if self.node.tag == "form" else self._form()
+        if form is None:
+            raise WebDriverException("Element is not inside a form")
+        self._driver._submit(form)
+
+    def click(self):
+        """
+        Emulate a click: submit buttons submit their form, links and
+        location-changing onclick handlers navigate, options get selected,
+        checkboxes and radios toggle.
+        """
+        node = self.node
+        if not self.is_enabled():
+            return
+        tag = node.tag
+        input_type = node.get("type", "submit" if tag == "button" else "text").lower()
+
+        if tag == "option":
+            self._select_option(node)
+            return
+        if tag == "input" and input_type in ("checkbox", "radio"):
+            if input_type == "radio":
+                form = self._form()
+                scope = form if form is not None else node.getroottree().getroot()
+                for other in scope.xpath(".//input[@type='radio'][@name=$name]", name=node.get("name", "")):
+                    other.attrib.pop("checked", None)
+                node.set("checked", "checked")
+            elif node.get("checked") is not None:
+                node.attrib.pop("checked")
+            else:
+                node.set("checked", "checked")
+            return
+        if tag in ("button", "input") and input_type == "submit":
+            form = self._form()
+            if form is not None:
+                self._driver._submit(form, submitter=node)
+            return
+
+        # Links and onclick navigation, including clicks bubbling up to a card
+        for element in [node, *node.iterancestors()]:
+            if element.tag == "a" and element.get("href") and not element.get("href").startswith("#"):
+                self._driver.get(urljoin(self._driver.current_url, element.get("href")))
+                return
+            match = ONCLICK_NAVIGATION.search(element.get("onclick", ""))
+            if match:
+                self._driver.get(urljoin(self._driver.current_url, match.group(1)))
+                return
+
+    def _form(self):
+        """
+        Find the form owning this element.
+        """
+        node = self.node
+        if node.get("form"):
+            forms = node.getroottree().getroot().xpath("//form[@id=$id]", id=node.get("form"))
+            return forms[0] if forms else None
+        return next((a for a in node.iterancestors("form")), None)
+
+    def _select_option(self, option):
+        """
+        Select an option, deselecting the others of a single select, and
+        submit the form when the select's onchange does.
+        """
+        select = next(option.iterancestors("select"), None)
+        if select is None:
+            return
+        if select.get("multiple") is None:
+            for other in select.iter("option"):
+                other.attrib.pop("selected", None)
+        option.set("selected", "selected")
+        if SUBMITS_FORM.search(select.get("onchange", "")):
+            form = next(select.iterancestors("form"), None)
+            if form is not None:
+                self._driver._submit(form)
+
+    @staticmethod
+    def _selected_value(select):
+        """
+        Get the value a select submits (its first option when none is selected).
+        """
+        options = list(select.iter("option"))
+        selected = [option for option in options if option.get("selected") is not None]
+        option = selected[0] if selected else (options[0] if options else None)
+        return HtmlElement._option_value(option) if option is not None else ""
+
+    @staticmethod
+    def _option_value(option):
+        """
+        Get the value of an option (its text when it has no value attribute).
+        """
+        value = option.get("value")
+        return value if value is not None else " ".join(option.text_content().split())
+
+
+class HtmlDriver:
+    """
+    Browserless WebDriver stand-in for tests that do not need JavaScript.
+    Page loads are synchronous HTTP requests, so there is nothing to wait for.
+    """
+
+    # Lets page objects skip JavaScript-based waits and helpers
+    javascript_enabled = False
+
+    def __init__(self, session=None):
+        """
+        Initialize the driver.
+
+        Args:
+            session: requests.Session to use (default: new pooled session)
+        """
+        self.session = session or HttpLogin.new_session()
+        self.current_url = "about:blank"
+        self.status_code = None
+        self.page_source = ""
+        self._document = lxml.html.document_fromstring("<html><head></head><body></body></html>")
+        self._generation = 0
+
+    # Navigation
+
+    def get(self, url):
+        """
+        Load a URL (following redirects).
+
+        Args:
+            url: Absolute URL
+        """
+        self._load(self._request("GET", url))
+
+    def refresh(self):
+        """
+        Load the current URL again.
+        """
+        self.get(self.current_url)
+
+    def _request(self, method, url, **kwargs):
+        """
+        Send a request of a page load or form submission.
+
+        Raises:
+            WebDriverException: If the server cannot be reached or closes the
+                                connection without a response (like a browser's net::ERR_* errors)
+        """
+        try:
+            return self.session.request(method, url, timeout=HttpLogin.TIMEOUT, **kwargs)
+        except requests.RequestException as error:
+            raise WebDriverException(f"Navigation to {url} failed: {error}") from error
+
+    def _load(self, response):
+        """
+        Replace the current document with an HTTP response.
+        """
+        self.current_url = response.url
+        self.status_code = response.status_code
+        self.page_source = response.text
+        content_type = response.headers.get("Content-Type", "")
+        if "html" in content_type and response.content.strip():
+            self._document = lxml.html.document_fromstring(response.content, base_url=response.url)
+        else:
+            self._document = lxml.html.document_fromstring("<html><head></head><body></body></html>")
+        self._generation += 1
+
+    def _submit(self, form, submitter=None):
+        """
+        Submit a form the way a browser would (HTML5 validation included).
+
+        Args:
+            form: lxml form node
+            submitter: Button node that triggered the submission
+        """
+        if form.get("novalidate") is None and not self.check_validity(form):
+            return
+        fields = self.form_values(form)
+        if submitter is not None and submitter.get("name"):
+            fields.append((submitter.get("name"), submitter.get("value", "")))
+
+        action = urljoin(self.current_url, form.get("action") or self.current_url)
+        if form.get("method", "get").lower() == "post":
+            response = self._request("POST", action, data=fields)
+        else:
+            parts = urlsplit(action)
+            action = urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(fields), ""))
+            response = self._request("GET", action)
+        self._load(response)
+
+    @staticmethod
+    def form_values(form):
+        """
+        Collect the successful controls of a form.
+
+        Args:
+            form: lxml form node
+
+        Returns:
+            list: (name, value) pairs in document order
+        """
+        fields = []
+        for control in form.xpath(".//input | .//select | .//textarea"):
+            name = control.get("name")
+            if not name or control.get("disabled") is not None:
+                continue
+            if control.tag == "input":
+                input_type = control.get("type", "text").lower()
+                if input_type in NON_VALUE_INPUTS:
+                    continue
+                if input_type in ("checkbox", "radio"):
+                    if control.get("checked") is not None:
+                        fields.append((name, control.get("value", "on")))
+                    continue
+                fields.append((name, control.get("value", "")))
+            elif control.tag == "select":
+                options = list(control.iter("option"))
+                selected = [option for option in options if option.get("selected") is not None]
+                if not selected and options and control.get("multiple") is None:
+                    selected = options[:1]
+                for option in selected:
+                    fields.append((name, HtmlElement._option_value(option)))
+            else:
+                fields.append((name, control.text or ""))
+        return fields
+
+    @staticmethod
+    def check_validity(form):
+        """
+        Apply the browser's constraint validation (required, type=email, minlength).
+
+        Args:
+            form: lxml form node
+
+        Returns:
+            bool: True if the form may be submitted
+        """
+        for control in form.xpath(".//input | .//select | .//textarea"):
+            if control.get("disabled") is not None:
+                continue
+            input_type = control.get("type", "text").lower()
+            if input_type in NON_VALUE_INPUTS or input_type == "hidden":
+                continue
+            if control.tag == "textarea":
+                value = control.text or ""
+            elif control.tag == "select":
+                value = HtmlElement._selected_value(control)
+            else:
+                value = control.get("value", "")
+            if input_type in ("checkbox", "radio"):
+                value = "on" if control.get("checked") is not None else ""
+            if control.get("required") is not None and not value:
+                return False
+            if value and input_type == "email" and not EMAIL_PATTERN.match(value):
+                return False
+            minlength = control.get("minlength")
+            if value and minlength and minlength.isdigit() and len(value) < int(minlength):
+                return False
+        return True
+
+    def is_submission_blocked(self, element):
+        """
+        Check whether constraint validation would block the element's form.
+
+        Args:
+            element: HtmlElement inside a form
+
+        Returns:
+            bool: True if the owning form is invalid
+        """
+        form = element._form()
+        return form is not None and form.get("novalidate") is None and not self.check_validity(form)
+
+    # Document access
+
+    @property
+    def title(self):
+        """
+        Get the document title.
+
+        Returns:
+            str: Title text (empty if there is none)
+        """
+        return (self._document.findtext(".//title") or "").strip()
+
+    def find_element(self, by=By.ID, value=None):
+        """
+        Find the first matching element of the document.
+
+        Args:
+            by: Locator strategy
+            value: Locator value
+
+        Returns:
+            HtmlElement: The element
+
+        Raises:
+            NoSuchElementException: If nothing matches
+        """
+        return self._find_element(self._document.getroottree(), by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        """
+        Find all matching elements of the document.
+
+        Args:
+            by: Locator strategy
+            value: Locator value
+
+        Returns:
+            list: HtmlElement list (empty if nothing matches)
+        """
+        return self._find_elements(self._document.getroottree(), by, value)
+
+    def _find_elements(self, root, by, value):
+        """
+        Find the elements matching a locator below a document or element node.
+        """
+        xpath = locator_to_xpath(by, value)
+        if by != By.XPATH and xpath.startswith("/") and not hasattr(root, "getroot"):
+            # Element-scoped searches only look below the element, like WebDriver
+            xpath = "." + xpath
+        nodes = root.xpath(xpath)
+        return [HtmlElement(self, node) for node in nodes if isinstance(node, lxml.html.HtmlElement)]
+
+    def _find_element(self, root, by, value):
+        """
+        Find the first element matching a locator below a node.
+
+        Raises:
+            NoSuchElementException: If nothing matches
+        """
+        elements = self._find_elements(root, by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element matches {by}={value!r}")
+        return elements[0]
+
+    def extract(self, locator, fields):
+        """
+        Counterpart of BasePage.extract() for HTML mode.
+
+        Args:
+            locator: Tuple of (By, value)
+            fields: Dict of result key -> field spec
+
+        Returns:
+            list: One dict per matching element
+        """
+        rows = []
+        for element in self.find_elements(*locator):
+            row = {}
+            for name, spec in fields.items():
+                if spec == "text":
+                    row[name] = element.text
+                elif spec == "visible":
+                    row[name] = element.is_displayed()
+                elif spec == "element":
+                    row[name] = element
+                elif spec.startswith("@"):
+                    row[name] = element.get_dom_attribute(spec[1:])
+                else:
+                    row[name] = element.get_property(spec)
+            rows.append(row)
+        return rows
+
+    # Cookies
+
+    def get_cookies(self):
+        """
+        Get the cookies of the session.
+
+        Returns:
+            list: Cookie dictionaries (name, value, path, domain, secure)
+        """
+        return [
+            {"name": cookie.name, "value": cookie.value, "path": cookie.path,
+             "domain": cookie.domain, "secure": bool(cookie.secure)}
+            for cookie in self.session.cookies
+        ]
+
+    def get_cookie(self, name):
+        """
+        Get one cookie of the session.
+
+        Args:
+            name: Cookie name
+
+        Returns:
+            dict: Cookie dictionary, or None if there is no such cookie
+        """
+        return next((cookie for cookie in self.get_cookies() if cookie["name"] == name), None)
+
+    def add_cookie(self, cookie_dict):
+        """
+        Add a cookie to the session.
+
+        Args:
+            cookie_dict: WebDriver cookie dictionary (name, value, path, secure)
+        """
+        # Empty domain: sent to the application host whatever its name
+        self.session.cookies.set(
+            cookie_dict["name"], cookie_dict["value"],
+            domain="", path=cookie_dict.get("path", "/"), secure=cookie_dict.get("secure", False)
+        )
+
+    def delete_cookie(self, name):
+        """
+        Delete a cookie from the session.
+
+        Args:
+            name: Cookie name
+        """
+        for cookie in list(self.session.cookies):
+            if cookie.name == name:
+                self.session.cookies.clear(cookie.domain, cookie.path, cookie.name)
+
+    def delete_all_cookies(self):
+        """
+        Delete every cookie of the session.
+        """
+        self.session.cookies.clear()
+
+    # WebDriver API no-ops
+
+    def implicitly_wait(self, time_to_wait):
+        """
+        Ignored: elements are available as soon as a page is loaded.
+        """
+
+    def execute_script(self, script, *args):
+        """
+        Reject scripts: there is no JavaScript engine.
+
+        Raises:
+            WebDriverException: Always
+        """
+        raise WebDriverException("JavaScript is not available in HTML mode")
+
+    def save_screenshot(self, filename):
+        """
+        Save the page source instead of a screenshot.
+
+        Returns:
+            bool: False, no image is produced
+        """
+        with open(filename + ".html", "w", encoding="utf-8") as handle:
+            handle.write(self.page_source)
+        return False
+
+    def quit(self):
+        """
+        End the session: drop its cookies and close it. Closing releases the
+        idle connections of the shared pool, which reopens them on demand.
+        """
+        self.session.cookies.clear()
+        self.session.close()
+
+    close = quit
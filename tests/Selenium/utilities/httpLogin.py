@@ -0,0 +1,194 @@
+"""
+Browserless login utility for test setup.
+Performs the /login (and /register) form flows over HTTP (CSRF token scraped from the form)
+and returns session cookies that can be injected into a WebDriver.
+"""
+
+import re
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utilities.readProperties import ReadConfig
+
+
+class HttpLoginError(Exception):
+    """
+    Raised when the HTTP login flow does not produce an authenticated session.
+    """
+
+
+class HttpLogin:
+    """
+    HTTP client for the Laravel login form.
+    All sessions share one connection pool, so repeated logins reuse
+    keep-alive connections to the application.
+    """
+
+    # Hidden CSRF field rendered by @csrf in the login form
+    CSRF_PATTERN = re.compile(r'name="_token"\s+value="([^"]+)"')
+
+    # Seconds before an HTTP request is abandoned
+    TIMEOUT = 10
+
+    _adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+
+    @classmethod
+    def new_session(cls):
+        """
+        Create a requests session bound to the shared connection pool.
+
+        Returns:
+            requests.Session: Session with its own cookie jar
+        """
+        session = requests.Session()
+        session.mount("http://", cls._adapter)
+        session.mount("https://", cls._adapter)
+        return session
+
+    @classmethod
+    def extract_csrf_token(cls, html):
+        """
+        Extract the CSRF token from a rendered form.
+
+        Args:
+            html: Page HTML containing the @csrf hidden input
+
+        Returns:
+            str: CSRF token
+
+        Raises:
+            HttpLoginError: If no token is found
+        """
+        match = cls.CSRF_PATTERN.search(html)
+        if not match:
+            raise HttpLoginError("CSRF token not found in login page")
+        return match.group(1)
+
+    @classmethod
+    def open_session(cls, email, password, base_url=None, landing=None):
+        """
+        Log in over HTTP and return the authenticated session.
+        The redirect target chosen by the application (admin events or home)
+        is kept in session.login_redirect.
+
+        Args:
+            email: User email
+            password: User password
+            base_url: Application base URL (default: config baseUrl)
+            landing: Path the role must be redirected to (e.g. "/home"), None to accept any
+
+        Returns:
+            requests.Session: Authenticated session
+
+        Raises:
+            HttpLoginError: If the credentials are rejected or the redirect
+                            is not the expected landing page
+        """
+        base_url = base_url or ReadConfig.get_base_url()
+        session = cls.new_session()
+
+        response = session.get(base_url + "/login", timeout=cls.TIMEOUT)
+        response.raise_for_status()
+        token = cls.extract_csrf_token(response.text)
+
+        response = session.post(
+            base_url + "/login",
+            data={"_token": token, "email": email, "password": password},
+            allow_redirects=False,
+            timeout=cls.TIMEOUT
+        )
+        location = response.headers.get("Location", "")
+        if response.status_code not in (301, 302, 303) or urlsplit(location).path.endswith("/login"):
+            raise HttpLoginError(f"Login rejected for {email} (status {response.status_code})")
+
+        if landing and not urlsplit(location).path.rstrip("/").endswith(landing):
+            raise HttpLoginError(f"Login as {email} redirected to {location}, expected {landing}")
+
+        session.login_redirect = location
+        return session
+
+    @classmethod
+    def sign_up(cls, name, email, password, base_url=None):
+        """
+        Create an account through the /register form over HTTP.
+
+        Args:
+            name: Display name
+            email: Email of the new account
+            password: Password (also used as confirmation)
+            base_url: Application base URL (default: config baseUrl)
+
+        Raises:
+            HttpLoginError: If the application does not redirect to /login
+        """
+        base_url = base_url or ReadConfig.get_base_url()
+        session = cls.new_session()
+
+        response = session.get(base_url + "/register", timeout=cls.TIMEOUT)
+        response.raise_for_status()
+        token = cls.extract_csrf_token(response.text)
+
+        response = session.post(
+            base_url + "/register",
+            data={
+                "_token": token,
+                "name": name,
+                "email": email,
+                "password": password,
+                "password_confirmation": password,
+            },
+            allow_redirects=False,
+            timeout=cls.TIMEOUT
+        )
+        location = response.headers.get("Location", "")
+        if response.status_code not in (301, 302, 303) or not urlsplit(location).path.endswith("/login"):
+            raise HttpLoginError(f"Sign-up rejected for {email} (status {response.status_code})")
+
+    @staticmethod
+    def to_webdriver_cookies(session):
+        """
+        Convert a session's cookie jar into WebDriver add_cookie dictionaries.
+
+        Args:
+            session: requests.Session
+
+        Returns:
+            list: Cookie dictionaries ready for add_cookie
+        """
+        cookies = []
+        for cookie in session.cookies:
+            # Laravel emits lower-case attribute names ("httponly; samesite=lax")
+            attributes = {key.lower(): value for key, value in cookie._rest.items()}
+            entry = {
+                "name": cookie.name,
+                "value": cookie.value,
+                "path": cookie.path or "/",
+                "secure": bool(cookie.secure),
+                "httpOnly": "httponly" in attributes,
+            }
+            if cookie.expires:
+                entry["expiry"] = int(cookie.expires)
+            same_site = attributes.get("samesite")
+            if same_site:
+                entry["sameSite"] = same_site.capitalize()
+            cookies.append(entry)
+        return cookies
+
+    @classmethod
+    def mint_cookies(cls, email, password, base_url=None, landing=None):
+        """
+        Log in over HTTP and return cookies for a WebDriver.
+
+        Args:
+            email: User email
+            password: User password
+            base_url: Application base URL (default: config baseUrl)
+            landing: Path the role must be redirected to, None to accept any
+
+        Returns:
+            list: Cookie dictionaries ready for add_cookie
+        """
+        # Sessions are not closed: closing would also close the shared pool
+        return cls.to_webdriver_cookies(cls.open_session(email, password, base_url, landing))
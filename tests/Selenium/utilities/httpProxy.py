@@ -0,0 +1,892 @@
+"""
+HTTP proxy for the Selenium suite, between the browser and the application.
+In observe mode it only forwards requests. In record mode it also stores
+every response in an indexed SQLite file, keyed by method, path, query and
+the relevant form fields. In replay mode it serves the stored responses from
+memory without contacting the application, so page objects can be developed
+and tests run without PHP or MySQL.
+In every mode it measures each request (server latency, size, status) and
+counts the requests in flight, which gives tests a network-idle signal, and
+it can degrade requests with the fault rules of utilities/faultInjection.py.
+
+Usage (from tests/Selenium):
+    python -m utilities.httpProxy record --port 8899       # upstream: config baseUrl
+    python -m utilities.httpProxy replay --port 8899
+    pytest --app-url http://127.0.0.1:8899
+    pytest --proxy-mode observe                              # proxies started by pytest
+    python -m utilities.httpProxy observe --faults slow-backend,flaky-backend
+    python -m utilities.httpProxy list
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import statistics
+import sys
+import threading
+import time
+from http import HTTPStatus
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+
+from utilities.faultInjection import FaultPlan
+from utilities.perfMetrics import PerfMetrics
+from utilities.readProperties import ReadConfig, parse_list
+
+
+class ReplayStore:
+    """
+    On-disk store of recorded responses.
+    Several responses can be stored for one key (GET /events before and
+    after a registration). Each is stored with the session cookie of its
+    request, so replay can pick the one of the same browser session.
+    The proxies of all xdist workers record into the same file.
+    """
+
+    DEFAULT_PATH = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), '..', 'Logs', 'replay_store.sqlite3'
+    )
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (
+            name TEXT PRIMARY KEY,
+            value TEXT
+        );
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT,
+            occurrence INTEGER,
+            method TEXT,
+            path TEXT,
+            query TEXT,
+            form TEXT,
+            session TEXT,
+            status INTEGER,
+            headers TEXT,
+            body BLOB,
+            PRIMARY KEY (key, occurrence)
+        );
+    """
+
+    # Seconds a writer waits for another worker's write to finish
+    BUSY_TIMEOUT = 10
+
+    def __init__(self, path=None):
+        """
+        Open (and create if needed) a store.
+
+        Args:
+            path: Store file (default: Logs/replay_store.sqlite3)
+        """
+        self.path = path or self.DEFAULT_PATH
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.connection = sqlite3.connect(self.path, timeout=self.BUSY_TIMEOUT, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(self.SCHEMA)
+
+    def close(self):
+        """
+        Close the store.
+        """
+        self.connection.close()
+
+    def clear(self, upstream):
+        """
+        Delete all recorded responses before a new recording.
+
+        Args:
+            upstream: Base URL of the application being recorded
+        """
+        self.connection.execute("DELETE FROM responses")
+        self.connection.execute("INSERT OR REPLACE INTO meta VALUES ('upstream', ?)", (upstream,))
+        self.connection.commit()
+
+    def upstream(self):
+        """
+        Get the base URL the responses were recorded from.
+
+        Returns:
+            str: Upstream base URL, or None for an empty store
+        """
+        row = self.connection.execute("SELECT value FROM meta WHERE name = 'upstream'").fetchone()
+        return row[0] if row else None
+
+    def add(self, key, parts, session, status, headers, body):
+        """
+        Store a response (numbered after the responses already stored for its key).
+
+        Args:
+            key: Request key (see RequestKey.of)
+            parts: Dict of method, path, query and form the key was built from
+            session: Session cookie of the request ("" without one)
+            status: HTTP status
+            headers: List of (name, value) response headers
+            body: Response body (bytes)
+        """
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO responses SELECT ?, COALESCE(MAX(occurrence) + 1, 0), ?, ?, ?, ?, ?, ?, ?, ?"
+                " FROM responses WHERE key = ?",
+                (key, parts["method"], parts["path"], parts["query"], parts["form"],
+                 session, status, json.dumps(headers), body, key)
+            )
+
+    def load(self):
+        """
+        Load every response into memory.
+
+        Returns:
+            dict: key -> list of (session, status, headers, body), in recording order
+        """
+        responses = {}
+        for key, session, status, headers, body in self.connection.execute(
+                "SELECT key, session, status, headers, body FROM responses ORDER BY key, occurrence"):
+            responses.setdefault(key, []).append((session, status, json.loads(headers), bytes(body)))
+        return responses
+
+    def entries(self):
+        """
+        List the recorded requests.
+
+        Returns:
+            list: (method, path, query, form, responses, last status) tuples
+        """
+        return self.connection.execute(
+            "SELECT method, path, query, form, COUNT(*), MAX(status) FROM responses"
+            " GROUP BY key ORDER BY path, method"
+        ).fetchall()
+
+
+class RequestKey:
+    """
+    Builds the replay key of a request.
+    """
+
+    # Form fields that change between runs without changing the response
+    IGNORED_FIELDS = {"_token"}
+
+    # Session cookie of the application (laravel_session, <app>_session)
+    SESSION_COOKIE = re.compile(r"(?:^|_)session$")
+
+    @classmethod
+    def session(cls, cookie_header):
+        """
+        Get the session cookie value of a request.
+        Not part of the key: it only selects between responses recorded for the same key.
+
+        Returns:
+            str: Cookie value, or "" without a session cookie
+        """
+        for cookie in (cookie_header or "").split(";"):
+            name, _, value = cookie.strip().partition("=")
+            if cls.SESSION_COOKIE.search(name):
+                return value
+        return ""
+
+    @classmethod
+    def form(cls, content_type, body):
+        """
+        Canonicalize the relevant fields of a request body.
+
+        Returns:
+            str: Sorted form fields or JSON, a body hash for other content, or ""
+        """
+        if not body:
+            return ""
+        content_type = (content_type or "").split(";")[0].strip().lower()
+        if content_type == "application/x-www-form-urlencoded":
+            fields = [(name, value) for name, value in parse_qsl(body.decode("utf-8", "replace"), keep_blank_values=True)
+                      if name not in cls.IGNORED_FIELDS]
+            return json.dumps(sorted(fields))
+        if content_type == "application/json":
+            try:
+                data = json.loads(body)
+            except ValueError:
+                pass
+            else:
+                if isinstance(data, dict):
+                    data = {name: value for name, value in data.items() if name not in cls.IGNORED_FIELDS}
+                return json.dumps(data, sort_keys=True)
+        return "sha1:" + hashlib.sha1(body).hexdigest()
+
+    @classmethod
+    def of(cls, method, target, content_type=None, body=b""):
+        """
+        Build the key of a request.
+
+        Args:
+            method: HTTP method
+            target: Path and query relative to the application base URL
+            content_type: Request Content-Type
+            body: Request body
+
+        Returns:
+            tuple: (key, parts dict of method, path, query and form)
+        """
+        split = urlsplit(target)
+        parts = {
+            "method": method.upper(),
+            "path": split.path or "/",
+            "query": json.dumps(sorted(parse_qsl(split.query, keep_blank_values=True))) if split.query else "",
+            "form": cls.form(content_type, body),
+        }
+        canonical = "\n".join(parts[name] for name in ("method", "path", "query", "form"))
+        return hashlib.sha1(canonical.encode("utf-8")).hexdigest(), parts
+
+
+class HttpRequest:
+    """
+    A request read from a client connection.
+    """
+
+    def __init__(self, method, target, version, headers, body):
+        self.method = method
+        self.target = target
+        self.version = version
+        self.headers = headers
+        self.body = body
+        self.status = None
+        self.source = None
+        self.upstream_ms = None
+        self.fault = None
+
+    def header(self, name, default=None):
+        """
+        Get the first value of a header (case-insensitive).
+        """
+        name = name.lower()
+        return next((value for key, value in self.headers if key.lower() == name), default)
+
+    @property
+    def keep_alive(self):
+        connection = (self.header("Connection") or "").lower()
+        return connection != "close" if self.version == "HTTP/1.1" else connection == "keep-alive"
+
+
+class ProxyStats:
+    """
+    Per-request measurements and in-flight count of a proxy.
+    Written by the proxy thread, read by the test thread.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.last_change = time.monotonic()
+        self.test = None
+        self._records = []
+
+    def start_test(self, test_id):
+        """
+        Attribute subsequent requests to a test.
+
+        Args:
+            test_id: pytest node id
+        """
+        with self._condition:
+            self.test = test_id
+            self.peak_in_flight = self.in_flight
+            self._records = []
+
+    def begin(self):
+        """
+        Count a request in flight.
+
+        Returns:
+            tuple: (epoch start, perf_counter start, requests in flight before it)
+        """
+        with self._condition:
+            before = self.in_flight
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            self.last_change = time.monotonic()
+            return time.time(), time.perf_counter(), before
+
+    def end(self, started, record):
+        """
+        Count a request out of flight and store its measurements.
+
+        Args:
+            started: Value returned by begin()
+            record: Request measurements (see HttpProxy.handle)
+        """
+        record.update(test=self.test, start=started[0], in_flight=started[2],
+                      total_ms=round((time.perf_counter() - started[1]) * 1000, 1))
+        with self._condition:
+            self.in_flight -= 1
+            self.last_change = time.monotonic()
+            self._records.append(record)
+            self._condition.notify_all()
+
+    def take(self):
+        """
+        Get and clear the measurements of the current test.
+
+        Returns:
+            tuple: (list of request records, peak requests in flight)
+        """
+        with self._condition:
+            records, self._records = self._records, []
+            return records, self.peak_in_flight
+
+    def wait_for_idle(self, idle_time=0.5, timeout=10):
+        """
+        Wait until no request has been in flight for idle_time seconds.
+
+        Args:
+            idle_time: Required quiet period in seconds
+            timeout: Wait timeout in seconds
+
+        Returns:
+            bool: True if the network went idle in time
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                quiet = now - self.last_change
+                if self.in_flight == 0 and quiet >= idle_time:
+                    return True
+                if now >= deadline:
+                    return False
+                wait = idle_time - quiet if self.in_flight == 0 else deadline - now
+                self._condition.wait(max(0.001, min(wait, deadline - now)))
+
+    @staticmethod
+    def routes(records):
+        """
+        Aggregate request records per method and route.
+
+        Returns:
+            list: Dicts of method, route, count, statuses, bytes, server_ms
+                  (median), server_max_ms and faults (requests degraded by a
+                  fault rule), slowest median first
+        """
+        grouped = {}
+        for record in records:
+            grouped.setdefault((record["method"], record["route"]), []).append(record)
+        rows = []
+        for (method, route), group in grouped.items():
+            server = [record["upstream_ms"] for record in group if record["upstream_ms"] is not None]
+            rows.append({
+                "method": method,
+                "route": route,
+                "count": len(group),
+                "statuses": sorted({record["status"] for record in group}),
+                "bytes": sum(record["bytes"] for record in group),
+                "server_ms": statistics.median(server) if server else None,
+                "server_max_ms": max(server) if server else None,
+                "faults": sum(1 for record in group if record["fault"]),
+            })
+        return sorted(rows, key=lambda row: row["server_ms"] or 0, reverse=True)
+
+    @classmethod
+    def summary(cls, records, peak_in_flight=None):
+        """
+        Format request records as a short text table for the test report.
+
+        Returns:
+            str: One line per method and route, server time first
+                 (status 0: connection dropped by a fault rule)
+        """
+        lines = []
+        for row in cls.routes(records):
+            server = (f"server {row['server_ms']:.0f} ms (max {row['server_max_ms']:.0f})"
+                      if row["server_ms"] is not None else "not forwarded")
+            statuses = "/".join(str(status) for status in row["statuses"])
+            faults = f", {row['faults']} degraded" if row["faults"] else ""
+            lines.append(f"{row['method']} {row['route']}: {row['count']}x {statuses}, "
+                         f"{server}, {row['bytes'] / 1024:.1f} KiB{faults}")
+        if peak_in_flight:
+            lines.append(f"peak in flight: {peak_in_flight}")
+        return "\n".join(lines)
+
+
+class HttpProxy:
+    """
+    asyncio HTTP/1.1 proxy in observe, record or replay mode.
+    The proxy serves the application at its root: a request for
+    http://<proxy>/login is forwarded to <upstream>/login, and upstream
+    URLs in redirects and text bodies are rewritten to the proxy.
+    """
+
+    MODES = ("observe", "record", "replay")
+
+    # Proxy of the current process (started by the test session)
+    current = None
+
+    # Hop-by-hop and recomputed headers, never forwarded or stored
+    HOP_HEADERS = {"connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te", "trailer",
+                   "transfer-encoding", "upgrade", "content-length", "content-encoding", "host", "accept-encoding"}
+
+    # Content types whose bodies may contain upstream URLs
+    TEXT_TYPES = ("text/", "application/json", "application/javascript", "application/xml", "image/svg+xml")
+
+    # Largest request head accepted from a client (bytes)
+    MAX_HEAD = 65536
+
+    def __init__(self, mode, upstream=None, store=None, host="127.0.0.1", port=8899, timeout=30, faults=None):
+        """
+        Initialize the proxy.
+
+        Args:
+            mode: "observe", "record" or "replay"
+            upstream: Application base URL (default: config baseUrl; replay: the recorded one)
+            store: ReplayStore or store path (default: Logs/replay_store.sqlite3)
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+            timeout: Upstream request timeout in seconds
+            faults: Names of the fault rules applied to every request (default: [proxy] faults)
+
+        Raises:
+            ValueError: For an unknown mode or fault rule
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown proxy mode '{mode}', expected one of {self.MODES}")
+        self.mode = mode
+        self.store = None if mode == "observe" else store if isinstance(store, ReplayStore) else ReplayStore(store)
+        self.upstream = (upstream or (self.store.upstream() if mode == "replay" else None)
+                         or ReadConfig.get_base_url()).rstrip("/")
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.responses = {}
+        self.served = {}
+        self.misses = []
+        self.stats = ProxyStats()
+        self.faults = FaultPlan(FaultPlan.run_rules() if faults is None else FaultPlan.rules_for(faults))
+        self.connections = set()
+        self.client = None
+        self.server = None
+        self._loop = None
+        self._stopped = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """
+        Base URL of the proxy (use it as the application base URL).
+        """
+        return f"http://{self.host}:{self.port}"
+
+    def rewrite(self, body, content_type, source, target):
+        """
+        Replace a base URL in a text body (plain and JSON-escaped).
+        """
+        if not body or not (content_type or "").lower().startswith(self.TEXT_TYPES):
+            return body
+        for old, new in ((source, target), (source.replace("/", "\\/"), target.replace("/", "\\/"))):
+            body = body.replace(old.encode("utf-8"), new.encode("utf-8"))
+        return body
+
+    def encode_response(self, status, headers, body, source=None):
+        """
+        Serialize a stored response for the client, rewriting upstream URLs.
+
+        Args:
+            status: HTTP status
+            headers: List of (name, value) headers
+            body: Body bytes
+            source: Upstream base URL the response came from
+
+        Returns:
+            bytes: Status line and headers (without Connection and the final blank line) and body
+        """
+        source = source or self.upstream
+        content_type = next((value for name, value in headers if name.lower() == "content-type"), "")
+        body = self.rewrite(body, content_type, source, self.url)
+        reason = HTTPStatus(status).phrase if status in HTTPStatus._value2member_map_ else ""
+        lines = [f"HTTP/1.1 {status} {reason}"]
+        for name, value in headers:
+            if name.lower() == "location" and value.startswith(source):
+                value = self.url + value[len(source):]
+            lines.append(f"{name}: {value}")
+        lines.append(f"Content-Length: {len(body)}")
+        return "\r\n".join(lines).encode("latin-1", "replace"), body
+
+    async def read_request(self, reader):
+        """
+        Read one request from a client connection.
+
+        Returns:
+            HttpRequest: The request, or None when the client closed the connection
+        """
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        method, target, version = line.decode("latin-1").split()
+        headers, size = [], len(line)
+        while True:
+            line = await reader.readline()
+            size += len(line)
+            if size > self.MAX_HEAD:
+                raise ConnectionError("Request head too large")
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers.append((name.strip(), value.strip()))
+        request = HttpRequest(method, target, version, headers, b"")
+        if (request.header("Transfer-Encoding") or "").lower() == "chunked":
+            chunks = []
+            while True:
+                length = int((await reader.readline()).split(b";")[0], 16)
+                if not length:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(length))
+                await reader.readline()
+            request.body = b"".join(chunks)
+        elif request.header("Content-Length"):
+            request.body = await reader.readexactly(int(request.header("Content-Length")))
+        return request
+
+    async def forward(self, request):
+        """
+        Send a request to the application.
+
+        Returns:
+            tuple: (status, headers, body) with hop-by-hop headers removed
+        """
+        headers = []
+        for name, value in request.headers:
+            if name.lower() in self.HOP_HEADERS:
+                continue
+            if name.lower() in ("origin", "referer") and value.startswith(self.url):
+                value = self.upstream + value[len(self.url):]
+            headers.append((name, value))
+        upstream_request = httpx.Request(request.method, self.upstream + request.target,
+                                         headers=headers, content=request.body)
+        started = time.perf_counter()
+        response = await self.client.send(upstream_request)
+        request.upstream_ms = round((time.perf_counter() - started) * 1000, 1)
+        stored = [(name, value) for name, value in response.headers.multi_items()
+                  if name.lower() not in self.HOP_HEADERS]
+        return response.status_code, stored, response.content
+
+    async def respond(self, request):
+        """
+        Answer a request from the application (observe, record) or the store (replay).
+        Sets the status and source ("app", "replay", "miss", "error") of the request.
+
+        Returns:
+            tuple: (head bytes, body bytes)
+        """
+        key, parts = RequestKey.of(request.method, request.target,
+                                   request.header("Content-Type"), request.body)
+        if self.mode != "replay":
+            try:
+                status, headers, body = await self.forward(request)
+            except httpx.HTTPError as error:
+                request.status, request.source = 502, "error"
+                return self.encode_response(502, [("Content-Type", "text/plain")],
+                                            f"Upstream error: {error!r}".encode("utf-8"))
+            if self.store:
+                self.store.add(key, parts, RequestKey.session(request.header("Cookie")), status, headers, body)
+            request.status, request.source = status, "app"
+            return self.encode_response(status, headers, body)
+
+        recorded = self.responses.get(key)
+        if not recorded:
+            self.misses.append(f"{parts['method']} {request.target}")
+            request.status, request.source = 404, "miss"
+            return self.encode_response(
+                404, [("Content-Type", "text/plain"), ("X-Replay-Miss", "1")],
+                f"No recorded response for {parts['method']} {request.target}".encode("utf-8")
+            )
+        # Laravel re-issues the session cookie on every response, so a replayed
+        # browser session presents the cookie recorded for its next request
+        # (or none, like the recorded request of a new session). Candidates are
+        # served in order, then the last one is repeated.
+        session = RequestKey.session(request.header("Cookie"))
+        matching = [response for recorded_session, response in recorded if recorded_session == session]
+        candidates = matching or [response for _, response in recorded]
+        slot = (key, session if matching else None)
+        index = self.served.get(slot, 0)
+        self.served[slot] = index + 1
+        head, body = candidates[min(index, len(candidates) - 1)]
+        request.status, request.source = int(head.split(b" ", 2)[1]), "replay"
+        return head, body
+
+    def inject_error(self, request, status):
+        """
+        Answer a request with an injected error instead of the application's response.
+
+        Returns:
+            tuple: (head bytes, body bytes)
+        """
+        request.status, request.source = status, "fault"
+        return self.encode_response(
+            status, [("Content-Type", "text/plain"), ("X-Injected-Fault", request.fault)],
+            f"Injected fault '{request.fault}' for {request.method} {request.target}".encode("utf-8")
+        )
+
+    @staticmethod
+    async def write_body(writer, body, bandwidth=None):
+        """
+        Write a response body, at most bandwidth bytes per second when capped
+        (in chunks of a tenth of a second).
+        """
+        if not bandwidth:
+            writer.write(body)
+            return
+        chunk = max(1, int(bandwidth / 10))
+        for offset in range(0, len(body), chunk):
+            piece = body[offset:offset + chunk]
+            writer.write(piece)
+            await writer.drain()
+            await asyncio.sleep(len(piece) / bandwidth)
+
+    def measurement(self, request, head, body):
+        """
+        Build the record of a served request for ProxyStats.
+
+        Returns:
+            dict: method, route, path, status, source, content_type, bytes,
+                  upstream_ms (time the application took, None when not
+                  forwarded) and fault (name of the rule that degraded it, or None)
+        """
+        content_type = next((line.split(b":", 1)[1] for line in head.split(b"\r\n")
+                             if line.lower().startswith(b"content-type:")), b"")
+        return {
+            "method": request.method,
+            "route": PerfMetrics.route_for(self.upstream + request.target, self.upstream),
+            "path": request.target,
+            "status": request.status,
+            "source": request.source,
+            "content_type": content_type.split(b";")[0].strip().decode("latin-1"),
+            "bytes": len(body),
+            "upstream_ms": request.upstream_ms,
+            "fault": request.fault,
+        }
+
+    async def handle(self, reader, writer):
+        """
+        Serve the requests of one client connection (keep-alive), measuring
+        each one from the end of its head to the end of the response write.
+        A matching fault rule delays the request, then drops the connection,
+        answers with an injected error or caps the response bandwidth.
+        """
+        self.connections.add(writer)
+        try:
+            while True:
+                request = await self.read_request(reader)
+                if request is None:
+                    break
+                started = self.stats.begin()
+                fault = self.faults.decide(request.method, request.target)
+                head, body = b"", b""
+                try:
+                    if fault:
+                        request.fault = fault["rule"]
+                        await asyncio.sleep(fault["delay"])
+                        if fault["drop"]:
+                            request.status, request.source = 0, "dropped"
+                            break
+                    if fault and fault["status"]:
+                        head, body = self.inject_error(request, fault["status"])
+                    else:
+                        head, body = await self.respond(request)
+                    connection = b"keep-alive" if request.keep_alive else b"close"
+                    writer.write(head + b"\r\nConnection: " + connection + b"\r\n\r\n")
+                    if request.method != "HEAD":
+                        await self.write_body(writer, body, fault and fault["bandwidth"])
+                    await writer.drain()
+                finally:
+                    self.stats.end(started, self.measurement(request, head, body))
+                if not request.keep_alive:
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections.discard(writer)
+            writer.close()
+
+    async def start(self):
+        """
+        Start listening (in the running event loop).
+        """
+        self.server = await asyncio.start_server(self.handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        if self.mode != "replay":
+            self.client = httpx.AsyncClient(timeout=self.timeout, follow_redirects=False)
+        else:
+            # Pre-encode every response (URLs rewritten to this port), so
+            # replay is a dict lookup and a write
+            self.responses = {
+                key: [(session, self.encode_response(status, headers, body))
+                      for session, status, headers, body in responses]
+                for key, responses in self.store.load().items()
+            }
+
+    async def close(self):
+        """
+        Stop listening and close the store.
+        """
+        if self.server:
+            self.server.close()
+            # Idle keep-alive connections end their handlers with EOF
+            for writer in list(self.connections):
+                writer.close()
+            while self.connections:
+                await asyncio.sleep(0.01)
+            await self.server.wait_closed()
+        if self.client:
+            await self.client.aclose()
+        if self.store:
+            self.store.close()
+
+    async def serve(self, ready=None):
+        """
+        Run the proxy until stop() is called.
+
+        Args:
+            ready: threading.Event set once the proxy listens
+        """
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        await self.start()
+        if ready:
+            ready.set()
+        try:
+            await self._stopped.wait()
+        finally:
+            await self.close()
+
+    def start_background(self):
+        """
+        Run the proxy on a background thread.
+
+        Returns:
+            str: Base URL of the proxy
+        """
+        ready = threading.Event()
+        self._thread = threading.Thread(target=asyncio.run, args=(self.serve(ready),),
+                                        name="http-proxy", daemon=True)
+        self._thread.start()
+        if not ready.wait(10):
+            raise RuntimeError("HTTP proxy did not start")
+        HttpProxy.current = self
+        return self.url
+
+    def stop(self):
+        """
+        Stop a proxy started with start_background() and wait for it.
+        """
+        if self._loop and self._thread:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+            self._thread.join()
+            self._thread = None
+        if HttpProxy.current is self:
+            HttpProxy.current = None
+
+
+class HttpProxyPlugin:
+    """
+    pytest plugin reporting the proxies of a --proxy-mode run (controller
+    only): server time per route, the requests replay could not answer and
+    the requests degraded by fault rules.
+    Reads the 'server_timings' user property of every test report, so it
+    also works with xdist workers, each running its own proxy.
+    """
+
+    # Routes and missed requests listed in the terminal summary
+    MAX_LISTED = 20
+
+    def __init__(self, mode, store_path=None):
+        """
+        Initialize the plugin.
+
+        Args:
+            mode: Proxy mode of the run
+            store_path: Store file of record and replay runs
+        """
+        self.mode = mode
+        self.store_path = store_path or ReplayStore.DEFAULT_PATH
+        self.records = []
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "call":
+            return
+        for name, value in report.user_properties:
+            if name == "server_timings":
+                self.records.extend(value)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.section(f"http proxy ({self.mode})")
+        if self.mode == "record":
+            terminalreporter.write_line(f"Responses recorded to {os.path.normpath(self.store_path)}")
+        lines = ProxyStats.summary(self.records).splitlines()
+        for line in lines[:self.MAX_LISTED]:
+            terminalreporter.write_line(line)
+        if len(lines) > self.MAX_LISTED:
+            terminalreporter.write_line(f"... {len(lines) - self.MAX_LISTED} more routes")
+        misses = sorted({f"{record['method']} {record['path']}" for record in self.records
+                         if record["source"] == "miss"})
+        if misses:
+            terminalreporter.write_line(f"{len(misses)} requests had no recorded response "
+                                        f"(record again with --proxy-mode record):")
+            for miss in misses[:self.MAX_LISTED]:
+                terminalreporter.write_line(f"  {miss}")
+        faults = {}
+        for record in self.records:
+            if record["fault"]:
+                faults.setdefault(record["fault"], []).append(record["source"])
+        for rule, sources in sorted(faults.items()):
+            terminalreporter.write_line(
+                f"Fault rule {rule}: {len(sources)} requests degraded "
+                f"({sources.count('fault')} injected errors, {sources.count('dropped')} dropped)"
+            )
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Returns:
+        int: Exit status
+    """
+    parser = argparse.ArgumentParser(prog="python -m utilities.httpProxy")
+    parser.add_argument("--store", default=None, help="Store file (default: Logs/replay_store.sqlite3)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for mode in HttpProxy.MODES:
+        mode_parser = commands.add_parser(mode, help=f"Run the proxy in {mode} mode")
+        mode_parser.add_argument("--upstream", default=None, help="Application base URL (default: config baseUrl)")
+        mode_parser.add_argument("--host", default="127.0.0.1")
+        mode_parser.add_argument("--port", type=int, default=8899)
+        mode_parser.add_argument("--faults", type=parse_list, default=None,
+                                 help="Comma separated fault rules ([fault:NAME] sections, default: [proxy] faults)")
+    commands.add_parser("list", help="List the recorded requests")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        store = ReplayStore(args.store)
+        print(f"Recorded from {store.upstream()}")
+        for method, path, query, form, count, status in store.entries():
+            query = "?" + "&".join(f"{name}={value}" for name, value in json.loads(query)) if query else ""
+            print(f"{status}  {method:6} {path}{query}  ({count} response{'s' if count > 1 else ''})"
+                  f"{'  ' + form if form else ''}")
+        store.close()
+        return 0
+
+    proxy = HttpProxy(args.command, args.upstream, args.store, args.host, args.port, faults=args.faults)
+    if args.command == "record":
+        proxy.store.clear(proxy.upstream)
+    print(f"{args.command.capitalize()} proxy for {proxy.upstream} on {proxy.url} (Ctrl+C to stop)")
+    if proxy.faults.rules:
+        print(f"Fault rules: {', '.join(rule.name for rule in proxy.faults.rules)}")
+    try:
+        asyncio.run(proxy.serve())
+    except KeyboardInterrupt:
+        pass
+    if proxy.misses:
+        print(f"{len(proxy.misses)} requests had no recorded response")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
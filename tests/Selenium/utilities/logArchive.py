@@ -0,0 +1,261 @@
+"""
+Log archive utility for tests/Selenium/Logs.
+Applies the retention policy of config.ini ([logging]) to the files written
+by the suite (gzip old runs, delete expired ones, cap the directory size) and
+streams over plain and gzipped logs without loading them into memory.
+
+Usage (from tests/Selenium):
+    python -m utilities.logArchive prune
+    python -m utilities.logArchive grep "TC-EVT-010" --since 2026-01-01
+    python -m utilities.logArchive events --step login --outcome failed
+"""
+
+import argparse
+import glob
+import gzip
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from datetime import datetime
+
+from utilities.readProperties import ReadConfig
+from utilities.workerContext import WorkerContext
+
+
+class LogArchive:
+    """
+    Retention and streaming queries over the Logs directory.
+    """
+
+    LOGS_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Logs'))
+
+    # Files managed by the retention policy (text logs, events, metrics, HAR files, load test reports)
+    MANAGED_PATTERNS = ("test_log_*", "events_*", "metrics_*", "har_*", "loadtest_*")
+
+    # Run id embedded in managed file names (older runs have no -suffix)
+    RUN_PATTERN = re.compile(r"_(\d{8}_\d{6}(?:-[0-9a-f]{4})?)")
+
+    def __init__(self, logs_dir=None):
+        """
+        Initialize the archive.
+
+        Args:
+            logs_dir: Logs directory (default: tests/Selenium/Logs)
+        """
+        self.logs_dir = logs_dir or self.LOGS_DIR
+
+    def files(self, kinds=None):
+        """
+        List managed files, oldest run first.
+
+        Args:
+            kinds: Name prefixes to include (default: all managed files)
+
+        Returns:
+            list: File paths (plain and .gz)
+        """
+        patterns = [f"{kind}*" for kind in kinds] if kinds else self.MANAGED_PATTERNS
+        paths = set()
+        for pattern in patterns:
+            paths.update(glob.glob(os.path.join(self.logs_dir, pattern)))
+        return sorted((path for path in paths if not path.endswith(".tmp")),
+                      key=lambda path: (self.run_of(path) or "", path))
+
+    @classmethod
+    def run_of(cls, path):
+        """
+        Extract the run id from a file name.
+
+        Returns:
+            str: Run id such as 20251230_010131-3fa2, or None
+        """
+        match = cls.RUN_PATTERN.search(os.path.basename(path))
+        return match.group(1) if match else None
+
+    @classmethod
+    def run_time(cls, path):
+        """
+        Get the start time of the run that wrote a file (falls back to mtime).
+
+        Returns:
+            float: Epoch seconds
+        """
+        run_id = cls.run_of(path)
+        if run_id:
+            return datetime.strptime(run_id.split("-")[0], "%Y%m%d_%H%M%S").timestamp()
+        return os.path.getmtime(path)
+
+    @staticmethod
+    def compress(path):
+        """
+        Gzip a file in place (path -> path.gz), keeping its modification time.
+
+        Returns:
+            str: Path to the compressed file
+        """
+        target = path + ".gz"
+        with open(path, "rb") as raw, gzip.open(target + ".tmp", "wb") as compressed:
+            shutil.copyfileobj(raw, compressed)
+        os.replace(target + ".tmp", target)
+        stat = os.stat(path)
+        os.utime(target, (stat.st_atime, stat.st_mtime))
+        os.remove(path)
+        return target
+
+    def apply_retention(self, now=None):
+        """
+        Apply the [logging] policy: gzip finished runs older than
+        compress_after_days, delete runs older than retention_days, then
+        delete the oldest runs while the directory exceeds max_total_mb.
+        Files of the current run are never touched.
+
+        Args:
+            now: Reference time in epoch seconds (default: now)
+
+        Returns:
+            dict: Lists of compressed and deleted paths
+        """
+        now = now or time.time()
+        current_run = WorkerContext.run_id()
+        compress_after = ReadConfig.get_log_compress_after_days() * 86400
+        retention = ReadConfig.get_log_retention_days() * 86400
+        max_total = ReadConfig.get_log_max_total_mb() * 1024 * 1024
+        result = {"compressed": [], "deleted": []}
+
+        remaining = []
+        for path in self.files():
+            if self.run_of(path) == current_run:
+                continue
+            age = now - self.run_time(path)
+            if retention and age > retention:
+                os.remove(path)
+                result["deleted"].append(path)
+                continue
+            if age > compress_after and not path.endswith(".gz"):
+                path = self.compress(path)
+                result["compressed"].append(path)
+            remaining.append(path)
+
+        if max_total:
+            total = sum(os.path.getsize(path) for path in self.files())
+            for path in remaining:
+                if total <= max_total:
+                    break
+                total -= os.path.getsize(path)
+                os.remove(path)
+                result["deleted"].append(path)
+        return result
+
+    @staticmethod
+    def open_text(path):
+        """
+        Open a plain or gzipped log for streaming text reads.
+        """
+        if path.endswith(".gz"):
+            return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+        return open(path, encoding="utf-8", errors="replace")
+
+    def iter_lines(self, kinds=None, since=None, until=None):
+        """
+        Stream the lines of managed files, one file at a time.
+
+        Args:
+            kinds: Name prefixes such as ("test_log",) (default: all)
+            since: Only runs started at or after this epoch time
+            until: Only runs started before this epoch time
+
+        Yields:
+            tuple: (path, line without newline)
+        """
+        for path in self.files(kinds):
+            started = self.run_time(path)
+            if (since and started < since) or (until and started >= until):
+                continue
+            with self.open_text(path) as handle:
+                for line in handle:
+                    yield path, line.rstrip("\n")
+
+    def grep(self, pattern, kinds=("test_log",), since=None, until=None):
+        """
+        Search text logs with a regular expression.
+
+        Yields:
+            tuple: (path, matching line)
+        """
+        expression = re.compile(pattern)
+        for path, line in self.iter_lines(kinds, since, until):
+            if expression.search(line):
+                yield path, line
+
+    def events(self, since=None, until=None, **filters):
+        """
+        Stream structured events (spans and log records) from events_*.jsonl(.gz).
+
+        Args:
+            since: Only runs started at or after this epoch time
+            until: Only runs started before this epoch time
+            filters: Field equality filters, e.g. step="login", outcome="failed"
+
+        Yields:
+            dict: Matching events
+        """
+        for _, line in self.iter_lines(("events",), since, until):
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if all(event.get(key) == value for key, value in filters.items()):
+                yield event
+
+
+def parse_day(value):
+    """
+    Parse a YYYY-MM-DD date into epoch seconds.
+    """
+    return datetime.strptime(value, "%Y-%m-%d").timestamp() if value else None
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Returns:
+        int: Exit status
+    """
+    parser = argparse.ArgumentParser(prog="python -m utilities.logArchive")
+    parser.add_argument("--logs-dir", default=None)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("prune", help="Apply the [logging] retention policy")
+    grep_parser = commands.add_parser("grep", help="Search text logs (plain and gzipped)")
+    grep_parser.add_argument("pattern")
+    events_parser = commands.add_parser("events", help="Query JSON-lines events")
+    events_parser.add_argument("--step", default=None)
+    events_parser.add_argument("--test", default=None)
+    events_parser.add_argument("--outcome", default=None)
+    for command in (grep_parser, events_parser):
+        command.add_argument("--since", default=None, help="YYYY-MM-DD")
+        command.add_argument("--until", default=None, help="YYYY-MM-DD")
+    args = parser.parse_args(argv)
+
+    archive = LogArchive(args.logs_dir)
+    if args.command == "prune":
+        result = archive.apply_retention()
+        print(f"Compressed {len(result['compressed'])} files, deleted {len(result['deleted'])} files")
+    elif args.command == "grep":
+        for path, line in archive.grep(args.pattern, since=parse_day(args.since), until=parse_day(args.until)):
+            print(f"{os.path.basename(path)}: {line}")
+    else:
+        filters = {key: value for key, value in
+                   (("step", args.step), ("test", args.test), ("outcome", args.outcome)) if value}
+        for event in archive.events(parse_day(args.since), parse_day(args.until), **filters):
+            print(json.dumps(event))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
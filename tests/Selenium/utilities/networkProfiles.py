@@ -0,0 +1,102 @@
+"""
+Network profile utility for Edge (Chromium) sessions.
+Blocks classes of requests through the DevTools protocol
+(Network.setBlockedURLs), so functional tests that never look at images,
+fonts or third-party content do not wait for them to download.
+
+Select a profile per test with @pytest.mark.network("lean"), or for the
+whole run with --network-profile.
+"""
+
+from selenium.common.exceptions import WebDriverException
+
+
+class NetworkProfiles:
+    """
+    Named sets of blocked URL patterns applied to a WebDriver through CDP.
+    """
+
+    # Image, font and media file patterns
+    IMAGES = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico"]
+    FONTS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+    MEDIA = ["*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav"]
+
+    # Third-party hosts referenced by the layouts (web fonts, event placeholder images)
+    THIRD_PARTY = ["*://fonts.bunny.net/*", "*://images.unsplash.com/*"]
+
+    # Stylesheets (only for tests that check URLs or server responses, not visibility)
+    STYLESHEETS = ["*.css", "*.css?*"]
+
+    # Profile name -> blocked URL patterns ("*" wildcards, matched by Chromium)
+    PROFILES = {
+        "full": [],
+        "no-third-party": THIRD_PARTY,
+        "lean": IMAGES + FONTS + MEDIA + THIRD_PARTY,
+        "bare": IMAGES + FONTS + MEDIA + THIRD_PARTY + STYLESHEETS,
+    }
+
+    # Profile used by tests without a marker
+    DEFAULT = "full"
+
+    @classmethod
+    def patterns(cls, name):
+        """
+        Get the blocked URL patterns of a profile.
+
+        Args:
+            name: Profile name
+
+        Returns:
+            list: URL patterns
+
+        Raises:
+            ValueError: If the profile does not exist
+        """
+        if name not in cls.PROFILES:
+            raise ValueError(f"Unknown network profile '{name}' (known: {', '.join(cls.PROFILES)})")
+        return cls.PROFILES[name]
+
+    @classmethod
+    def for_item(cls, item, default=None):
+        """
+        Get the profile selected for a test item.
+
+        Args:
+            item: pytest item
+            default: Profile for tests without a marker (default: DEFAULT)
+
+        Returns:
+            str: Profile name
+        """
+        marker = item.get_closest_marker("network")
+        if marker and marker.args:
+            return marker.args[0]
+        return default or cls.DEFAULT
+
+    @classmethod
+    def apply(cls, driver, name):
+        """
+        Apply a profile to a driver. Drivers without DevTools support
+        (HtmlDriver, remote sessions) are left unchanged.
+        The profile in effect is remembered on the driver, so leasing a
+        pooled driver with the same profile costs no CDP round-trip.
+
+        Args:
+            driver: WebDriver instance
+            name: Profile name
+
+        Returns:
+            bool: True if the profile is in effect
+        """
+        patterns = cls.patterns(name)
+        if getattr(driver, "network_profile", cls.DEFAULT) == name:
+            return True
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except WebDriverException:
+            return False
+        driver.network_profile = name
+        return True
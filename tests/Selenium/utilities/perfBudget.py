@@ -0,0 +1,220 @@
+"""
+Performance budget utility for the Selenium suite.
+Reads per-route percentile thresholds from Configurations/budgets.ini and
+checks the browser metrics recorded during a run against them, separately
+for every network profile the route was loaded with.
+"""
+
+import configparser
+import math
+import os
+
+import pytest
+
+from utilities.perfMetrics import PerfMetrics
+
+
+class PerfBudget:
+    """
+    Declarative per-route, per-metric percentile budgets.
+    """
+
+    DEFAULT_PATH = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), '..', 'Configurations', 'budgets.ini'
+    )
+
+    # Percentile keys accepted in the budget file
+    PERCENTILES = {"p50": 50, "p75": 75, "p90": 90, "p95": 95, "p99": 99, "max": 100}
+
+    MODES = ("fail", "warn")
+
+    def __init__(self, budgets, mode="warn", min_samples=1):
+        """
+        Initialize the budget set.
+
+        Args:
+            budgets: List of (route, metric, percentile key, threshold ms)
+            mode: "fail" or "warn"
+            min_samples: Samples required before a route is checked
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown budget mode '{mode}', expected one of {self.MODES}")
+        self.budgets = budgets
+        self.mode = mode
+        self.min_samples = min_samples
+
+    @classmethod
+    def load(cls, path=None):
+        """
+        Load budgets from an INI file.
+
+        Args:
+            path: Budget file (default: Configurations/budgets.ini)
+
+        Returns:
+            PerfBudget: Parsed budgets (empty if the default file does not exist)
+
+        Raises:
+            ValueError: If an explicitly given file does not exist, or for
+                        unknown metrics or percentiles, bad thresholds or settings
+        """
+        if path and not os.path.isfile(path):
+            raise ValueError(f"Performance budget file not found: {path}")
+        parser = configparser.RawConfigParser()
+        parser.read(path or cls.DEFAULT_PATH)
+
+        budgets = []
+        for section in parser.sections():
+            if section == "settings":
+                continue
+            for key, value in parser.items(section):
+                metric, _, percentile = key.rpartition(".")
+                if percentile not in cls.PERCENTILES or metric not in PerfMetrics.METRICS:
+                    raise ValueError(
+                        f"Invalid budget key '{key}' in [{section}] (expected <metric>.<percentile>, "
+                        f"metrics: {', '.join(PerfMetrics.METRICS)}; percentiles: {', '.join(cls.PERCENTILES)})"
+                    )
+                try:
+                    threshold = float(value)
+                except ValueError as error:
+                    raise ValueError(f"Invalid threshold for {key} in [{section}]: {value!r}") from error
+                budgets.append((section, metric, percentile, threshold))
+
+        try:
+            min_samples = parser.getint("settings", "min_samples", fallback=1)
+        except ValueError as error:
+            raise ValueError(f"Invalid min_samples in [settings]: "
+                             f"{parser.get('settings', 'min_samples')!r}") from error
+        return cls(budgets, mode=parser.get("settings", "mode", fallback="warn"), min_samples=min_samples)
+
+    @staticmethod
+    def percentile(values, percent):
+        """
+        Nearest-rank percentile.
+
+        Args:
+            values: Non-empty list of numbers
+            percent: Percentile between 0 and 100
+
+        Returns:
+            float: The percentile value
+        """
+        ordered = sorted(values)
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def evaluate(self, records):
+        """
+        Check metric records against the budgets. Samples are grouped by
+        route and network profile, so lean loads do not hide slow full loads.
+
+        Args:
+            records: Records produced by PerfMetrics
+
+        Returns:
+            list: Violations as dicts (route, network_profile, metric,
+                  percentile, threshold, actual, samples)
+        """
+        samples = {}
+        for record in records:
+            group = (record.get("route"), record.get("network_profile") or "full")
+            for metric, value in record.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    samples.setdefault(group, {}).setdefault(metric, []).append(value)
+
+        violations = []
+        for (route, profile), metrics in samples.items():
+            for budget_route, metric, percentile, threshold in self.budgets:
+                values = metrics.get(metric, [])
+                if budget_route != route or not values or len(values) < self.min_samples:
+                    continue
+                actual = self.percentile(values, self.PERCENTILES[percentile])
+                if actual > threshold:
+                    violations.append({
+                        "route": route,
+                        "network_profile": profile,
+                        "metric": metric,
+                        "percentile": percentile,
+                        "threshold": threshold,
+                        "actual": actual,
+                        "samples": len(values),
+                    })
+        return violations
+
+    def unchecked(self, records):
+        """
+        Find the budgets no route and network profile had enough samples for.
+
+        Args:
+            records: Records produced by PerfMetrics
+
+        Returns:
+            list: (route, metric, percentile) of budgets that were not enforced
+        """
+        counts = {}
+        for record in records:
+            group = (record.get("route"), record.get("network_profile") or "full")
+            for metric in PerfMetrics.METRICS:
+                if isinstance(record.get(metric), (int, float)):
+                    counts[group + (metric,)] = counts.get(group + (metric,), 0) + 1
+        checked = {(route, metric) for (route, _, metric), count in counts.items() if count >= self.min_samples}
+        return [(route, metric, percentile) for route, metric, percentile, _ in self.budgets
+                if (route, metric) not in checked]
+
+
+class PerfBudgetPlugin:
+    """
+    pytest plugin enforcing PerfBudget at the end of the run.
+    Runs in the controller process and reads the 'browser_metrics' user
+    property of every test report, so it also works with xdist workers.
+    """
+
+    def __init__(self, budget):
+        """
+        Initialize the plugin.
+
+        Args:
+            budget: PerfBudget to enforce
+        """
+        self.budget = budget
+        self.records = []
+        self.violations = []
+        self.unchecked = []
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "call":
+            return
+        for name, value in report.user_properties:
+            if name == "browser_metrics":
+                self.records.extend(value)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.violations = self.budget.evaluate(self.records)
+        self.unchecked = self.budget.unchecked(self.records)
+        if self.violations and self.budget.mode == "fail" and exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.records:
+            return
+        status = "FAILED" if self.violations and self.budget.mode == "fail" else "checked"
+        terminalreporter.section(f"performance budgets {status}")
+        checked = len(self.budget.budgets) - len(self.unchecked)
+        if not self.violations:
+            terminalreporter.write_line(
+                f"All {'checked ' if self.unchecked else ''}budgets met "
+                f"({len(self.records)} page loads, {checked} of {len(self.budget.budgets)} budgets checked)"
+            )
+        if self.unchecked:
+            terminalreporter.write_line(
+                "Not enforced (too few samples): "
+                + ", ".join(f"{route} {metric}.{percentile}" for route, metric, percentile in self.unchecked),
+                yellow=True
+            )
+        for violation in self.violations:
+            terminalreporter.write_line(
+                "{route} [{network_profile}] {metric}.{percentile}: {actual:.0f}ms > {threshold:.0f}ms "
+                "({samples} samples)".format(**violation),
+                red=self.budget.mode == "fail", yellow=self.budget.mode == "warn"
+            )
@@ -0,0 +1,229 @@
+"""
+Browser performance metrics utility for test reporting.
+Collects Navigation Timing, Resource Timing and paint metrics per page load
+and writes them to a structured JSON-lines file keyed by route.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import urlsplit
+
+from utilities.readProperties import ReadConfig
+from utilities.workerContext import WorkerContext
+
+
+class PerfMetrics:
+    """
+    Recorder for browser timing metrics.
+    Records are attached to the running test and appended to
+    Logs/metrics_<run>[_<worker>].jsonl.
+    """
+
+    # Metric names written for every page load (milliseconds)
+    METRICS = ("ttfb", "dom_content_loaded", "load", "fcp", "lcp")
+
+    # Script reading the timing buffers of the current document
+    COLLECT_SCRIPT = """
+        var nav = performance.getEntriesByType('navigation')[0];
+        if (!nav) { return null; }
+        var paint = {};
+        performance.getEntriesByType('paint').forEach(function (entry) {
+            paint[entry.name] = entry.startTime;
+        });
+        var lcp = null;
+        try {
+            var observer = new PerformanceObserver(function () {});
+            observer.observe({type: 'largest-contentful-paint', buffered: true});
+            var entries = observer.takeRecords();
+            observer.disconnect();
+            if (entries.length) { lcp = entries[entries.length - 1].startTime; }
+        } catch (e) {}
+        var resources = performance.getEntriesByType('resource');
+        var slowest = resources.slice().sort(function (a, b) {
+            return b.duration - a.duration;
+        }).slice(0, 5).map(function (entry) {
+            return {name: entry.name, type: entry.initiatorType, duration: entry.duration};
+        });
+        return {
+            ttfb: nav.responseStart,
+            dom_content_loaded: nav.domContentLoadedEventEnd || null,
+            load: nav.loadEventEnd || null,
+            fcp: paint['first-contentful-paint'] === undefined ? null : paint['first-contentful-paint'],
+            lcp: lcp,
+            transfer_size: nav.transferSize,
+            resources: {
+                count: resources.length,
+                transfer_size: resources.reduce(function (sum, e) { return sum + (e.transferSize || 0); }, 0),
+                slowest: slowest
+            }
+        };
+    """
+
+    # Numeric path segments are replaced by this placeholder in route keys
+    ID_PLACEHOLDER = "{id}"
+
+    current_test = None
+    network_profile = None
+    _records = []
+    _steps = []
+    _lock = threading.Lock()
+
+    @staticmethod
+    def metrics_file():
+        """
+        Get the metrics file of the current run and worker.
+
+        Returns:
+            str: Path to the JSON-lines metrics file
+        """
+        logs_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Logs')
+        os.makedirs(logs_dir, exist_ok=True)
+        suffix = f"_{WorkerContext.worker_id()}" if WorkerContext.is_worker() else ""
+        return os.path.join(logs_dir, f"metrics_{WorkerContext.run_id()}{suffix}.jsonl")
+
+    @classmethod
+    def route_for(cls, url, base_url=None):
+        """
+        Normalize a URL into a route key relative to the application base URL.
+
+        Args:
+            url: Absolute page URL
+            base_url: Application base URL (default: config baseUrl)
+
+        Returns:
+            str: Route such as "/home" or "/events/{id}"
+        """
+        path = urlsplit(url).path
+        base_path = urlsplit(base_url or ReadConfig.get_base_url()).path.rstrip("/")
+        if base_path and path.startswith(base_path):
+            path = path[len(base_path):]
+        path = re.sub(r"/\d+(?=/|$)", "/" + cls.ID_PLACEHOLDER, path)
+        return path or "/"
+
+    @classmethod
+    def start_test(cls, test_id):
+        """
+        Attach subsequent records to a test.
+
+        Args:
+            test_id: pytest node id
+        """
+        with cls._lock:
+            cls.current_test = test_id
+            cls.network_profile = None
+            cls._records = []
+            cls._steps = []
+
+    @classmethod
+    def records(cls):
+        """
+        Get the records captured for the current test.
+
+        Returns:
+            list: Metric records
+        """
+        with cls._lock:
+            return list(cls._records)
+
+    @classmethod
+    def steps(cls):
+        """
+        Get the step timings recorded for the current test.
+
+        Returns:
+            list: (step name, duration ms) tuples
+        """
+        with cls._lock:
+            return list(cls._steps)
+
+    @classmethod
+    def finish_test(cls):
+        """
+        Detach from the current test.
+
+        Returns:
+            list: Metric records captured for the test
+        """
+        with cls._lock:
+            records, cls._records, cls.current_test = cls._records, [], None
+            cls._steps = []
+            return records
+
+    @classmethod
+    def record_step(cls, name, duration):
+        """
+        Store the duration of one test step (e.g. a navigation).
+
+        Args:
+            name: Step name such as "navigate /home"
+            duration: Duration in seconds
+        """
+        with cls._lock:
+            cls._steps.append((name, round(duration * 1000, 1)))
+
+    @classmethod
+    def record(cls, url, metrics):
+        """
+        Store the metrics of one page load.
+
+        Args:
+            url: Page URL
+            metrics: Dict returned by COLLECT_SCRIPT
+
+        Returns:
+            dict: The stored record
+        """
+        record = {
+            "run": WorkerContext.run_id(),
+            "worker": WorkerContext.worker_id(),
+            "test": cls.current_test,
+            "route": cls.route_for(url),
+            "url": url,
+            "network_profile": cls.network_profile or "full",
+            "timestamp": time.time(),
+        }
+        record.update(metrics)
+        with cls._lock:
+            cls._records.append(record)
+            with open(cls.metrics_file(), "a", encoding="utf-8") as handle:
+                handle.write(json.dumps(record) + "\n")
+        return record
+
+    @classmethod
+    def capture(cls, driver):
+        """
+        Read the timing buffers of the current page and record them.
+
+        Args:
+            driver: Selenium WebDriver instance (JavaScript capable)
+
+        Returns:
+            dict: The stored record, or None if no navigation entry exists
+        """
+        metrics = driver.execute_script(cls.COLLECT_SCRIPT)
+        if not metrics:
+            return None
+        return cls.record(driver.current_url, metrics)
+
+    @classmethod
+    def summary(cls, records):
+        """
+        Format records as a short text table for the test report.
+
+        Args:
+            records: Metric records
+
+        Returns:
+            str: One line per page load
+        """
+        lines = []
+        for record in records:
+            values = ", ".join(
+                f"{name}={record[name]:.0f}ms" if record.get(name) is not None else f"{name}=n/a"
+                for name in cls.METRICS
+            )
+            lines.append(f"{record['route']}: {values}")
+        return "\n".join(lines)
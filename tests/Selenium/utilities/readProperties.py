@@ -3,18 +3,206 @@ Utility module for reading configuration properties.
 Based on the structure from my_web_test_project.
 
 This module reads test configuration from config.ini file.
+Values are loaded once into a typed Settings object, in this order
+(later sources win):
+
+    1. [section] values of config.ini
+    2. [profile:<name>] section of the selected profile (AAB_TEST_PROFILE / --config-profile)
+    3. [worker:<id>] section of the current xdist worker (gw0, gw1, ...)
+    4. Environment variables AAB_TEST_<SETTING>, e.g. AAB_TEST_BASE_URL
+    5. Command line overrides (--app-url, --app-urls, --config-set setting=value)
+
+Profile and worker sections are keyed by setting name (base_url,
+admin_password, log_retention_days, ...), not by the key of the section
+the setting is read from, so "admin_password = x" only changes the admin
+password.
+
+When baseUrls lists several application instances, each xdist worker uses
+the instance at its worker index (gw0 -> first URL, gw1 -> second, ...).
+
+[fault:<name>] sections (fault injection rules of the HTTP proxy) are read
+as they are, see utilities/faultInjection.py.
 """
 
 import configparser
 import os
 
+from utilities.workerContext import WorkerContext
+
 # Get the directory of this file
 current_dir = os.path.dirname(os.path.abspath(__file__))
 config_path = os.path.join(current_dir, '..', 'Configurations', 'config.ini')
 
-# Create a RawConfigParser object
-config = configparser.RawConfigParser()
-config.read(config_path)
+
+def parse_bool(value):
+    """
+    Parse an INI/environment boolean (1/0, true/false, yes/no, on/off).
+    """
+    if isinstance(value, bool):
+        return value
+    lowered = str(value).strip().lower()
+    if lowered not in configparser.RawConfigParser.BOOLEAN_STATES:
+        raise ValueError(f"not a boolean: {value!r}")
+    return configparser.RawConfigParser.BOOLEAN_STATES[lowered]
+
+
+def parse_list(value):
+    """
+    Parse a comma or whitespace separated list.
+    """
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [part for part in str(value).replace(",", " ").split() if part]
+
+
+class Settings:
+    """
+    Typed, read-only view of the test configuration.
+    Every setting is an attribute, e.g. settings.base_url or settings.log_max_bytes.
+    """
+
+    # setting name -> (section, key in config.ini, type, default; None = required)
+    FIELDS = {
+        "base_url": ("common info", "baseUrl", str, None),
+        "base_urls": ("common info", "baseUrls", list, []),
+        "admin_email": ("admin", "email", str, None),
+        "admin_password": ("admin", "password", str, None),
+        "manager_email": ("manager", "email", str, None),
+        "manager_password": ("manager", "password", str, None),
+        "user_email": ("user", "email", str, None),
+        "user_password": ("user", "password", str, None),
+        "test_user_name": ("test_user", "name", str, None),
+        "test_user_email": ("test_user", "email", str, None),
+        "test_user_password": ("test_user", "password", str, None),
+        "test_data_token": ("test_data", "token", str, ""),
+        "log_max_bytes": ("logging", "max_bytes", int, 10485760),
+        "log_backup_count": ("logging", "backup_count", int, 5),
+        "log_compress_after_days": ("logging", "compress_after_days", float, 1.0),
+        "log_retention_days": ("logging", "retention_days", float, 30.0),
+        "log_max_total_mb": ("logging", "max_total_mb", float, 200.0),
+        "proxy_faults": ("proxy", "faults", list, []),
+    }
+
+    # Prefix of the fault injection rule sections ([fault:slow-backend], ...)
+    FAULT_PREFIX = "fault:"
+
+    # Converters per declared type
+    CONVERTERS = {str: str, int: int, float: float, bool: parse_bool, list: parse_list}
+
+    # Prefix of environment variable overrides (AAB_TEST_BASE_URL, ...)
+    ENV_PREFIX = "AAB_TEST_"
+
+    def __init__(self, values, sources, profile=None, fault_rules=None):
+        """
+        Initialize settings from already converted values.
+
+        Args:
+            values: Setting name -> typed value
+            sources: Setting name -> where the value came from (for diagnostics)
+            profile: Name of the applied profile, if any
+            fault_rules: Rule name -> raw options of its [fault:NAME] section
+        """
+        self.__dict__.update(values, sources=sources, profile=profile, fault_rules=fault_rules or {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Settings are read-only; use ReadConfig.configure() to override them")
+
+    def as_dict(self):
+        """
+        Get all settings.
+
+        Returns:
+            dict: Setting name -> value
+        """
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    @classmethod
+    def convert(cls, name, raw, source):
+        """
+        Convert a raw string to the declared type of a setting.
+
+        Raises:
+            ValueError: If the value does not match the type
+        """
+        section, key, kind, _ = cls.FIELDS[name]
+        try:
+            return cls.CONVERTERS[kind](raw)
+        except ValueError as error:
+            raise ValueError(
+                f"Invalid {kind.__name__} for [{section}] {key} from {source}: {raw!r}"
+            ) from error
+
+    @classmethod
+    def load(cls, path=None, profile=None, worker_id=None, environ=None, overrides=None):
+        """
+        Load settings from config.ini and apply profile, worker, environment
+        and explicit overrides.
+
+        Args:
+            path: INI file (default: Configurations/config.ini)
+            profile: Profile section to apply (default: AAB_TEST_PROFILE)
+            worker_id: Worker section to apply (default: the current worker)
+            environ: Environment mapping (default: os.environ)
+            overrides: Setting name -> value, applied last
+
+        Returns:
+            Settings: Loaded settings
+
+        Raises:
+            ValueError: For unknown settings (overrides, profile and worker
+                        sections), missing required values or bad types
+        """
+        environ = os.environ if environ is None else environ
+        profile = profile or environ.get(cls.ENV_PREFIX + "PROFILE") or None
+        worker_id = worker_id or WorkerContext.worker_id()
+
+        parser = configparser.RawConfigParser()
+        parser.optionxform = str
+        parser.read(path or config_path)
+        if profile and not parser.has_section(f"profile:{profile}"):
+            raise ValueError(f"Unknown config profile '{profile}' (no [profile:{profile}] section)")
+
+        # Profile and worker sections are keyed by setting name
+        layers = [layer for layer in ([f"profile:{profile}"] if profile else []) + [f"worker:{worker_id}"]
+                  if parser.has_section(layer)]
+        for layer in layers:
+            unknown = sorted(set(parser.options(layer)) - set(cls.FIELDS))
+            if unknown:
+                raise ValueError(f"Unknown setting {', '.join(unknown)} in [{layer}] "
+                                 f"(known: {', '.join(cls.FIELDS)})")
+
+        values, sources = {}, {}
+        for name, (section, key, kind, default) in cls.FIELDS.items():
+            raw, source = None, None
+            if parser.has_option(section, key):
+                raw, source = parser.get(section, key), f"[{section}]"
+            for layer in layers:
+                if parser.has_option(layer, name):
+                    raw, source = parser.get(layer, name), f"[{layer}]"
+            if cls.ENV_PREFIX + name.upper() in environ:
+                raw, source = environ[cls.ENV_PREFIX + name.upper()], cls.ENV_PREFIX + name.upper()
+            if raw is None:
+                if default is None:
+                    raise ValueError(f"Missing setting [{section}] {key}")
+                values[name], sources[name] = default, "default"
+            else:
+                values[name], sources[name] = cls.convert(name, raw, source), source
+
+        for name, raw in (overrides or {}).items():
+            if name not in cls.FIELDS:
+                raise ValueError(f"Unknown setting '{name}' (known: {', '.join(cls.FIELDS)})")
+            values[name], sources[name] = cls.convert(name, raw, "override"), "override"
+
+        # Sharded runs: each worker uses one of the application instances
+        # (an explicit or [worker:gwN] base_url still takes precedence)
+        urls = values["base_urls"]
+        if len(urls) > 1 and sources["base_url"] != "override" and not sources["base_url"].startswith("[worker:"):
+            index = (int(worker_id[2:]) if worker_id.startswith("gw") else 0) % len(urls)
+            values["base_url"], sources["base_url"] = urls[index].rstrip("/"), f"baseUrls[{index}]"
+
+        fault_rules = {section[len(cls.FAULT_PREFIX):]: dict(parser.items(section))
+                       for section in parser.sections() if section.startswith(cls.FAULT_PREFIX)}
+        return cls(values, sources, profile, fault_rules)
 
 
 class ReadConfig:
@@ -23,6 +211,39 @@ class ReadConfig:
     Provides static methods to access various configuration values.
     """
 
+    _settings = None
+    _options = {}
+
+    @classmethod
+    def settings(cls):
+        """
+        Get the cached settings, loading them on first use.
+        
+        Returns:
+            Settings: Typed configuration
+        """
+        if cls._settings is None:
+            cls._settings = Settings.load(**cls._options)
+        return cls._settings
+
+    @classmethod
+    def configure(cls, profile=None, overrides=None, path=None):
+        """
+        Select a profile and/or override settings for the rest of the process.
+        The settings are reloaded on next access.
+
+        Args:
+            profile: Profile section to apply
+            overrides: Setting name -> value (e.g. {"base_url": "http://127.0.0.1:8001"})
+            path: INI file (default: Configurations/config.ini)
+        
+        Returns:
+            Settings: The reloaded settings
+        """
+        cls._options = {"profile": profile, "overrides": overrides, "path": path}
+        cls._settings = None
+        return cls.settings()
+
     @staticmethod
     def get_base_url():
         """
@@ -31,7 +252,17 @@ class ReadConfig:
         Returns:
             str: The base URL configured in config.ini
         """
-        return config.get('common info', 'baseUrl')
+        return ReadConfig.settings().base_url
+
+    @staticmethod
+    def get_base_urls():
+        """
+        Get the application instances a sharded run is spread across.
+        
+        Returns:
+            list: Base URLs (empty unless baseUrls / --app-urls is set)
+        """
+        return ReadConfig.settings().base_urls
 
     @staticmethod
     def get_admin_email():
@@ -41,7 +272,7 @@ class ReadConfig:
         Returns:
             str: Admin email address
         """
-        return config.get('admin', 'email')
+        return ReadConfig.settings().admin_email
 
     @staticmethod
     def get_admin_password():
@@ -51,7 +282,7 @@ class ReadConfig:
         Returns:
             str: Admin password
         """
-        return config.get('admin', 'password')
+        return ReadConfig.settings().admin_password
 
     @staticmethod
     def get_manager_email():
@@ -61,7 +292,7 @@ class ReadConfig:
         Returns:
             str: Manager email address
         """
-        return config.get('manager', 'email')
+        return ReadConfig.settings().manager_email
 
     @staticmethod
     def get_manager_password():
@@ -71,7 +302,7 @@ class ReadConfig:
         Returns:
             str: Manager password
         """
-        return config.get('manager', 'password')
+        return ReadConfig.settings().manager_password
 
     @staticmethod
     def get_user_email():
@@ -81,7 +312,7 @@ class ReadConfig:
         Returns:
             str: User email address
         """
-        return config.get('user', 'email')
+        return ReadConfig.settings().user_email
 
     @staticmethod
     def get_user_password():
@@ -91,7 +322,7 @@ class ReadConfig:
         Returns:
             str: User password
         """
-        return config.get('user', 'password')
+        return ReadConfig.settings().user_password
 
     @staticmethod
     def get_test_user_name():
@@ -101,7 +332,7 @@ class ReadConfig:
         Returns:
             str: Test user name
         """
-        return config.get('test_user', 'name')
+        return ReadConfig.settings().test_user_name
 
     @staticmethod
     def get_test_user_email():
@@ -111,7 +342,7 @@ class ReadConfig:
         Returns:
             str: Test user email
         """
-        return config.get('test_user', 'email')
+        return ReadConfig.settings().test_user_email
 
     @staticmethod
     def get_test_user_password():
@@ -121,4 +352,84 @@ class ReadConfig:
         Returns:
             str: Test user password
         """
-        return config.get('test_user', 'password')
+        return ReadConfig.settings().test_user_password
+
+    @staticmethod
+    def get_test_data_token():
+        """
+        Get the token sent to the test data seeding API.
+        
+        Returns:
+            str: Token (empty when the API runs without one)
+        """
+        return ReadConfig.settings().test_data_token
+
+    @staticmethod
+    def get_log_max_bytes():
+        """
+        Get the size at which a log file is rotated.
+        
+        Returns:
+            int: Size in bytes (0 disables rotation)
+        """
+        return ReadConfig.settings().log_max_bytes
+
+    @staticmethod
+    def get_log_backup_count():
+        """
+        Get the number of rotated (gzipped) files kept per log.
+        
+        Returns:
+            int: Backup count
+        """
+        return ReadConfig.settings().log_backup_count
+
+    @staticmethod
+    def get_log_compress_after_days():
+        """
+        Get the age after which logs of finished runs are gzipped.
+        
+        Returns:
+            float: Age in days
+        """
+        return ReadConfig.settings().log_compress_after_days
+
+    @staticmethod
+    def get_log_retention_days():
+        """
+        Get the age after which logs are deleted.
+        
+        Returns:
+            float: Age in days (0 keeps logs forever)
+        """
+        return ReadConfig.settings().log_retention_days
+
+    @staticmethod
+    def get_log_max_total_mb():
+        """
+        Get the size limit of the Logs directory.
+        
+        Returns:
+            float: Size in MB (0 disables the limit)
+        """
+        return ReadConfig.settings().log_max_total_mb
+
+    @staticmethod
+    def get_proxy_faults():
+        """
+        Get the fault injection rules applied to every request behind the HTTP proxy.
+        
+        Returns:
+            list: Rule names ([fault:NAME] sections), empty for none
+        """
+        return ReadConfig.settings().proxy_faults
+
+    @staticmethod
+    def get_fault_rules():
+        """
+        Get the fault injection rules defined in config.ini.
+        
+        Returns:
+            dict: Rule name -> raw options of its [fault:NAME] section
+        """
+        return ReadConfig.settings().fault_rules
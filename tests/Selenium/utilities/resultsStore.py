@@ -0,0 +1,501 @@
+"""
+Historical results store for the Selenium suite.
+Keeps per-test durations, per-step timings and per-route browser metrics of
+every run in a local SQLite database tagged with the git SHA, and compares a
+run against a rolling baseline of previous runs to flag slowdowns.
+
+Usage (from tests/Selenium):
+    python -m utilities.resultsStore runs
+    python -m utilities.resultsStore compare [--run RUN_ID] [--baseline 20]
+"""
+
+import argparse
+import math
+import os
+import re
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+
+from utilities.workerContext import WorkerContext
+
+
+class ResultsStore:
+    """
+    SQLite store of run results and the regression comparison on top of it.
+    """
+
+    DEFAULT_PATH = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), '..', 'Logs', 'results.sqlite3'
+    )
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id TEXT PRIMARY KEY,
+            started REAL,
+            git_sha TEXT,
+            git_branch TEXT,
+            git_dirty INTEGER,
+            base_url TEXT,
+            workers INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS test_results (
+            run_id TEXT,
+            test TEXT,
+            outcome TEXT,
+            duration_ms REAL,
+            worker TEXT
+        );
+        CREATE TABLE IF NOT EXISTS step_timings (
+            run_id TEXT,
+            test TEXT,
+            step TEXT,
+            duration_ms REAL
+        );
+        CREATE TABLE IF NOT EXISTS route_metrics (
+            run_id TEXT,
+            test TEXT,
+            route TEXT,
+            metric TEXT,
+            value REAL,
+            network_profile TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_test_results_run ON test_results (run_id);
+        CREATE INDEX IF NOT EXISTS idx_step_timings_run ON step_timings (run_id);
+        CREATE INDEX IF NOT EXISTS idx_route_metrics_run ON route_metrics (run_id);
+    """
+
+    # Browser metrics stored per page load, and server time per proxied request (milliseconds / bytes)
+    ROUTE_METRICS = ("ttfb", "dom_content_loaded", "load", "fcp", "lcp", "transfer_size", "server_ms")
+
+    # Columns added to existing databases: table -> [(column, type)]
+    MIGRATIONS = {"route_metrics": [("network_profile", "TEXT")]}
+
+    # Queries returning (series, key, value) samples for one run; browser
+    # metrics are keyed by network profile ("/home [lean] lcp"), so loads
+    # with blocked resources are not compared against full loads
+    SERIES_QUERIES = (
+        "SELECT 'test', test, duration_ms FROM test_results"
+        " WHERE run_id = ? AND outcome = 'passed'",
+        "SELECT 'step', step, duration_ms FROM step_timings WHERE run_id = ?",
+        "SELECT 'route', route || COALESCE(' [' || network_profile || ']', '') || ' ' || metric, value"
+        " FROM route_metrics"
+        " WHERE run_id = ? AND metric != 'transfer_size'",
+    )
+
+    # Comparison defaults: previous runs in the baseline, significance level,
+    # minimum median slowdown worth reporting and minimum samples per side
+    # for the rank test (series with fewer samples in the run, e.g. one
+    # duration per test, are scored against the baseline distribution)
+    BASELINE_RUNS = 20
+    ALPHA = 0.05
+    MIN_RATIO = 1.10
+    MIN_SAMPLES = 3
+
+    # Robust z-score (median / MAD) above which a small series is slower than
+    # its baseline, and the smallest MAD as a share of the baseline median
+    # (keeps a perfectly stable baseline from flagging every jitter)
+    MAX_Z_SCORE = 3.5
+    MAD_FLOOR = 0.02
+
+    # Suffix xdist adds to node ids of tests in an xdist_group (test_x@shard2)
+    GROUP_SUFFIX = re.compile(r"@[^\[\]/:]+$")
+
+    def __init__(self, path=None):
+        """
+        Open (and create if needed) the results database.
+
+        Args:
+            path: Database file (default: Logs/results.sqlite3)
+        """
+        self.path = path or self.DEFAULT_PATH
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.executescript(self.SCHEMA)
+        self.migrate()
+
+    def migrate(self):
+        """
+        Add the columns of MIGRATIONS missing from a database created by an
+        older version (existing rows get NULL).
+        """
+        with self.connection:
+            for table, columns in self.MIGRATIONS.items():
+                existing = {row[1] for row in self.connection.execute(f"PRAGMA table_info({table})")}
+                for column, kind in columns:
+                    if column not in existing:
+                        self.connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {kind}")
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        self.connection.close()
+
+    @classmethod
+    def test_id(cls, nodeid):
+        """
+        Get the stored id of a test: its node id without the xdist group suffix.
+        """
+        return cls.GROUP_SUFFIX.sub("", nodeid)
+
+    @staticmethod
+    def git_info():
+        """
+        Read the commit the suite is running against.
+
+        Returns:
+            dict: git_sha, git_branch and git_dirty (None when git is unavailable)
+        """
+        def git(*args):
+            try:
+                return subprocess.run(
+                    ("git",) + args, capture_output=True, text=True, timeout=10,
+                    cwd=os.path.dirname(os.path.abspath(__file__))
+                ).stdout.strip() or None
+            except (OSError, subprocess.SubprocessError):
+                return None
+
+        status = git("status", "--porcelain", "--untracked-files=no")
+        return {
+            "git_sha": git("rev-parse", "HEAD"),
+            "git_branch": git("rev-parse", "--abbrev-ref", "HEAD"),
+            "git_dirty": int(status is not None),
+        }
+
+    def save_run(self, run_id, tests, base_url=None, workers=1, started=None):
+        """
+        Store the results of a run in a single transaction.
+        Saving the same run id again replaces it.
+
+        Args:
+            run_id: Run id (WorkerContext.run_id())
+            tests: List of dicts with test, outcome, duration_ms, worker,
+                   steps [(name, ms)] and metrics [PerfMetrics records]
+            base_url: Base URL of the application under test
+            workers: Number of xdist workers
+            started: Run start time (epoch seconds, default: now)
+        """
+        info = self.git_info()
+        with self.connection:
+            for table in ("runs", "test_results", "step_timings", "route_metrics"):
+                self.connection.execute(f"DELETE FROM {table} WHERE run_id = ?", (run_id,))
+            self.connection.execute(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (run_id, started or time.time(), info["git_sha"], info["git_branch"],
+                 info["git_dirty"], base_url, workers)
+            )
+            for test in tests:
+                self.connection.execute(
+                    "INSERT INTO test_results VALUES (?, ?, ?, ?, ?)",
+                    (run_id, test["test"], test["outcome"], test["duration_ms"], test.get("worker"))
+                )
+                self.connection.executemany(
+                    "INSERT INTO step_timings VALUES (?, ?, ?, ?)",
+                    [(run_id, test["test"], name, ms) for name, ms in test.get("steps", [])]
+                )
+                self.connection.executemany(
+                    "INSERT INTO route_metrics (run_id, test, route, metric, value, network_profile)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    [(run_id, test["test"], record["route"], metric, record[metric], record.get("network_profile"))
+                     for record in test.get("metrics", [])
+                     for metric in self.ROUTE_METRICS
+                     if isinstance(record.get(metric), (int, float))]
+                )
+
+    def runs(self, limit=None):
+        """
+        List stored runs, newest first.
+
+        Args:
+            limit: Maximum number of runs (default: all)
+
+        Returns:
+            list: (run_id, started, git_sha, git_branch, git_dirty, test count) tuples
+        """
+        query = (
+            "SELECT r.run_id, r.started, r.git_sha, r.git_branch, r.git_dirty,"
+            " (SELECT COUNT(*) FROM test_results t WHERE t.run_id = r.run_id)"
+            " FROM runs r ORDER BY r.started DESC"
+        )
+        if limit:
+            query += f" LIMIT {int(limit)}"
+        return self.connection.execute(query).fetchall()
+
+    def samples(self, run_ids):
+        """
+        Load the samples of one or more runs grouped by series.
+
+        Args:
+            run_ids: Run ids to load
+
+        Returns:
+            dict: (series, key) -> list of values
+        """
+        grouped = {}
+        for run_id in run_ids:
+            for query in self.SERIES_QUERIES:
+                for series, key, value in self.connection.execute(query, (run_id,)):
+                    if value is not None:
+                        grouped.setdefault((series, key), []).append(value)
+        return grouped
+
+    def test_durations(self, last_runs=None):
+        """
+        Median duration of every test over the most recent runs
+        (skipped results are ignored).
+
+        Args:
+            last_runs: Number of recent runs to use (default: BASELINE_RUNS)
+
+        Returns:
+            dict: Test node id -> median duration in milliseconds
+        """
+        rows = self.connection.execute(
+            "SELECT test, duration_ms FROM test_results WHERE outcome != 'skipped'"
+            " AND run_id IN (SELECT run_id FROM runs ORDER BY started DESC LIMIT ?)",
+            (last_runs or self.BASELINE_RUNS,)
+        )
+        grouped = {}
+        for test, duration in rows:
+            grouped.setdefault(test, []).append(duration)
+        return {test: statistics.median(values) for test, values in grouped.items()}
+
+    @staticmethod
+    def mann_whitney(current, baseline):
+        """
+        One-sided Mann-Whitney U test that current values are larger than
+        baseline values (normal approximation with tie and continuity correction).
+
+        Args:
+            current: Samples of the run under test
+            baseline: Samples of the baseline runs
+
+        Returns:
+            float: p-value
+        """
+        n1, n2 = len(current), len(baseline)
+        ranked = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+        ranks = [0.0] * len(ranked)
+        ties = 0.0
+        i = 0
+        while i < len(ranked):
+            j = i
+            while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+                j += 1
+            for k in range(i, j + 1):
+                ranks[k] = (i + j) / 2 + 1
+            size = j - i + 1
+            ties += size ** 3 - size
+            i = j + 1
+
+        rank_sum = sum(rank for rank, (_, group) in zip(ranks, ranked) if group == 0)
+        u = rank_sum - n1 * (n1 + 1) / 2
+        mean = n1 * n2 / 2
+        n = n1 + n2
+        variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+        if variance <= 0:
+            return 1.0
+        z = (u - mean - 0.5) / math.sqrt(variance)
+        return 0.5 * math.erfc(z / math.sqrt(2))
+
+    @classmethod
+    def robust_z(cls, value, baseline):
+        """
+        Robust z-score of a value against a baseline distribution: distance
+        from the baseline median in scaled median absolute deviations.
+
+        Args:
+            value: Value of the run under test
+            baseline: Samples of the baseline runs
+
+        Returns:
+            float: z-score (positive when slower)
+        """
+        median = statistics.median(baseline)
+        mad = statistics.median(abs(sample - median) for sample in baseline)
+        scale = max(1.4826 * mad, cls.MAD_FLOOR * abs(median))
+        return (value - median) / scale if scale > 0 else 0.0
+
+    def compare(self, run_id=None, baseline_runs=None, alpha=None, min_ratio=None):
+        """
+        Compare a run against the pooled samples of the previous runs and
+        flag series that are significantly and materially slower.
+        Series with MIN_SAMPLES values on both sides use the Mann-Whitney
+        test; smaller series of the run (a test's single duration) are
+        flagged when their median's robust z-score exceeds MAX_Z_SCORE.
+
+        Args:
+            run_id: Run to check (default: the latest run)
+            baseline_runs: Number of previous runs in the baseline (default: BASELINE_RUNS)
+            alpha: Significance level (default: ALPHA)
+            min_ratio: Minimum current/baseline median ratio (default: MIN_RATIO)
+
+        Returns:
+            list: Regressions as dicts (series, key, baseline, current, ratio,
+                  p_value, z_score (None for the rank test), samples), slowest ratio first
+        """
+        baseline_runs = baseline_runs or self.BASELINE_RUNS
+        alpha = self.ALPHA if alpha is None else alpha
+        min_ratio = min_ratio or self.MIN_RATIO
+
+        ordered = [row[0] for row in self.runs()]
+        if run_id is None:
+            if not ordered:
+                return []
+            run_id = ordered[0]
+        if run_id not in ordered:
+            raise ValueError(f"Unknown run '{run_id}'")
+        previous = ordered[ordered.index(run_id) + 1:][:baseline_runs]
+
+        current = self.samples([run_id])
+        baseline = self.samples(previous)
+        regressions = []
+        for series_key, values in current.items():
+            reference = baseline.get(series_key, [])
+            if len(reference) < self.MIN_SAMPLES:
+                continue
+            reference_median = statistics.median(reference)
+            current_median = statistics.median(values)
+            if reference_median <= 0:
+                continue
+            ratio = current_median / reference_median
+            if ratio < min_ratio:
+                continue
+            if len(values) >= self.MIN_SAMPLES:
+                z_score = None
+                p_value = self.mann_whitney(values, reference)
+                slower = p_value < alpha
+            else:
+                z_score = self.robust_z(current_median, reference)
+                p_value = 0.5 * math.erfc(z_score / math.sqrt(2))
+                slower = z_score > self.MAX_Z_SCORE
+            if slower:
+                regressions.append({
+                    "series": series_key[0],
+                    "key": series_key[1],
+                    "baseline": reference_median,
+                    "current": current_median,
+                    "ratio": ratio,
+                    "p_value": p_value,
+                    "z_score": z_score,
+                    "samples": (len(values), len(reference)),
+                })
+        return sorted(regressions, key=lambda regression: regression["ratio"], reverse=True)
+
+
+class ResultsRecorder:
+    """
+    pytest plugin saving every run into the ResultsStore.
+    Runs in the controller process: durations, step timings and browser
+    metrics arrive through the test reports, also from xdist workers.
+    """
+
+    def __init__(self, path=None, base_url=None):
+        """
+        Initialize the recorder.
+
+        Args:
+            path: Database file (default: ResultsStore.DEFAULT_PATH)
+            base_url: Base URL of the application under test
+        """
+        self.path = path
+        self.base_url = base_url
+        self.started = time.time()
+        self.tests = {}
+
+    def pytest_runtest_logreport(self, report):
+        test_id = ResultsStore.test_id(report.nodeid)
+        test = self.tests.setdefault(test_id, {
+            "test": test_id,
+            "outcome": "passed",
+            "duration_ms": 0.0,
+            "worker": getattr(report, "worker_id", WorkerContext.worker_id()),
+            "steps": [],
+            "metrics": [],
+        })
+        test["duration_ms"] += round(report.duration * 1000, 1)
+        if report.failed:
+            test["outcome"] = "failed"
+        elif report.skipped and test["outcome"] == "passed":
+            test["outcome"] = "skipped"
+        if report.when != "call":
+            test["steps"].append((report.when, round(report.duration * 1000, 1)))
+            return
+        for name, value in report.user_properties:
+            if name == "step_timings":
+                test["steps"].extend(value)
+            elif name == "browser_metrics":
+                test["metrics"].extend(value)
+            elif name == "server_timings":
+                test["metrics"].extend({"route": f"{record['method']} {record['route']}",
+                                        "server_ms": record["upstream_ms"]} for record in value)
+
+    def pytest_sessionfinish(self, session):
+        if not self.tests:
+            return
+        store = ResultsStore(self.path)
+        try:
+            store.save_run(
+                WorkerContext.run_id(), list(self.tests.values()), base_url=self.base_url,
+                workers=getattr(session.config.option, "numprocesses", None) or 1,
+                started=self.started
+            )
+        finally:
+            store.close()
+
+
+def main(argv=None):
+    """
+    Command line entry point: list runs or compare a run with its baseline.
+
+    Returns:
+        int: 1 if regressions were found, else 0
+    """
+    parser = argparse.ArgumentParser(prog="python -m utilities.resultsStore")
+    parser.add_argument("--db", default=None, help="Results database (default: Logs/results.sqlite3)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    runs_parser = commands.add_parser("runs", help="List stored runs")
+    runs_parser.add_argument("--limit", type=int, default=20)
+
+    compare_parser = commands.add_parser("compare", help="Flag slowdowns against a rolling baseline")
+    compare_parser.add_argument("--run", default=None, help="Run id (default: latest)")
+    compare_parser.add_argument("--baseline", type=int, default=ResultsStore.BASELINE_RUNS,
+                                help="Previous runs in the baseline")
+    compare_parser.add_argument("--alpha", type=float, default=ResultsStore.ALPHA,
+                                help="Significance level")
+    compare_parser.add_argument("--min-ratio", type=float, default=ResultsStore.MIN_RATIO,
+                                help="Minimum median slowdown (1.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    store = ResultsStore(args.db)
+    try:
+        if args.command == "runs":
+            for run_id, started, sha, branch, dirty, count in store.runs(args.limit):
+                when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(started))
+                commit = (sha or "unknown")[:10] + ("+dirty" if dirty else "")
+                print(f"{run_id}  {when}  {branch or '-'}@{commit}  {count} tests")
+            return 0
+
+        regressions = store.compare(args.run, args.baseline, args.alpha, args.min_ratio)
+    finally:
+        store.close()
+
+    if not regressions:
+        print("No significant slowdowns")
+        return 0
+    for regression in regressions:
+        score = (f"z={regression['z_score']:.1f}" if regression["z_score"] is not None
+                 else f"p={regression['p_value']:.4f}")
+        print(
+            "SLOWER {series:<5} {key}: {baseline:.0f}ms -> {current:.0f}ms "
+            "(x{ratio:.2f}, {score}, n={samples[0]}/{samples[1]})".format(score=score, **regression)
+        )
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""
+Authenticated session cache utility for test setup.
+Logs in once per role and run (over HTTP by default), then restores the
+captured Laravel session cookies into any driver instead of driving the
+/login form again.
+"""
+
+import threading
+from urllib.parse import urlsplit
+
+from utilities.httpLogin import HttpLogin
+from utilities.readProperties import ReadConfig
+
+
+class SessionCache:
+    """
+    Per-run cache of authenticated session cookies keyed by role.
+    Roles map to the credentials in config.ini (admin, manager, user).
+    """
+
+    # Role name -> (email getter, password getter)
+    ROLES = {
+        "admin": (ReadConfig.get_admin_email, ReadConfig.get_admin_password),
+        "manager": (ReadConfig.get_manager_email, ReadConfig.get_manager_password),
+        "user": (ReadConfig.get_user_email, ReadConfig.get_user_password),
+    }
+
+    # Role name -> page the application redirects to after login
+    # (TC-AUTH-001/002: admins and managers land on the admin event list)
+    LANDING_PATHS = {
+        "admin": "/admin/events",
+        "manager": "/admin/events",
+        "user": "/home",
+    }
+
+    # Lightweight static file used to put the driver on the application origin
+    # before add_cookie (cookies can only be set for the current domain)
+    COOKIE_ORIGIN_PATH = "/favicon.ico"
+
+    # Mint sessions with a browserless POST /login instead of the UI form
+    USE_HTTP_LOGIN = True
+
+    # Cookie keys accepted by WebDriver add_cookie
+    COOKIE_KEYS = ("name", "value", "path", "secure", "httpOnly", "expiry", "sameSite")
+
+    _cookies = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def credentials(cls, role):
+        """
+        Get the configured credentials for a role.
+
+        Args:
+            role: Role name (admin, manager or user)
+
+        Returns:
+            tuple: (email, password)
+        """
+        if role not in cls.ROLES:
+            raise ValueError(f"Unknown role '{role}', expected one of {sorted(cls.ROLES)}")
+        email_getter, password_getter = cls.ROLES[role]
+        return email_getter(), password_getter()
+
+    @staticmethod
+    def is_session_cookie(name):
+        """
+        Check whether a cookie carries Laravel authentication state.
+
+        Args:
+            name: Cookie name
+
+        Returns:
+            bool: True for the session, XSRF and remember-me cookies
+        """
+        return name == "XSRF-TOKEN" or name.endswith("_session") or name.startswith("remember_web_")
+
+    @classmethod
+    def capture(cls, driver):
+        """
+        Capture the authentication cookies currently held by a driver.
+
+        Args:
+            driver: Selenium WebDriver instance on the application origin
+
+        Returns:
+            list: Cookie dictionaries ready for add_cookie
+        """
+        return [
+            {key: cookie[key] for key in cls.COOKIE_KEYS if key in cookie}
+            for cookie in driver.get_cookies()
+            if cls.is_session_cookie(cookie["name"])
+        ]
+
+    @classmethod
+    def login(cls, driver, role):
+        """
+        Log in as a role and return the authentication cookies.
+        Uses HttpLogin unless USE_HTTP_LOGIN is disabled. Either way the
+        login must redirect to the role's landing page (LANDING_PATHS).
+
+        Args:
+            driver: Selenium WebDriver instance (used for form login only)
+            role: Role name (admin, manager or user)
+
+        Returns:
+            list: Cookie dictionaries ready for add_cookie
+        """
+        if cls.USE_HTTP_LOGIN:
+            email, password = cls.credentials(role)
+            cookies = HttpLogin.mint_cookies(email, password, landing=cls.LANDING_PATHS[role])
+            return [cookie for cookie in cookies if cls.is_session_cookie(cookie["name"])]
+        return cls.login_via_form(driver, role)
+
+    @classmethod
+    def login_via_form(cls, driver, role):
+        """
+        Log in through the /login form and capture the resulting cookies.
+
+        Args:
+            driver: Selenium WebDriver instance
+            role: Role name (admin, manager or user)
+
+        Returns:
+            list: Captured cookie dictionaries
+        """
+        # Imported here to keep utilities importable without the page objects
+        from pages.LoginPage import LoginPage
+
+        email, password = cls.credentials(role)
+        login_page = LoginPage(driver)
+        login_page.open(ReadConfig.get_base_url() + "/login")
+        login_page.login(email, password)
+        landing = urlsplit(driver.current_url).path.rstrip("/")
+        if not landing.endswith(cls.LANDING_PATHS[role]):
+            raise RuntimeError(f"Login as '{role}' landed on {driver.current_url}, "
+                               f"expected {cls.LANDING_PATHS[role]}")
+
+        cookies = cls.capture(driver)
+        if not any(cookie["name"].endswith("_session") for cookie in cookies):
+            raise RuntimeError(f"Login as '{role}' did not produce a session cookie")
+        return cookies
+
+    @classmethod
+    def get_cookies(cls, driver, role):
+        """
+        Get the cached cookies for a role, logging in on first use.
+
+        Args:
+            driver: Selenium WebDriver instance used for the first login
+            role: Role name (admin, manager or user)
+
+        Returns:
+            list: Cookie dictionaries ready for add_cookie
+        """
+        with cls._lock:
+            if role not in cls._cookies:
+                cls._cookies[role] = cls.login(driver, role)
+            return cls._cookies[role]
+
+    @classmethod
+    def restore(cls, driver, role):
+        """
+        Authenticate a driver as the given role by injecting cached cookies.
+        Only the first call per role goes through the login form.
+
+        Args:
+            driver: Selenium WebDriver instance
+            role: Role name (admin, manager or user)
+        """
+        cookies = cls.get_cookies(driver, role)
+
+        base_url = ReadConfig.get_base_url()
+        origin = "{0.scheme}://{0.netloc}".format(urlsplit(base_url))
+        if not driver.current_url.startswith(origin):
+            driver.get(base_url + cls.COOKIE_ORIGIN_PATH)
+
+        for cookie in cookies:
+            driver.add_cookie(dict(cookie))
+
+    @classmethod
+    def invalidate(cls, role=None):
+        """
+        Drop cached cookies so the next restore logs in again.
+
+        Args:
+            role: Role to drop, or None to clear every role
+        """
+        with cls._lock:
+            if role is None:
+                cls._cookies.clear()
+            else:
+                cls._cookies.pop(role, None)
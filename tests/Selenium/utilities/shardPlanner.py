@@ -0,0 +1,102 @@
+"""
+Shard planner for runs spread across several application instances.
+Splits the collected tests into one shard per xdist worker so that every
+shard takes about the same time, using the median durations stored in the
+results database (longest processing time first).
+"""
+
+import heapq
+import os
+import statistics
+
+from utilities.resultsStore import ResultsStore
+
+
+class ShardPlanner:
+    """
+    Duration-balanced partition of tests into shards.
+    """
+
+    # Estimate for tests without history when no test has any (milliseconds)
+    DEFAULT_DURATION_MS = 10000.0
+
+    def __init__(self, durations=None):
+        """
+        Initialize the planner.
+
+        Args:
+            durations: Test node id -> duration in milliseconds
+        """
+        self.durations = durations or {}
+        self.default_ms = (statistics.median(self.durations.values())
+                           if self.durations else self.DEFAULT_DURATION_MS)
+        by_module = {}
+        for test, duration in self.durations.items():
+            by_module.setdefault(test.split("::")[0], []).append(duration)
+        self.module_ms = {module: statistics.median(values) for module, values in by_module.items()}
+
+    @classmethod
+    def from_history(cls, path=None, last_runs=None):
+        """
+        Create a planner from the results database.
+
+        Args:
+            path: Database file (default: ResultsStore.DEFAULT_PATH)
+            last_runs: Number of recent runs to use
+
+        Returns:
+            ShardPlanner: Planner (without history if the database does not exist)
+        """
+        path = path or ResultsStore.DEFAULT_PATH
+        if not os.path.exists(path):
+            return cls()
+        store = ResultsStore(path)
+        try:
+            return cls(store.test_durations(last_runs))
+        finally:
+            store.close()
+
+    def estimate(self, nodeid):
+        """
+        Get the expected duration of a test. Tests without history are
+        estimated from the other tests of their module, then from all tests.
+
+        Returns:
+            float: Milliseconds
+        """
+        test_id = ResultsStore.test_id(nodeid)
+        if test_id in self.durations:
+            return self.durations[test_id]
+        return self.module_ms.get(test_id.split("::")[0], self.default_ms)
+
+    def partition(self, nodeids, shards):
+        """
+        Assign tests to shards, longest first, each to the least loaded shard.
+        The result only depends on the inputs, so every worker computes the same plan.
+
+        Args:
+            nodeids: Test node ids
+            shards: Number of shards
+
+        Returns:
+            dict: Node id -> shard index
+        """
+        loads = [(0.0, index) for index in range(shards)]
+        plan = {}
+        for nodeid in sorted(nodeids, key=lambda nodeid: (-self.estimate(nodeid), nodeid)):
+            load, index = heapq.heappop(loads)
+            plan[nodeid] = index
+            heapq.heappush(loads, (load + self.estimate(nodeid), index))
+        return plan
+
+    def loads(self, plan, shards):
+        """
+        Get the expected duration of each shard.
+
+        Returns:
+            list: Milliseconds per shard
+        """
+        totals = [0.0] * shards
+        for nodeid, index in plan.items():
+            totals[index] += self.estimate(nodeid)
+        return totals
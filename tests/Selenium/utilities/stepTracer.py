@@ -0,0 +1,143 @@
+"""
+Step tracing utility for test reporting.
+Context-manager spans around page object actions; every finished span is
+logged through CustomLogger, which writes it both as a JSON line
+(Logs/events_<run>[_<worker>].jsonl) and as a line of the text log.
+"""
+
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+import pytest
+
+from utilities.perfMetrics import PerfMetrics
+
+
+class Span:
+    """
+    One timed step. The traced code may set outcome and attributes.
+    """
+
+    def __init__(self, name, parent_id=None, **attributes):
+        """
+        Initialize a span.
+
+        Args:
+            name: Step name such as "login"
+            parent_id: Id of the enclosing span
+            attributes: Extra fields written with the span
+        """
+        self.name = name
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.outcome = "ok"
+        self.error = None
+        self.start = time.time()
+        self.end = None
+        self._started = time.perf_counter()
+        self.duration = None
+
+    def finish(self):
+        """
+        Stop the clock.
+        """
+        self.duration = time.perf_counter() - self._started
+        self.end = self.start + self.duration
+
+    def to_dict(self):
+        """
+        Serialize the span for the JSON-lines log.
+
+        Returns:
+            dict: Span fields
+        """
+        return {
+            "type": "span",
+            "step": self.name,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": self.start,
+            "end": self.end,
+            "duration_ms": round(self.duration * 1000, 1),
+            "outcome": self.outcome,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class StepTracer:
+    """
+    Factory of spans, tracking nesting per thread.
+    """
+
+    _local = threading.local()
+
+    @classmethod
+    def current(cls):
+        """
+        Get the innermost open span of the calling thread.
+
+        Returns:
+            Span: The open span, or None
+        """
+        stack = getattr(cls._local, "stack", None)
+        return stack[-1] if stack else None
+
+    @staticmethod
+    def outcome_of(error):
+        """
+        Get the span outcome for an exception raised by the traced code.
+
+        Args:
+            error: Exception
+
+        Returns:
+            str: "skipped" for pytest.skip(), "xfailed" for pytest.xfail(),
+                 "failed" otherwise
+        """
+        if isinstance(error, pytest.skip.Exception):
+            return "skipped"
+        if isinstance(error, pytest.xfail.Exception):
+            return "xfailed"
+        return "failed"
+
+    @classmethod
+    @contextmanager
+    def span(cls, name, logger=None, **attributes):
+        """
+        Time a step and log it when it ends.
+        An exception marks the span as failed (skipped or xfailed for
+        pytest.skip() and pytest.xfail()) and is re-raised.
+
+        Args:
+            name: Step name
+            logger: Logger receiving the span (default: CustomLogger test logger)
+            attributes: Extra fields written with the span
+
+        Yields:
+            Span: The running span
+        """
+        # Imported here: CustomLogger imports this module to stamp records with the running span
+        from utilities.customLogger import CustomLogger
+
+        parent = cls.current()
+        span = Span(name, parent.span_id if parent else None, **attributes)
+        stack = cls._local.__dict__.setdefault("stack", [])
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.outcome = cls.outcome_of(error)
+            span.error = f"{type(error).__name__}: {error}"
+            raise
+        finally:
+            span.finish()
+            stack.pop()
+            PerfMetrics.record_step(name, span.duration)
+            (logger or CustomLogger.get_logger()).info(
+                "step %s %s in %.1f ms", name, span.outcome, span.duration * 1000,
+                extra={"span": span.to_dict()}
+            )
@@ -0,0 +1,121 @@
+"""
+Wait policy utility for page objects.
+Runs explicit waits only (implicit wait forced to 0) so presence checks and
+absence checks never stack on top of the driver's implicit timeout.
+"""
+
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+class WaitPolicy:
+    """
+    Explicit-only wait policy.
+    Provides a default timeout for positive waits, a short probe timeout for
+    state queries and a fast negative mode for absence checks.
+    """
+
+    def __init__(self, timeout=10, probe_timeout=0.5, poll_frequency=0.1):
+        """
+        Initialize the wait policy.
+
+        Args:
+            timeout: Default timeout in seconds for positive waits
+            probe_timeout: Timeout in seconds for state queries on a loaded page
+            poll_frequency: Seconds between condition polls
+        """
+        self.timeout = timeout
+        self.probe_timeout = probe_timeout
+        self.poll_frequency = poll_frequency
+
+    @staticmethod
+    def apply(driver):
+        """
+        Disable the implicit wait on a driver (once per driver).
+
+        Args:
+            driver: Selenium WebDriver instance
+        """
+        if not getattr(driver, "_explicit_waits_only", False):
+            driver.implicitly_wait(0)
+            driver._explicit_waits_only = True
+
+    def until(self, driver, condition, timeout=None):
+        """
+        Wait until a condition returns a truthy value.
+
+        Args:
+            driver: Selenium WebDriver instance
+            condition: Callable taking the driver (e.g. an expected_conditions object)
+            timeout: Wait timeout in seconds (default: policy timeout)
+
+        Returns:
+            The condition's return value
+
+        Raises:
+            TimeoutException: If the condition does not hold in time
+        """
+        return WebDriverWait(
+            driver,
+            self.timeout if timeout is None else timeout,
+            poll_frequency=self.poll_frequency
+        ).until(condition)
+
+    def holds(self, driver, condition, timeout=None):
+        """
+        Check whether a condition holds within the timeout.
+
+        Args:
+            driver: Selenium WebDriver instance
+            condition: Callable taking the driver
+            timeout: Wait timeout in seconds (default: policy timeout)
+
+        Returns:
+            bool: True if the condition held in time
+        """
+        try:
+            self.until(driver, condition, timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    def is_absent(self, driver, locator, within=0):
+        """
+        Check that no element matches a locator.
+        Returns as soon as the locator matches nothing; only waits while a
+        matching element is still attached.
+
+        Args:
+            driver: Selenium WebDriver instance
+            locator: Tuple of (By, value)
+            within: Seconds to wait for matching elements to disappear
+
+        Returns:
+            bool: True if no element matches
+        """
+        deadline = time.monotonic() + within
+        while driver.find_elements(*locator):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(self.poll_frequency)
+        return True
+
+    def probe_visible(self, driver, locator):
+        """
+        State query on a loaded page: is an element matching the locator visible?
+        Returns False at once when nothing matches (fast negative mode); only
+        an existing element gets up to probe_timeout to become visible.
+
+        Args:
+            driver: Selenium WebDriver instance
+            locator: Tuple of (By, value)
+
+        Returns:
+            bool: True if a matching element is visible
+        """
+        if self.is_absent(driver, locator):
+            return False
+        return self.holds(driver, EC.visibility_of_element_located(locator), self.probe_timeout)
@@ -0,0 +1,76 @@
+"""
+Worker context utility for parallel test execution.
+Identifies the current pytest-xdist worker and the run it belongs to, so
+per-worker resources (log files, test data, driver pools) stay isolated.
+"""
+
+import os
+import secrets
+from datetime import datetime
+
+
+class WorkerContext:
+    """
+    Accessors for the current run id and xdist worker id.
+    """
+
+    # Environment variable shared by the controller and all its workers
+    RUN_ID_ENV = "AAB_TEST_RUN_ID"
+
+    # Worker id used when tests run without xdist
+    MASTER = "master"
+
+    @staticmethod
+    def worker_id():
+        """
+        Get the xdist worker id of the current process.
+
+        Returns:
+            str: Worker id such as "gw0", or "master" for serial runs
+        """
+        return os.environ.get("PYTEST_XDIST_WORKER", WorkerContext.MASTER)
+
+    @staticmethod
+    def worker_index():
+        """
+        Get the numeric index of the current worker.
+
+        Returns:
+            int: 0 for "gw0" or serial runs, 1 for "gw1", ...
+        """
+        worker = WorkerContext.worker_id()
+        return int(worker[2:]) if worker.startswith("gw") else 0
+
+    @staticmethod
+    def worker_count():
+        """
+        Get the number of workers taking part in the run.
+
+        Returns:
+            int: Worker count (1 for serial runs)
+        """
+        return int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 1))
+
+    @staticmethod
+    def is_worker():
+        """
+        Check whether this process is an xdist worker.
+
+        Returns:
+            bool: True inside an xdist worker
+        """
+        return WorkerContext.worker_id() != WorkerContext.MASTER
+
+    @staticmethod
+    def run_id():
+        """
+        Get the id of the current run, shared by the controller and its workers.
+        The first call in the controller fixes it for the whole run. A random
+        suffix keeps runs started in the same second (parallel CI jobs) apart.
+
+        Returns:
+            str: Run id (timestamp and suffix, e.g. 20251230_010131-3fa2)
+        """
+        return os.environ.setdefault(
+            WorkerContext.RUN_ID_ENV, f"{datetime.now():%Y%m%d_%H%M%S}-{secrets.token_hex(2)}"
+        )